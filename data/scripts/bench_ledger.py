@@ -0,0 +1,136 @@
+"""
+Benchmark: full standings recompute vs the incremental score ledger
+
+Builds a season (leagues x teams x weeks, a starting lineup per team and
+week drawn from a shared player pool, round-robin matchups) and applies a
+stream of stat corrections. Each correction is handled two ways: by
+re-scoring every started player in every league and rebuilding the
+standings, and by ScoreLedger.record. Both must agree on every team.
+
+Usage: python bench_ledger.py [--leagues 50] [--teams 12] [--weeks 12]
+                              [--corrections 200]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'functions', 'workers'))
+
+from ledger import ScoreLedger, TeamRecord  # noqa: E402
+from scoring import SCORING_PRESETS, compile_scoring_plan  # noqa: E402
+
+STARTERS = 9
+PLAYERS = 1500
+
+
+def random_line(rng: random.Random) -> Dict[str, int]:
+    return {
+        'passing_yards': rng.choice((0, 0, 0, rng.randint(100, 420))),
+        'passing_tds': rng.randint(0, 3),
+        'rushing_yards': rng.randint(0, 160),
+        'rushing_tds': rng.randint(0, 2),
+        'receiving_receptions': rng.randint(0, 9),
+        'receiving_yards': rng.randint(0, 140),
+        'receiving_tds': rng.randint(0, 2),
+    }
+
+
+def round_robin(teams: List[str], week: int) -> List[Tuple[str, str]]:
+    rotated = teams[:1] + teams[1:][week % (len(teams) - 1):] + teams[1:][:week % (len(teams) - 1)]
+    half = len(rotated) // 2
+    return list(zip(rotated[:half], reversed(rotated[half:])))
+
+
+def full_recompute(stats: Dict[Tuple[str, int], Dict[str, int]], configs: Dict[str, Dict],
+                   lineups: Dict, matchups: Dict) -> Dict[str, Dict[str, TeamRecord]]:
+    """Standings from scratch: every started player, every week, every league"""
+    records: Dict[str, Dict[str, TeamRecord]] = {}
+    for (league_id, week), pairs in matchups.items():
+        plan = compile_scoring_plan(configs[league_id])
+        league = records.setdefault(league_id, {})
+        for team_a, team_b in pairs:
+            totals = [
+                round(sum(plan.score(stats.get((player_id, week), {}))
+                          for player_id in lineups[(league_id, team, week)]), 2)
+                for team in (team_a, team_b)
+            ]
+            for team, scored, allowed in ((team_a, *totals), (team_b, *reversed(totals))):
+                record = league.setdefault(team, TeamRecord())
+                record.points_for = round(record.points_for + scored, 2)
+                record.points_against = round(record.points_against + allowed, 2)
+                record.wins += scored > allowed
+                record.losses += scored < allowed
+                record.ties += scored == allowed
+    return records
+
+
+def bench(leagues: int, teams: int, weeks: int, corrections: int):
+    rng = random.Random(3)
+    presets = [config for config in SCORING_PRESETS.values() if config]
+    players = [f"p{n}" for n in range(PLAYERS)]
+    stats = {(player_id, week): random_line(rng) for player_id in players for week in range(weeks)}
+
+    ledger = ScoreLedger()
+    configs, lineups, matchups = {}, {}, {}
+    started = time.perf_counter()
+    for player_id, week in stats:
+        ledger.record(f"g{week}-{player_id}", week, player_id, stats[(player_id, week)])
+    for n in range(leagues):
+        league_id = f"league{n}"
+        configs[league_id] = presets[n % len(presets)]
+        ledger.register_league(league_id, configs[league_id])
+        team_ids = [f"t{t}" for t in range(teams)]
+        for week in range(weeks):
+            for team_id in team_ids:
+                lineups[(league_id, team_id, week)] = rng.sample(players, STARTERS)
+                ledger.set_lineup(league_id, team_id, week, lineups[(league_id, team_id, week)])
+            matchups[(league_id, week)] = round_robin(team_ids, week)
+            ledger.set_matchups(league_id, week, matchups[(league_id, week)])
+            ledger.finalize_week(league_id, week)
+    build = time.perf_counter() - started
+
+    fixes = []
+    for _ in range(corrections):
+        player_id, week = rng.choice(players), rng.randrange(weeks)
+        line = dict(stats[(player_id, week)])
+        stat = rng.choice(list(line))
+        line[stat] = max(0, line[stat] + rng.choice((-12, -1, 1, 6)))
+        fixes.append((player_id, week, line))
+
+    started = time.perf_counter()
+    for player_id, week, line in fixes[:5]:
+        stats[(player_id, week)] = line
+        expected = full_recompute(stats, configs, lineups, matchups)
+    recompute = (time.perf_counter() - started) / 5
+
+    started = time.perf_counter()
+    for player_id, week, line in fixes:
+        ledger.record(f"g{week}-{player_id}", week, player_id, line)
+    incremental = (time.perf_counter() - started) / corrections
+
+    for player_id, week, line in fixes[5:]:
+        stats[(player_id, week)] = line
+    expected = full_recompute(stats, configs, lineups, matchups)
+    for league_id, records in expected.items():
+        assert dict(ledger.standings(league_id)) == records, league_id
+
+    rows = leagues * teams * weeks * STARTERS
+    print(f"{leagues} leagues x {teams} teams x {weeks} weeks ({rows} lineup slots, "
+          f"{len(ledger.engine.plans)} scoring plans); ledger built in {build:.2f}s")
+    print(f"  full recompute {recompute * 1000:>10.2f} ms/correction")
+    print(f"  ledger         {incremental * 1000:>10.4f} ms/correction "
+          f"({recompute / incremental:.0f}x), standings match")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--leagues', type=int, default=50)
+    parser.add_argument('--teams', type=int, default=12)
+    parser.add_argument('--weeks', type=int, default=12)
+    parser.add_argument('--corrections', type=int, default=200)
+    args = parser.parse_args()
+    bench(args.leagues, args.teams, args.weeks, args.corrections)
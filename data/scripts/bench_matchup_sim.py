@@ -0,0 +1,96 @@
+"""
+Benchmark: Monte Carlo matchup simulation
+
+Builds rosters for the get_team_priors schools (one QB, two RBs and four
+receivers each, receiver shares shrunk with calculate_shrunk_shares), then
+times one matchup at --sims simulations on one core and a league-week of
+--matchups matchups inline and across a process pool. Both week runs use
+the same seed and must return identical results.
+
+Usage: python bench_matchup_sim.py [--sims 100000] [--matchups 6] [--processes N]
+"""
+
+import argparse
+import os
+import random
+import time
+
+import pandas as pd
+
+from matchup_sim import PlayerProfile, simulate_matchup, simulate_week, team_priors, usage_profiles
+from player_usage import calculate_shrunk_shares
+from team_rates import get_team_priors
+
+ALPHA_BETA = {'WR': {'target_share': (2.0, 14.0)}}
+STARTERS = ('QB', 'RB', 'RB', 'WR', 'WR', 'WR', 'FLEX')
+
+
+def build_profiles(rng: random.Random, schools):
+    profiles = {}
+    for school in schools:
+        targets = sorted((rng.randint(20, 110) for _ in range(4)), reverse=True)
+        usage = pd.DataFrame({
+            'player_id': [f"{school}_WR{n}" for n in range(4)],
+            'targets_2024': targets,
+            'team_targets_2024': [sum(targets) + 90] * 4,
+            'rz_targets_2024': [max(1, target // 6) for target in targets],
+            'team_rz_targets_2024': [sum(targets) // 5] * 4,
+        })
+        for profile in usage_profiles(calculate_shrunk_shares(usage, 'WR', ALPHA_BETA), school):
+            profiles[profile.player_id] = profile
+        profiles[f"{school}_QB"] = PlayerProfile(f"{school}_QB", school, pass_share=0.95, carry_share=0.14)
+        for n, carries in enumerate((0.48, 0.24)):
+            profiles[f"{school}_RB{n}"] = PlayerProfile(
+                f"{school}_RB{n}", school, carry_share=carries, target_share=0.06, rz_target_share=0.05
+            )
+    return profiles
+
+
+def draft(rng: random.Random, profiles, matchups: int):
+    """Two lineups per matchup, no player on both sides of one matchup"""
+    positions = {position: [pid for pid in profiles if pid.split('_')[1].startswith(position)]
+                 for position in ('QB', 'RB', 'WR')}
+    week = []
+    for _ in range(matchups):
+        slots = [rng.choice(('RB', 'WR')) if slot == 'FLEX' else slot for slot in STARTERS * 2]
+        picks = {position: rng.sample(players, slots.count(position)) for position, players in positions.items()}
+        lineups = [picks[position].pop() for position in slots]
+        week.append((lineups[:len(STARTERS)], lineups[len(STARTERS):]))
+    return week
+
+
+def bench(sims: int, matchups: int, processes):
+    rng = random.Random(11)
+    priors = team_priors(get_team_priors())
+    profiles = build_profiles(rng, list(priors))
+    week = draft(rng, profiles, matchups)
+
+    simulate_matchup(*week[0], profiles, priors, sims=1000)
+    started = time.perf_counter()
+    result = simulate_matchup(*week[0], profiles, priors, sims=sims, seed=1)
+    single = time.perf_counter() - started
+
+    started = time.perf_counter()
+    inline = simulate_week(week, profiles, priors, sims=sims, seed=7, processes=1)
+    inline_time = time.perf_counter() - started
+    started = time.perf_counter()
+    pooled = simulate_week(week, profiles, priors, sims=sims, seed=7, processes=processes)
+    pooled_time = time.perf_counter() - started
+    assert [(r.win_prob_a, r.mean) for r in inline] == [(r.win_prob_a, r.mean) for r in pooled]
+
+    print(f"{sims} sims, {len(STARTERS)} starters a side")
+    print(f"  one matchup     {single * 1000:>8.0f} ms   "
+          f"P(A) {result.win_prob_a:.3f}  means {result.mean[0]:.1f} / {result.mean[1]:.1f}  "
+          f"median {result.quantiles[0.5][0]:.1f} / {result.quantiles[0.5][1]:.1f}")
+    print(f"  week inline     {inline_time * 1000:>8.0f} ms   ({matchups} matchups)")
+    print(f"  week pool       {pooled_time * 1000:>8.0f} ms   "
+          f"({processes or os.cpu_count()} processes, results identical)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sims', type=int, default=100_000)
+    parser.add_argument('--matchups', type=int, default=6)
+    parser.add_argument('--processes', type=int)
+    args = parser.parse_args()
+    bench(args.sims, args.matchups, args.processes)
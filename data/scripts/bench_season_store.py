@@ -0,0 +1,131 @@
+"""
+Benchmark: JSON stat-line export vs the memory-mapped season store
+
+Generates a Power-4 sized season export (teams x skill players x games),
+builds a season store from it, then measures in fresh interpreters:
+
+- json:  json.load into per-line dicts, then calc_points per line
+- store: SeasonStore.open, then calc_points_batch over its columns
+
+reporting load time, scoring time, Python heap (tracemalloc) and resident
+set growth for each. Both must score the season to the same total.
+
+Usage: python bench_season_store.py [--teams 68] [--players 30] [--games 13]
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', '..', 'functions', 'workers'))
+
+from season_store import build_store, read_json_export  # noqa: E402
+
+ROLES = {
+    'QB': ('passing_yards', 'passing_tds', 'passing_ints', 'rushing_yards', 'rushing_tds'),
+    'RB': ('rushing_yards', 'rushing_tds', 'rushing_fumbles_lost', 'receiving_receptions', 'receiving_yards'),
+    'WR': ('receiving_receptions', 'receiving_yards', 'receiving_tds'),
+    'TE': ('receiving_receptions', 'receiving_yards', 'receiving_tds'),
+    'K': ('fg_made_20_29', 'fg_made_40_49', 'fg_missed_30_39', 'pat_made'),
+}
+
+
+def resident_bytes() -> int:
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def make_export(path: str, teams: int, players: int, games: int):
+    rng = random.Random(5)
+    lines = []
+    for t in range(teams):
+        for p in range(players):
+            role = list(ROLES)[p % len(ROLES)]
+            for g in range(games):
+                lines.append({
+                    'player_id': f"{t:03d}-{p:02d}",
+                    'game_id': f"2025-{g:02d}-{t:03d}",
+                    'stats': {stat: rng.randint(0, 120 if 'yards' in stat else 3) for stat in ROLES[role]},
+                })
+    with open(path, 'w') as f:
+        json.dump(lines, f)
+    return len(lines)
+
+
+def measure(mode: str, path: str):
+    from scoring import calc_points, calc_points_batch
+    from season_store import SeasonStore
+
+    rss = resident_bytes()
+    tracemalloc.start()
+    started = time.perf_counter()
+    if mode == 'json':
+        with open(path) as f:
+            lines = json.load(f)
+    else:
+        store = SeasonStore.open(path)
+    loaded = time.perf_counter() - started
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    if mode == 'json':
+        scores = [calc_points(line['stats']) for line in lines]
+    else:
+        scores = calc_points_batch(store.table())[:, 0].tolist()
+    scored = time.perf_counter() - started
+    print(json.dumps({
+        'load': loaded, 'score': scored, 'heap': heap,
+        'rss': resident_bytes() - rss, 'total': round(sum(scores), 2),
+    }))
+
+
+def bench(teams: int, players: int, games: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        export = os.path.join(tmp, 'season.json')
+        store_dir = os.path.join(tmp, 'season-store')
+        rows = make_export(export, teams, players, games)
+        export_bytes = os.path.getsize(export)
+
+        started = time.perf_counter()
+        build_store(store_dir, read_json_export(export), season=2025)
+        build = time.perf_counter() - started
+        store_bytes = sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, names in os.walk(store_dir) for name in names
+        )
+
+        results = {}
+        for mode, path in (('json', export), ('store', store_dir)):
+            output = subprocess.run(
+                [sys.executable, __file__, '--measure', mode, path],
+                check=True, capture_output=True, text=True
+            ).stdout
+            results[mode] = json.loads(output)
+        assert abs(results['json']['total'] - results['store']['total']) < 0.01
+
+    print(f"{rows} stat lines: export {export_bytes / 1e6:.1f} MB, "
+          f"store {store_bytes / 1e6:.1f} MB on disk, built in {build:.2f}s")
+    print(f"{'':<7}{'load ms':>9}{'score ms':>10}{'heap MB':>9}{'RSS MB':>8}")
+    for mode, result in results.items():
+        print(f"{mode:<7}{result['load'] * 1000:>9.1f}{result['score'] * 1000:>10.1f}"
+              f"{result['heap'] / 1e6:>9.2f}{result['rss'] / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--measure']:
+        measure(sys.argv[2], sys.argv[3])
+        sys.exit()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--teams', type=int, default=68)
+    parser.add_argument('--players', type=int, default=30)
+    parser.add_argument('--games', type=int, default=13)
+    args = parser.parse_args()
+    bench(args.teams, args.players, args.games)
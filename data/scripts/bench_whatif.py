@@ -0,0 +1,109 @@
+"""
+Benchmark: per-line re-scoring vs ConfigExplorer for commissioner previews
+
+Generates a season of player-game stat lines and previews a handful of
+common customizations (PPR, half PPR, 6-point passing TDs, yardage
+bonuses) two ways: ScoringSystem.customize plus one calculate() per stat
+line, as the preview does today, and ConfigExplorer.preview, cold and
+then from its per-plan cache. Player totals must agree exactly.
+
+Usage: python bench_whatif.py [--players 3000] [--games 12] [--teams 130]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'functions', 'workers'))
+
+from config_explorer import ConfigExplorer  # noqa: E402
+from scoring import ScoringSystem  # noqa: E402
+
+PREVIEWS = (
+    {"receiving_receptions": 1.0},
+    {"receiving_receptions": 0.5},
+    {"passing_tds": 6.0},
+    {"rushing_100_yard_bonus": 3.0, "receiving_100_yard_bonus": 3.0},
+    {"passing_tds": 6.0, "receiving_receptions": 1.0, "passing_ints": -1.0},
+)
+
+
+def make_season(players: int, games: int, rng: random.Random) -> List[Dict]:
+    lines = []
+    for p in range(players):
+        role = rng.choice(("qb", "rb", "wr", "te"))
+        for _ in range(games):
+            line = {
+                "passing_yards": rng.randint(120, 420) if role == "qb" else 0,
+                "passing_tds": rng.randint(0, 4) if role == "qb" else 0,
+                "passing_ints": rng.randint(0, 2) if role == "qb" else 0,
+                "rushing_yards": rng.randint(0, 180 if role == "rb" else 40),
+                "rushing_tds": rng.randint(0, 2 if role == "rb" else 1),
+                "receiving_receptions": rng.randint(0, 10) if role != "qb" else 0,
+                "receiving_yards": rng.randint(0, 160) if role != "qb" else 0,
+                "receiving_tds": rng.randint(0, 2) if role != "qb" else 0,
+            }
+            lines.append({"player_id": f"p{p:05d}", "stats": line})
+    return lines
+
+
+def bench(players: int, games: int, teams: int):
+    rng = random.Random(11)
+    lines = make_season(players, games, rng)
+    stat_names = sorted({stat for line in lines for stat in line["stats"]})
+    table = {stat: [line["stats"].get(stat, np.nan) for line in lines] for stat in stat_names}
+    player_ids = [line["player_id"] for line in lines]
+    rosters = {f"p{p:05d}": f"team{p % teams}" for p in range(players)}
+
+    started = time.perf_counter()
+    explorer = ConfigExplorer(table, player_ids, teams=rosters)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    expected = []
+    for changes in PREVIEWS:
+        system = ScoringSystem("standard")
+        system.customize(changes)
+        totals: Dict[str, float] = {}
+        for line in lines:
+            totals[line["player_id"]] = totals.get(line["player_id"], 0.0) + system.calculate(line["stats"])
+        expected.append(totals)
+    per_line = (time.perf_counter() - started) / len(PREVIEWS)
+
+    started = time.perf_counter()
+    for changes in PREVIEWS:
+        explorer.preview(changes)
+    cold = (time.perf_counter() - started) / len(PREVIEWS)
+
+    started = time.perf_counter()
+    for changes in PREVIEWS:
+        explorer.preview(changes)
+    cached = (time.perf_counter() - started) / len(PREVIEWS)
+
+    for changes, totals in zip(PREVIEWS, expected):
+        config = {**explorer.base_config, **changes}
+        got = dict(zip(explorer.players, explorer.player_totals(config)))
+        assert all(abs(got[player_id] - round(total, 2)) < 1e-6 for player_id, total in totals.items()), changes
+
+    print(f"{len(lines)} stat lines ({players} players x {games} games), {teams} teams; "
+          f"explorer built in {build * 1000:.0f} ms")
+    print(f"  per-line rescore {per_line * 1000:>9.2f} ms/preview")
+    print(f"  explorer (cold)  {cold * 1000:>9.2f} ms/preview")
+    print(f"  explorer (cache) {cached * 1000:>9.2f} ms/preview  "
+          f"({explorer.hits} hits, {explorer.misses} misses)")
+    top = explorer.preview(PREVIEWS[0], top=3)
+    print(f"  PPR top 3: {top['players']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--players", type=int, default=3000)
+    parser.add_argument("--games", type=int, default=12)
+    parser.add_argument("--teams", type=int, default=130)
+    args = parser.parse_args()
+    bench(args.players, args.games, args.teams)
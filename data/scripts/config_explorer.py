@@ -0,0 +1,194 @@
+"""
+What-if scoring config explorer over a season of stat lines
+
+Keeps the season's stat lines resident as a (rows x stats) matrix and
+scores a base config once, split into its linear part and one vector per
+bucketed rule family (points allowed, yards allowed, each milestone
+bonus). A candidate config is then scored relative to the base: each
+linear weight it changes adds (weight delta x stat column) to the base
+linear scores, a rank-1 update per changed weight, and only the bucketed
+families whose values changed are re-evaluated. Player and team totals
+are memoized per scoring plan key (equivalent configs share one) in a
+small LRU, so flipping between previews is a dictionary lookup.
+"""
+
+import os
+import sys
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'functions', 'workers'))
+
+from scoring import (  # noqa: E402
+    DEFAULT_SCORING_CONFIG,
+    MILESTONE_BONUSES,
+    POINTS_ALLOWED_KEYS,
+    THRESHOLD_KEYS,
+    YARDS_ALLOWED_KEYS,
+    calc_points_batch,
+    compile_scoring_plan,
+)
+
+try:
+    import numpy as np
+except ImportError:  # checked in ConfigExplorer.__init__
+    np = None
+
+# (stat column, config keys) for every bucketed rule family
+THRESHOLD_FAMILIES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("def_points_allowed", POINTS_ALLOWED_KEYS),
+    ("def_yards_allowed", YARDS_ALLOWED_KEYS),
+) + tuple((stat, keys) for stat, _, keys in MILESTONE_BONUSES)
+
+# Ranked (id, points, rank, rank change vs the base config)
+Ranking = List[Tuple[str, float, int, int]]
+
+
+class ConfigExplorer:
+    """
+    Config-sensitivity engine for one season of player-game stat lines.
+
+    Args:
+        stats_table: Columnar stats, one row per player-game, as accepted by
+            calc_points_batch (NaN for a stat the player does not have).
+        player_ids: Player id of each row.
+        teams: Optional player id -> team id (fantasy or school) for team totals.
+        base_config: Config the others are previewed against (defaults to
+            DEFAULT_SCORING_CONFIG).
+        cache_size: Scoring plans whose totals are kept.
+    """
+
+    def __init__(self, stats_table: Mapping[str, Sequence[float]], player_ids: Sequence[str],
+                 teams: Optional[Mapping[str, str]] = None,
+                 base_config: Optional[Dict[str, float]] = None, cache_size: int = 32):
+        if np is None:
+            raise ImportError("ConfigExplorer requires numpy")
+
+        self.stat_names = list(stats_table.keys())
+        self.columns = {name: np.asarray(stats_table[name], dtype=float) for name in self.stat_names}
+        self.values = np.nan_to_num(
+            np.column_stack([self.columns[name] for name in self.stat_names]), nan=0.0
+        )
+        self.stat_index = {name: index for index, name in enumerate(self.stat_names)}
+
+        self.players, self.player_index = np.unique(np.asarray(player_ids), return_inverse=True)
+        self.teams: Optional[np.ndarray] = None
+        self.team_index: Optional[np.ndarray] = None
+        if teams is not None:
+            # Players without a team (-1) count toward no team's total
+            self.teams = np.unique([team for team in teams.values() if team])
+            lookup = {team: index for index, team in enumerate(self.teams)}
+            self.team_index = np.array([lookup.get(teams.get(player_id), -1) for player_id in self.players])
+
+        self.base_config = dict(DEFAULT_SCORING_CONFIG if base_config is None else base_config)
+        self.base_weights = self._weights(self.base_config)
+        self.base_linear = self.values @ self.base_weights
+        self.base_families = {
+            stat: self._family_points(stat, keys, self.base_config)
+            for stat, keys in THRESHOLD_FAMILIES if stat in self.columns
+        }
+
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.base_totals = self.player_totals(self.base_config)
+        self.base_ranks = self._ranks(self.base_totals)
+        if self.teams is not None:
+            self.base_team_ranks = self._ranks(self._team_totals(self.base_totals))
+
+    def _weights(self, config: Dict[str, float]) -> "np.ndarray":
+        return np.array([
+            0.0 if name in THRESHOLD_KEYS else float(config.get(name, 0)) for name in self.stat_names
+        ])
+
+    def _family_points(self, stat: str, keys: Sequence[str], config: Dict[str, float]) -> "np.ndarray":
+        rule_only = {key: config.get(key, 0) for key in keys}
+        return calc_points_batch({stat: self.columns[stat]}, [rule_only])[:, 0]
+
+    def row_scores(self, config: Dict[str, float]) -> "np.ndarray":
+        """Points per player-game row, matching calc_points for each line"""
+        linear = self.base_linear
+        weights = self._weights(config)
+        changed = np.flatnonzero(weights != self.base_weights)
+        if changed.size:
+            deltas = weights[changed] - self.base_weights[changed]
+            # One rank-1 update (weight delta x stat column) per changed weight
+            linear = linear + self.values[:, changed] @ deltas
+
+        scores = linear.copy()
+        for stat, keys in THRESHOLD_FAMILIES:
+            if stat not in self.columns:
+                continue
+            if all(config.get(key, 0) == self.base_config.get(key, 0) for key in keys):
+                scores += self.base_families[stat]
+            else:
+                scores += self._family_points(stat, keys, config)
+        return np.round(scores, 2)
+
+    def player_totals(self, config: Dict[str, float]) -> "np.ndarray":
+        """Season points per player (in self.players order), memoized per plan"""
+        key = compile_scoring_plan(config).key
+        totals = self._cache.get(key)
+        if totals is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return totals
+        self.misses += 1
+        totals = np.round(
+            np.bincount(self.player_index, weights=self.row_scores(config), minlength=len(self.players)), 2
+        )
+        self._cache[key] = totals
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return totals
+
+    def marginal(self, stat: str) -> "np.ndarray":
+        """Season points per player gained per unit of a linear stat's weight"""
+        return np.bincount(
+            self.player_index, weights=self.values[:, self.stat_index[stat]], minlength=len(self.players)
+        )
+
+    def preview(self, customizations: Dict[str, float], top: Optional[int] = 25) -> Dict:
+        """
+        Rankings under the base config with customizations applied.
+
+        Same input as ScoringSystem.customize. Returns the config key, the
+        top players and (with teams) the teams, each with their rank change
+        against the base config.
+        """
+        for stat, value in customizations.items():
+            if not isinstance(value, (int, float)):
+                raise ValueError(f"Scoring value for {stat} must be numeric, got {type(value)}")
+        config = {**self.base_config, **{stat: float(value) for stat, value in customizations.items()}}
+        totals = self.player_totals(config)
+        result = {
+            'config_key': compile_scoring_plan(config).key,
+            'players': self._ranking(self.players, totals, self.base_ranks, top),
+        }
+        if self.teams is not None:
+            result['teams'] = self._ranking(self.teams, self._team_totals(totals), self.base_team_ranks, top)
+        return result
+
+    def _team_totals(self, player_totals: "np.ndarray") -> "np.ndarray":
+        assigned = self.team_index >= 0
+        return np.round(np.bincount(
+            self.team_index[assigned], weights=player_totals[assigned], minlength=len(self.teams)
+        ), 2)
+
+    @staticmethod
+    def _ranks(totals: "np.ndarray") -> "np.ndarray":
+        """1-based rank of each entry, highest total first"""
+        order = np.argsort(-totals, kind="stable")
+        ranks = np.empty(len(totals), dtype=int)
+        ranks[order] = np.arange(1, len(totals) + 1)
+        return ranks
+
+    def _ranking(self, ids: "np.ndarray", totals: "np.ndarray", base_ranks: "np.ndarray",
+                 top: Optional[int]) -> Ranking:
+        ranks = self._ranks(totals)
+        order = np.argsort(ranks)[:top]
+        return [
+            (str(ids[i]), float(totals[i]), int(ranks[i]), int(base_ranks[i] - ranks[i]))
+            for i in order
+        ]
@@ -0,0 +1,252 @@
+"""
+Season score ledger with incremental team totals and standings
+
+Every (player, game) stat line is scored once per distinct scoring plan
+(ScoringEngine plan keys, shared by leagues with equivalent configs) and
+kept as a ledger row. Lineups, team/week totals, matchups and standings
+are running aggregates over those rows, indexed by player and week, so a
+live delta or a stat correction touches only the rows it changes and the
+teams that started that player that week:
+
+    record(game, week, player, stats)
+      -> per-plan point deltas for that row
+      -> each (league, team) starting the player that week: team/week total
+      -> that team's matchup: both teams' points for/against, and W/L/T
+         once the week is final (a later correction can flip the result)
+
+Nothing is recomputed from scratch except when a league changes scoring
+config (register_league), which legitimately rescores that league.
+"""
+
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'functions', 'workers'))
+
+from scoring import ScoringEngine  # noqa: E402
+
+# (league id, team id, week)
+TeamWeek = Tuple[str, str, int]
+
+
+@dataclass
+class LedgerRow:
+    """One player's stat line for one game, scored under every plan"""
+    week: int
+    stats: Dict[str, int]
+    points: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class TeamRecord:
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    points_for: float = 0.0
+    points_against: float = 0.0
+
+
+class ScoreLedger:
+    """Per-player, per-game points by plan, with running team totals and standings"""
+
+    def __init__(self, engine: Optional[ScoringEngine] = None):
+        self.engine = engine or ScoringEngine()
+        # (player id, game id) -> row
+        self.rows: Dict[Tuple[str, str], LedgerRow] = {}
+        # (player id, week) -> game ids that week (usually one)
+        self.player_games: Dict[Tuple[str, int], List[str]] = {}
+        # Starting lineups and the reverse index used to fan out a row change
+        self.lineups: Dict[TeamWeek, Set[str]] = {}
+        self.starters: Dict[Tuple[str, int], Set[Tuple[str, str]]] = {}
+        self.team_totals: Dict[TeamWeek, float] = {}
+        # (league id, week) -> matchups, and (league id, week, team id) -> opponent
+        self.matchups: Dict[Tuple[str, int], List[Tuple[str, str]]] = {}
+        self.opponents: Dict[Tuple[str, int, str], str] = {}
+        # (league id, week) pairs whose results count toward W/L/T
+        self.final_weeks: Set[Tuple[str, int]] = set()
+        self.records: Dict[str, Dict[str, TeamRecord]] = {}
+
+    # Scoring
+
+    def register_league(self, league_id: str, scoring_cfg: Optional[Dict[str, float]] = None) -> str:
+        """Register or rescore a league; returns its plan key"""
+        touched = [key for key in self.team_totals if key[0] == league_id]
+        for league, team_id, week in touched:
+            self._set_team_total(league, team_id, week, 0.0)
+        previous_plans = set(self.engine.plans)
+        plan_key = self.engine.register(league_id, scoring_cfg)
+        # Totals for a plan that was dropped and is back missed every
+        # correction in between; points() rescores rows without one
+        if plan_key not in previous_plans:
+            self._drop_plan_points(plan_key)
+        self._drop_plan_points(*(previous_plans - set(self.engine.plans)))
+        for league, team_id, week in touched:
+            self._set_team_total(league, team_id, week, self._lineup_points(league, team_id, week))
+        return plan_key
+
+    def unregister_league(self, league_id: str) -> None:
+        """Forget a league's scoring; its plan's row totals go once no league uses it"""
+        plan_key = self.engine.league_plans.get(league_id)
+        self.engine.unregister(league_id)
+        if plan_key is not None and plan_key not in self.engine.plans:
+            self._drop_plan_points(plan_key)
+
+    def record(self, game_id: str, week: int, player_id: str, stats: Dict[str, int]) -> Dict[str, float]:
+        """Set a player's stat line for a game (live update or correction)
+
+        Returns the points delta per plan; every team starting the player
+        that week, and its matchup, is updated by that delta.
+        """
+        row_key = (player_id, game_id)
+        row = self.rows.get(row_key)
+        if row is None:
+            row = self.rows[row_key] = LedgerRow(week, {})
+            self.player_games.setdefault((player_id, week), []).append(game_id)
+        week = row.week
+
+        # Presence counts as a change: a threshold stat (points allowed)
+        # appearing at 0 scores differently from one that is absent
+        stat_deltas = {
+            stat: value - row.stats.get(stat, 0)
+            for stat, value in stats.items() if stat not in row.stats or value != row.stats[stat]
+        }
+        stat_deltas.update({stat: -value for stat, value in row.stats.items() if stat not in stats})
+        if not stat_deltas:
+            return {}
+
+        previous_stats, row.stats = row.stats, dict(stats)
+        deltas = {}
+        for plan_key, (delta, total) in self.engine.score_deltas(
+                previous_stats, row.stats, stat_deltas, row.points).items():
+            row.points[plan_key] = total
+            if delta:
+                deltas[plan_key] = delta
+
+        for league_id, team_id in self.starters.get((player_id, week), ()):
+            # A league without a plan is rescored when it registers again
+            delta = deltas.get(self.engine.league_plans.get(league_id))
+            if delta:
+                key = (league_id, team_id, week)
+                self._set_team_total(league_id, team_id, week, self.team_totals[key] + delta)
+        return deltas
+
+    def apply_stat_deltas(self, game_id: str, week: int, player_id: str,
+                          stat_deltas: Dict[str, int]) -> Dict[str, float]:
+        """Add a live delta (as published by the worker) to a player's line"""
+        row = self.rows.get((player_id, game_id))
+        stats = dict(row.stats) if row else {}
+        for stat, delta in stat_deltas.items():
+            stats[stat] = stats.get(stat, 0) + delta
+        return self.record(game_id, week, player_id, stats)
+
+    def points(self, player_id: str, week: int, plan_key: str) -> float:
+        """A player's points for a week under one plan"""
+        total = 0.0
+        for game_id in self.player_games.get((player_id, week), ()):
+            row = self.rows[(player_id, game_id)]
+            if plan_key not in row.points:
+                # Plan registered after this row was last scored
+                row.points[plan_key] = self.engine.plans[plan_key].score(row.stats)
+            total += row.points[plan_key]
+        return round(total, 2)
+
+    # Lineups and matchups
+
+    def set_lineup(self, league_id: str, team_id: str, week: int, player_ids: Iterable[str]) -> None:
+        """Replace a team's starters for a week, adjusting only the players that changed"""
+        key = (league_id, team_id, week)
+        previous = self.lineups.get(key, set())
+        lineup = set(player_ids)
+        for player_id in previous - lineup:
+            self.starters[(player_id, week)].discard((league_id, team_id))
+        for player_id in lineup - previous:
+            self.starters.setdefault((player_id, week), set()).add((league_id, team_id))
+        self.lineups[key] = lineup
+
+        plan_key = self.engine.league_plans[league_id]
+        change = (
+            sum(self.points(player_id, week, plan_key) for player_id in lineup - previous)
+            - sum(self.points(player_id, week, plan_key) for player_id in previous - lineup)
+        )
+        self.records.setdefault(league_id, {}).setdefault(team_id, TeamRecord())
+        self._set_team_total(league_id, team_id, week, self.team_totals.get(key, 0.0) + change)
+
+    def set_matchups(self, league_id: str, week: int, pairs: Iterable[Tuple[str, str]]) -> None:
+        """Replace a league's matchups for a week"""
+        for team_a, team_b in self.matchups.pop((league_id, week), ()):
+            self._apply_matchup(league_id, week, team_a, team_b, -1)
+            del self.opponents[(league_id, week, team_a)]
+            del self.opponents[(league_id, week, team_b)]
+        records = self.records.setdefault(league_id, {})
+        matchups = self.matchups[(league_id, week)] = []
+        for team_a, team_b in pairs:
+            records.setdefault(team_a, TeamRecord())
+            records.setdefault(team_b, TeamRecord())
+            self.opponents[(league_id, week, team_a)] = team_b
+            self.opponents[(league_id, week, team_b)] = team_a
+            matchups.append((team_a, team_b))
+            self._apply_matchup(league_id, week, team_a, team_b, 1)
+
+    def finalize_week(self, league_id: str, week: int, final: bool = True) -> None:
+        """Start (or stop) counting a week's results toward wins, losses and ties"""
+        if ((league_id, week) in self.final_weeks) == final:
+            return
+        matchups = self.matchups.get((league_id, week), ())
+        for team_a, team_b in matchups:
+            self._apply_matchup(league_id, week, team_a, team_b, -1)
+        if final:
+            self.final_weeks.add((league_id, week))
+        else:
+            self.final_weeks.discard((league_id, week))
+        for team_a, team_b in matchups:
+            self._apply_matchup(league_id, week, team_a, team_b, 1)
+
+    def team_total(self, league_id: str, team_id: str, week: int) -> float:
+        return self.team_totals.get((league_id, team_id, week), 0.0)
+
+    def standings(self, league_id: str) -> List[Tuple[str, TeamRecord]]:
+        """Teams by wins, then ties, then points for"""
+        return sorted(
+            self.records.get(league_id, {}).items(),
+            key=lambda item: (-item[1].wins, -item[1].ties, -item[1].points_for, item[0])
+        )
+
+    def _drop_plan_points(self, *plan_keys: str) -> None:
+        for row in self.rows.values():
+            for plan_key in plan_keys:
+                row.points.pop(plan_key, None)
+
+    def _lineup_points(self, league_id: str, team_id: str, week: int) -> float:
+        plan_key = self.engine.league_plans[league_id]
+        return sum(
+            self.points(player_id, week, plan_key)
+            for player_id in self.lineups.get((league_id, team_id, week), ())
+        )
+
+    def _set_team_total(self, league_id: str, team_id: str, week: int, total: float) -> None:
+        opponent = self.opponents.get((league_id, week, team_id))
+        if opponent is not None:
+            self._apply_matchup(league_id, week, team_id, opponent, -1)
+        self.team_totals[(league_id, team_id, week)] = round(total, 2)
+        if opponent is not None:
+            self._apply_matchup(league_id, week, team_id, opponent, 1)
+
+    def _apply_matchup(self, league_id: str, week: int, team_a: str, team_b: str, sign: int) -> None:
+        """Add (sign 1) or remove (sign -1) one matchup's contribution to both records"""
+        records = self.records[league_id]
+        score_a = self.team_total(league_id, team_a, week)
+        score_b = self.team_total(league_id, team_b, week)
+        for team_id, scored, allowed in ((team_a, score_a, score_b), (team_b, score_b, score_a)):
+            record = records[team_id]
+            record.points_for = round(record.points_for + sign * scored, 2)
+            record.points_against = round(record.points_against + sign * allowed, 2)
+            if (league_id, week) not in self.final_weeks:
+                continue
+            if scored > allowed:
+                record.wins += sign
+            elif scored < allowed:
+                record.losses += sign
+            else:
+                record.ties += sign
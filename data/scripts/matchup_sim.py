@@ -0,0 +1,243 @@
+"""
+Monte Carlo fantasy matchup simulator
+
+Each simulation draws a game for every school involved: plays from the
+team's pace prior, dropbacks from its pass-rate prior (team_rates.
+get_team_priors, pace_adj / pass_rate_adj), red-zone targets from the
+dropbacks. Players then draw their share of that volume from their shrunk
+usage (player_usage.calculate_shrunk_shares target_share / rz_target_share,
+plus carry and pass shares), and efficiency on it:
+
+    receptions  ~ Binomial(dropbacks, target_share * CATCH_RATE)
+    rec yards   ~ Gamma(receptions * k, YARDS_PER_RECEPTION / k)
+    rec TDs     ~ Poisson(rz targets * rz_target_share * RZ_TD_RATE)
+    carries     ~ Binomial(plays - dropbacks, carry_share), and so on
+
+Opportunity counts use the normal approximation to the binomial (see
+_counts) and rare events (touchdowns, interceptions) Poisson thinning.
+
+Teammates share their school's draw, so a slow, run-heavy game drags the
+whole passing game down together. Every stat line is scored with
+calc_points_batch, lineups are summed per simulation and the two sides
+compared. Simulations run in chunks so memory stays flat at 100k sims;
+simulate_week spreads a league-week's matchups over a process pool.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'functions', 'workers'))
+
+from scoring import calc_points_batch  # noqa: E402
+
+# League-wide efficiency per opportunity
+CATCH_RATE = 0.63
+YARDS_PER_RECEPTION = 12.5
+YARDS_PER_CARRY = 5.0
+RZ_TARGET_RATE = 0.11        # red-zone targets per dropback
+RZ_TD_RATE = 0.30            # touchdowns per red-zone target
+RUSH_TD_RATE = 0.035
+PASS_TD_RATE = 0.05
+INT_RATE = 0.025
+
+# Gamma shape per reception / carry; lower is more boom-or-bust
+RECEPTION_SHAPE = 1.5
+CARRY_SHAPE = 0.8
+
+CHUNK_SIMS = 5_000
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+@dataclass
+class PlayerProfile:
+    """A player's school and share of its volume"""
+    player_id: str
+    team: str
+    target_share: float = 0.0
+    rz_target_share: float = 0.0
+    carry_share: float = 0.0
+    pass_share: float = 0.0  # share of the team's dropbacks thrown (starting QB ~0.95)
+
+
+@dataclass
+class MatchupResult:
+    win_prob_a: float
+    win_prob_b: float
+    tie_prob: float
+    # mean, std and QUANTILES of each side's score
+    mean: Tuple[float, float]
+    std: Tuple[float, float]
+    quantiles: Dict[float, Tuple[float, float]]
+    scores: Optional[np.ndarray] = field(default=None, repr=False)  # (sims, 2) if kept
+
+
+def team_priors(priors_df: pd.DataFrame) -> Dict[str, Tuple[float, float]]:
+    """team -> (plays per game, pass rate) from get_team_priors output"""
+    return {
+        row.team: (float(row.pace_adj), float(row.pass_rate_adj))
+        for row in priors_df.itertuples()
+    }
+
+
+def usage_profiles(usage_df: pd.DataFrame, team: str) -> List[PlayerProfile]:
+    """Profiles from calculate_shrunk_shares output (missing share columns count as 0)"""
+    columns = ('target_share', 'rz_target_share', 'carry_share', 'pass_share')
+    return [
+        PlayerProfile(row['player_id'], team, **{
+            name: float(row[name]) for name in columns if name in usage_df.columns
+        })
+        for _, row in usage_df.iterrows()
+    ]
+
+
+def _counts(rng: np.random.Generator, volume: np.ndarray, share: np.ndarray) -> np.ndarray:
+    """Binomial(volume, share) via its normal approximation, rounded and clipped to [0, volume]
+
+    numpy's binomial sampler costs ~150ns a draw, the bulk of a 100k-sim run;
+    for the opportunity counts here (dozens of dropbacks or rushes) the
+    approximation is within a fraction of an opportunity.
+    """
+    mean = volume * share
+    noise = rng.standard_normal(mean.shape)
+    noise *= np.sqrt(mean * (1 - share))
+    return np.clip(np.rint(mean + noise), 0, volume)
+
+
+def _sample_stats(rng: np.random.Generator, sims: int, players: Sequence[PlayerProfile],
+                  priors: Mapping[str, Tuple[float, float]]) -> Dict[str, np.ndarray]:
+    """(sims, players) arrays per stat for one chunk"""
+    schools = sorted({player.team for player in players})
+    pace = np.array([priors[school][0] for school in schools])
+    pass_rate = np.array([priors[school][1] for school in schools])
+    plays = np.maximum(np.rint(pace + np.sqrt(pace) * rng.standard_normal((sims, len(schools)))), 0)
+    dropbacks = _counts(rng, plays, pass_rate)
+    rushes = plays - dropbacks
+    rz_targets = _counts(rng, dropbacks, np.full(len(schools), RZ_TARGET_RATE))
+
+    school = np.array([schools.index(player.team) for player in players])
+    shares = {
+        name: np.array([getattr(player, name) for player in players])
+        for name in ('target_share', 'rz_target_share', 'carry_share', 'pass_share')
+    }
+    stats = {}
+
+    def role(share: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Players with no share of a role skip its draws
+        columns = np.flatnonzero(shares[share] > 0)
+        return columns, school[columns], shares[share][columns]
+
+    def fill(name: str, columns: np.ndarray, values: np.ndarray):
+        column = stats.setdefault(name, np.zeros((sims, len(players))))
+        column[:, columns] = values
+
+    def yards(catches: np.ndarray, per_catch: float, shape: float) -> np.ndarray:
+        return np.rint(rng.gamma(catches * shape, per_catch / shape))
+
+    # Touchdowns and interceptions are rare per opportunity: Poisson thinning
+    columns, teams, share = role('target_share')
+    receptions = _counts(rng, dropbacks[:, teams], share * CATCH_RATE)
+    fill('receiving_receptions', columns, receptions)
+    fill('receiving_yards', columns, yards(receptions, YARDS_PER_RECEPTION, RECEPTION_SHAPE))
+    columns, teams, share = role('rz_target_share')
+    fill('receiving_tds', columns, rng.poisson(rz_targets[:, teams] * (share * RZ_TD_RATE)))
+
+    columns, teams, share = role('carry_share')
+    carries = _counts(rng, rushes[:, teams], share)
+    fill('rushing_yards', columns, yards(carries, YARDS_PER_CARRY, CARRY_SHAPE))
+    fill('rushing_tds', columns, rng.poisson(carries * RUSH_TD_RATE))
+
+    columns, teams, share = role('pass_share')
+    attempts = _counts(rng, dropbacks[:, teams], share)
+    completions = _counts(rng, attempts, np.full(len(columns), CATCH_RATE))
+    fill('passing_yards', columns, yards(completions, YARDS_PER_RECEPTION, RECEPTION_SHAPE))
+    fill('passing_tds', columns, rng.poisson(attempts * PASS_TD_RATE))
+    fill('passing_ints', columns, rng.poisson(attempts * INT_RATE))
+    return stats
+
+
+def simulate_matchup(lineup_a: Sequence[str], lineup_b: Sequence[str],
+                     profiles: Mapping[str, PlayerProfile],
+                     priors: Mapping[str, Tuple[float, float]],
+                     sims: int = 100_000,
+                     scoring_cfg: Optional[Dict[str, float]] = None,
+                     seed=None, keep_scores: bool = False) -> MatchupResult:
+    """
+    Simulate one fantasy matchup.
+
+    Args:
+        lineup_a, lineup_b: Starting player ids of each side.
+        profiles: player id -> PlayerProfile (every starter must have one).
+        priors: school -> (plays per game, pass rate), see team_priors.
+        sims: Number of simulated games.
+        scoring_cfg: League scoring config (DEFAULT_SCORING_CONFIG if None).
+        seed: Anything np.random.default_rng accepts.
+        keep_scores: Return the (sims, 2) score samples as well.
+    """
+    player_ids = sorted(set(lineup_a) | set(lineup_b))
+    players = [profiles[player_id] for player_id in player_ids]
+    # (players, 2) lineup membership, so a chunk's scores are one product
+    sides = np.zeros((len(player_ids), 2))
+    for side, lineup in enumerate((lineup_a, lineup_b)):
+        for player_id in lineup:
+            sides[player_ids.index(player_id), side] = 1.0
+
+    rng = np.random.default_rng(seed)
+    scores = np.empty((sims, 2))
+    for start in range(0, sims, CHUNK_SIMS):
+        chunk = min(CHUNK_SIMS, sims - start)
+        stats = _sample_stats(rng, chunk, players, priors)
+        points = calc_points_batch(
+            {name: values.ravel() for name, values in stats.items()}, [scoring_cfg]
+        ).reshape(chunk, len(players))
+        scores[start:start + chunk] = points @ sides
+
+    margin = scores[:, 0] - scores[:, 1]
+    quantiles = np.quantile(scores, QUANTILES, axis=0)
+    return MatchupResult(
+        win_prob_a=float(np.mean(margin > 0)),
+        win_prob_b=float(np.mean(margin < 0)),
+        tie_prob=float(np.mean(margin == 0)),
+        mean=tuple(float(value) for value in scores.mean(axis=0)),
+        std=tuple(float(value) for value in scores.std(axis=0)),
+        quantiles={q: (float(a), float(b)) for q, (a, b) in zip(QUANTILES, quantiles)},
+        scores=scores if keep_scores else None,
+    )
+
+
+def _simulate_task(args) -> MatchupResult:
+    return simulate_matchup(*args)
+
+
+def simulate_week(matchups: Iterable[Tuple[Sequence[str], Sequence[str]]],
+                  profiles: Mapping[str, PlayerProfile],
+                  priors: Mapping[str, Tuple[float, float]],
+                  sims: int = 100_000,
+                  scoring_cfg: Optional[Dict[str, float]] = None,
+                  seed=None, processes: Optional[int] = None) -> List[MatchupResult]:
+    """
+    Simulate a league-week's matchups across a process pool (one per CPU
+    by default, processes=1 runs inline). Each matchup gets an independent
+    stream spawned from seed, so results do not depend on the pool size.
+    """
+    matchups = list(matchups)
+    seeds = np.random.SeedSequence(seed).spawn(len(matchups))
+    tasks = []
+    for (lineup_a, lineup_b), matchup_seed in zip(matchups, seeds):
+        starters = set(lineup_a) | set(lineup_b)
+        schools = {profiles[player_id].team for player_id in starters}
+        tasks.append((
+            lineup_a, lineup_b,
+            {player_id: profiles[player_id] for player_id in starters},
+            {school: priors[school] for school in schools},
+            sims, scoring_cfg, matchup_seed,
+        ))
+    if processes == 1:
+        return [_simulate_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(_simulate_task, tasks))
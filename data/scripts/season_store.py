@@ -0,0 +1,296 @@
+"""
+Columnar, memory-mapped store of a season's per-game player stat lines
+
+A store is a directory of .npy arrays plus a small JSON manifest:
+
+    manifest.json       version, season, row count, stat columns and dtypes
+    players.json        player id intern table (index -> id)
+    games.json          game id intern table
+    player_idx.npy      int32 player index per row (rows sorted by player, game)
+    game_idx.npy        int32 game index per row
+    player_offsets.npy  int64, rows of player i are [offsets[i], offsets[i + 1])
+    present.npy         uint32 bitmask per row of the stat columns it carries
+    stats/<stat>.npy    one array per stat, smallest int dtype that fits
+
+SeasonStore.open maps every array read-only (np.load mmap_mode='r'), so
+scoring, projections and validation share the page cache instead of each
+parsing JSON into dicts; only the pages a caller touches are ever read.
+build_store writes one from JSON or CSV exports.
+
+Usage: python season_store.py build OUT_DIR export.json [export.csv ...] [--season 2025]
+                              [--skip COLUMN ...]
+"""
+
+import argparse
+import csv
+import json
+import os
+import shutil
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
+
+import numpy as np
+
+STORE_VERSION = 1
+
+# Columns that identify a row rather than holding a stat
+KEY_FIELDS = ('player_id', 'game_id')
+
+# Descriptive export columns that are never stats, numeric or not
+NON_STAT_FIELDS = frozenset((
+    'name', 'player_name', 'team', 'opponent', 'position', 'conference', 'season', 'week', 'date',
+))
+
+# Bits in the present mask
+MAX_STATS = 32
+
+INT_DTYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+def _smallest_dtype(values: np.ndarray) -> np.dtype:
+    low, high = (int(values.min()), int(values.max())) if values.size else (0, 0)
+    for dtype in INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    raise ValueError(f"Stat values out of int64 range: {low}..{high}")
+
+
+def stat_line(record: Mapping, where: str, skip: Iterable[str] = ()) -> Dict:
+    """A record's key fields plus its stats as ints
+
+    NON_STAT_FIELDS and skip fields are dropped, as are blank or null
+    values (absent stats). Every other field must be a whole number (or a
+    string of one); anything else raises ValueError naming where and the
+    field rather than guessing.
+    """
+    ignored = NON_STAT_FIELDS.union(skip)
+    line = {}
+    for name, value in record.items():
+        if name in ignored or value in ('', None):
+            continue
+        if name in KEY_FIELDS:
+            line[name] = str(value)
+            continue
+        number = None
+        if not isinstance(value, bool):
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                pass
+        if number is None or not number.is_integer():
+            raise ValueError(f"{where}: {name!r} is not a whole number ({value!r}); skip it if it is not a stat")
+        line[name] = int(number)
+    return line
+
+
+def read_json_export(path: str, skip: Iterable[str] = ()) -> Iterator[Dict]:
+    """Stat lines from a JSON list (or {'stats': [...]}), flat or with a nested 'stats' dict
+
+    Values are checked like read_csv_export's (see stat_line).
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data['stats']
+    for index, record in enumerate(data):
+        stats = record.get('stats')
+        if isinstance(stats, dict):
+            record = {**stats, 'player_id': record['player_id'], 'game_id': record['game_id']}
+        yield stat_line(record, f"{path} record {index}", skip)
+
+
+def read_csv_export(path: str, skip: Iterable[str] = ()) -> Iterator[Dict]:
+    """Stat lines from a CSV with player_id, game_id and one column per stat (blank = absent)
+
+    NON_STAT_FIELDS and any skip columns are ignored. Every other column
+    must hold whole numbers (see stat_line).
+    """
+    with open(path, newline='') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield stat_line(row, f"{path} line {reader.line_num}", skip)
+
+
+def read_export(path: str, skip: Iterable[str] = ()) -> Iterator[Dict]:
+    return read_csv_export(path, skip) if path.endswith('.csv') else read_json_export(path, skip)
+
+
+def build_store(out_dir: str, records: Iterable[Mapping], season: Optional[int] = None) -> 'SeasonStore':
+    """Write a store from stat line records ({'player_id', 'game_id', stat: value, ...})
+
+    Values are checked with stat_line, so direct callers get the same
+    errors as the export readers. Later records for the same player and
+    game replace earlier ones (stat corrections). The store is written to a temporary directory and moved
+    into place, so readers never see a partial store.
+    """
+    lines: Dict[tuple, Dict[str, int]] = {}
+    stat_names = set()
+    for record in records:
+        key = (str(record['player_id']), str(record['game_id']))
+        line = stat_line(record, f"record for player {key[0]}, game {key[1]}")
+        stats = {name: value for name, value in line.items() if name not in KEY_FIELDS}
+        lines[key] = stats
+        stat_names.update(stats)
+    stat_names = sorted(stat_names)
+    if len(stat_names) > MAX_STATS:
+        raise ValueError(f"{len(stat_names)} stat columns; the present mask holds {MAX_STATS}")
+
+    keys = sorted(lines)
+    players = sorted({player_id for player_id, _ in keys})
+    games = sorted({game_id for _, game_id in keys})
+    player_lookup = {player_id: index for index, player_id in enumerate(players)}
+    game_lookup = {game_id: index for index, game_id in enumerate(games)}
+
+    rows = len(keys)
+    player_idx = np.fromiter((player_lookup[player_id] for player_id, _ in keys), dtype=np.int32, count=rows)
+    game_idx = np.fromiter((game_lookup[game_id] for _, game_id in keys), dtype=np.int32, count=rows)
+    player_offsets = np.searchsorted(player_idx, np.arange(len(players) + 1)).astype(np.int64)
+    present = np.zeros(rows, dtype=np.uint32)
+    values = np.zeros((len(stat_names), rows), dtype=np.int64)
+    slots = {name: bit for bit, name in enumerate(stat_names)}
+    for row, key in enumerate(keys):
+        mask = 0
+        for name, value in lines[key].items():
+            values[slots[name], row] = value
+            mask |= 1 << slots[name]
+        present[row] = mask
+    columns = {
+        name: values[bit].astype(_smallest_dtype(values[bit])) for name, bit in slots.items()
+    }
+
+    tmp_dir = f"{out_dir.rstrip(os.sep)}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(os.path.join(tmp_dir, 'stats'))
+    np.save(os.path.join(tmp_dir, 'player_idx.npy'), player_idx)
+    np.save(os.path.join(tmp_dir, 'game_idx.npy'), game_idx)
+    np.save(os.path.join(tmp_dir, 'player_offsets.npy'), player_offsets)
+    np.save(os.path.join(tmp_dir, 'present.npy'), present)
+    for name, column in columns.items():
+        np.save(os.path.join(tmp_dir, 'stats', f"{name}.npy"), column)
+    with open(os.path.join(tmp_dir, 'players.json'), 'w') as f:
+        json.dump(players, f)
+    with open(os.path.join(tmp_dir, 'games.json'), 'w') as f:
+        json.dump(games, f)
+    with open(os.path.join(tmp_dir, 'manifest.json'), 'w') as f:
+        json.dump({
+            'version': STORE_VERSION,
+            'season': season,
+            'rows': rows,
+            'stats': {name: column.dtype.name for name, column in columns.items()},
+        }, f, indent=2)
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.replace(tmp_dir, out_dir)
+    return SeasonStore.open(out_dir)
+
+
+class SeasonStore:
+    """Read-only, memory-mapped view of a season store"""
+
+    def __init__(self, path: str, manifest: Dict, players: List[str], games: List[str],
+                 arrays: Dict[str, np.ndarray], columns: Dict[str, np.ndarray]):
+        self.path = path
+        self.season = manifest.get('season')
+        self.rows = manifest['rows']
+        self.stat_names = list(columns)
+        self.players = players
+        self.games = games
+        self.player_idx = arrays['player_idx']
+        self.game_idx = arrays['game_idx']
+        self.player_offsets = arrays['player_offsets']
+        self.present = arrays['present']
+        self.columns = columns
+        self._player_lookup: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def open(cls, path: str) -> 'SeasonStore':
+        with open(os.path.join(path, 'manifest.json')) as f:
+            manifest = json.load(f)
+        if manifest.get('version') != STORE_VERSION:
+            raise ValueError(f"Unsupported season store version {manifest.get('version')} in {path}")
+        with open(os.path.join(path, 'players.json')) as f:
+            players = json.load(f)
+        with open(os.path.join(path, 'games.json')) as f:
+            games = json.load(f)
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r')
+            for name in ('player_idx', 'game_idx', 'player_offsets', 'present')
+        }
+        columns = {
+            name: np.load(os.path.join(path, 'stats', f"{name}.npy"), mmap_mode='r')
+            for name in manifest['stats']
+        }
+        return cls(path, manifest, players, games, arrays, columns)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def player_rows(self, player_id: str) -> slice:
+        """Row range of one player's games (rows are sorted by player)"""
+        if self._player_lookup is None:
+            self._player_lookup = {player_id: index for index, player_id in enumerate(self.players)}
+        index = self._player_lookup.get(player_id)
+        if index is None:
+            return slice(0, 0)
+        return slice(int(self.player_offsets[index]), int(self.player_offsets[index + 1]))
+
+    def mask(self, stat: str) -> np.ndarray:
+        """Rows that carry a stat"""
+        return (self.present >> self.stat_names.index(stat)) & 1 == 1
+
+    def table(self, stats: Optional[Iterable[str]] = None, rows=slice(None)) -> Dict[str, np.ndarray]:
+        """Float columns with NaN where a row lacks the stat, the input calc_points_batch expects
+
+        Columns every row carries are converted without masking; this is the
+        one place values are copied out of the map.
+        """
+        table = {}
+        present = self.present[rows]
+        for name in self.stat_names if stats is None else stats:
+            values = np.asarray(self.columns[name][rows], dtype=float)
+            missing = (present >> self.stat_names.index(name)) & 1 == 0
+            if missing.any():
+                values[missing] = np.nan
+            table[name] = values
+        return table
+
+    def stat_lines(self, player_id: str) -> List[Dict]:
+        """One player's games as {'game_id', 'stats'} dicts, for dict-based callers"""
+        return [self.record(row) for row in range(*self.player_rows(player_id).indices(self.rows))]
+
+    def record(self, row: int) -> Dict:
+        present = int(self.present[row])
+        return {
+            'player_id': self.players[self.player_idx[row]],
+            'game_id': self.games[self.game_idx[row]],
+            'stats': {
+                name: int(self.columns[name][row])
+                for bit, name in enumerate(self.stat_names) if present >> bit & 1
+            },
+        }
+
+    def records(self) -> Iterator[Dict]:
+        """Every row as a flat dict (player_id, game_id, stats...), e.g. for validation"""
+        for row in range(self.rows):
+            record = self.record(row)
+            yield {'player_id': record['player_id'], 'game_id': record['game_id'], **record['stats']}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subcommands = parser.add_subparsers(dest='command', required=True)
+    build = subcommands.add_parser('build', help='Build a store from JSON/CSV exports')
+    build.add_argument('out_dir')
+    build.add_argument('exports', nargs='+')
+    build.add_argument('--season', type=int)
+    build.add_argument('--skip', action='append', default=[], metavar='COLUMN',
+                       help='Export field or column that is not a stat (repeatable)')
+    args = parser.parse_args()
+
+    def all_records():
+        for path in args.exports:
+            yield from read_export(path, args.skip)
+
+    store = build_store(args.out_dir, all_records(), args.season)
+    print(f"Wrote {len(store)} stat lines for {len(store.players)} players, "
+          f"{len(store.stat_names)} stats to {args.out_dir}")
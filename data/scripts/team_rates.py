@@ -1,17 +1,92 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Mapping, Sequence, Tuple, Union
 
-def get_team_priors(conference: str = None) -> pd.DataFrame:
+# Shrinkage toward the conference mean when the data cannot estimate one
+# (one team per conference, or no sampling noise for the metric)
+DEFAULT_SHRINKAGE = 0.3
+
+# Season metric -> adjusted column in get_team_priors
+PRIOR_METRICS = {'pace': 'pace_adj', 'pass_rate': 'pass_rate_adj'}
+
+# Regular-season games behind a season average
+SEASON_GAMES = 12
+
+
+def shrinkage_weights(values: pd.DataFrame, group_means: pd.DataFrame, group_sizes: pd.DataFrame,
+                      noise: pd.Series) -> pd.Series:
     """
-    Get team pace and style priors
-    
+    Empirical-Bayes weight on the group mean for each metric column
+
+    A team's value is its true rate plus sampling noise of variance noise
+    (per metric, e.g. the variance of a season average). The within-
+    conference mean square MSW estimates true spread plus that noise, so
+    the true within-conference variance is sigma^2 = MSW - noise and the
+    posterior weight on the conference mean is noise / (noise + sigma^2):
+    near 1 when teams in a conference differ by little more than noise,
+    near 0 when their real differences dwarf it.
+
+    group_means and group_sizes are the groupby transform('mean') and
+    transform('count') of values, so every sum below is over team rows.
+    """
+    present = values.notna()
+    group_sizes = group_sizes.where(present)
+    counts = present.sum()
+    n_groups = (1 / group_sizes).sum().round()
+    ms_within = ((values - group_means) ** 2).sum() / (counts - n_groups)
+    noise = noise.reindex(values.columns)
+    true_variance = (ms_within - noise).clip(lower=0)
+    weights = (noise / (noise + true_variance)).where(counts > n_groups)
+    return weights.fillna(DEFAULT_SHRINKAGE)
+
+
+def season_noise(df: pd.DataFrame, season: int, games: int = SEASON_GAMES) -> pd.Series:
+    """
+    Sampling variance of each PRIOR_METRICS season average, by source column
+
+    Plays per game are roughly Poisson, so a pace average over `games`
+    games has variance pace / games; a pass rate over pace * games plays
+    is binomial, p (1 - p) / (pace * games). Averaged over teams.
+    """
+    pace = df[f'pace_{season}'].astype(float)
+    pass_rate = df[f'pass_rate_{season}'].astype(float)
+    return pd.Series({
+        f'pace_{season}': (pace / games).mean(),
+        f'pass_rate_{season}': (pass_rate * (1 - pass_rate) / (pace * games)).mean(),
+    })
+
+
+def shrink_to_group_means(df: pd.DataFrame, metrics: Union[Sequence[str], Mapping[str, str]],
+                          noise: Union[pd.Series, Mapping[str, float]],
+                          group: str = 'conference') -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Shrink any number of metric columns toward their group means at once
+
     Args:
-        conference: Optional conference filter
-        
+        df: One row per team
+        metrics: Columns to shrink, or a mapping of column -> output name
+        noise: Sampling variance of each column's values (see season_noise)
+        group: Column to group by
+
     Returns:
-        DataFrame with team-level priors
+        (adjusted columns indexed like df, weight on the group mean per metric)
     """
+    names = dict(metrics) if isinstance(metrics, Mapping) else {name: name for name in metrics}
+    values = df[list(names)].astype(float)
+    grouped = values.groupby(df[group])
+    group_means = grouped.transform('mean')
+    weights = shrinkage_weights(values, group_means, grouped.transform('count'), pd.Series(noise, dtype=float))
+    adjusted = values + (group_means - values) * weights
+    return adjusted.rename(columns=names), weights.rename(index=names)
+
+
+# Season the sample data below is from
+SAMPLE_SEASON = 2024
+
+
+@lru_cache(maxsize=32)
+def _team_priors(conference: str) -> pd.DataFrame:
     # Sample data - would come from Appwrite
     teams_data = {
         'team': ['TEX', 'UGA', 'BAMA', 'OSU', 'MICH', 'OU', 'MIZ', 'OKST'],
@@ -21,25 +96,31 @@ def get_team_priors(conference: str = None) -> pd.DataFrame:
         'returning_production_off': [0.65, 0.72, 0.58, 0.81, 0.45, 0.69, 0.77, 0.83],
         'offensive_sp_plus': [112, 118, 115, 120, 108, 110, 105, 102]
     }
-    
+
     df = pd.DataFrame(teams_data)
-    
+
+    # Weights come from the whole league so a conference filter does not
+    # leave them estimated from a single conference
+    adjusted, _ = shrink_to_group_means(
+        df, {f'{metric}_{SAMPLE_SEASON}': column for metric, column in PRIOR_METRICS.items()},
+        season_noise(df, SAMPLE_SEASON)
+    )
+    df = df.join(adjusted)
+
     if conference:
         df = df[df['conference'] == conference]
-    
-    # Apply conference shrinkage
-    conf_means = df.groupby('conference')[['pace_2024', 'pass_rate_2024']].mean()
-    
-    # Shrink by 30% to conference mean
-    for conf in df['conference'].unique():
-        conf_mask = df['conference'] == conf
-        df.loc[conf_mask, 'pace_adj'] = (
-            0.7 * df.loc[conf_mask, 'pace_2024'] + 
-            0.3 * conf_means.loc[conf, 'pace_2024']
-        )
-        df.loc[conf_mask, 'pass_rate_adj'] = (
-            0.7 * df.loc[conf_mask, 'pass_rate_2024'] + 
-            0.3 * conf_means.loc[conf, 'pass_rate_2024']
-        )
-    
+
     return df
+
+
+def get_team_priors(conference: str = None) -> pd.DataFrame:
+    """
+    Get team pace and style priors
+
+    Args:
+        conference: Optional conference filter
+
+    Returns:
+        DataFrame with team-level priors (a copy of the cached result)
+    """
+    return _team_priors(conference).copy()
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Make the scripts in data/scripts importable by name; they add
+# ../../functions/workers to sys.path themselves for scoring.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
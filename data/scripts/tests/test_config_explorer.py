@@ -0,0 +1,72 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from config_explorer import ConfigExplorer
+from scoring import DEFAULT_SCORING_CONFIG, calc_points
+
+STATS = (
+    'passing_yards', 'passing_tds', 'passing_ints', 'rushing_yards', 'rushing_tds',
+    'receiving_receptions', 'receiving_yards', 'receiving_tds',
+    'def_sacks', 'def_ints', 'def_points_allowed', 'def_yards_allowed',
+)
+
+
+def make_table(rng: random.Random, lines: int = 300):
+    """Random stat lines; a stat is missing (NaN) about a quarter of the time"""
+    table = {stat: [] for stat in STATS}
+    for _ in range(lines):
+        for stat in STATS:
+            high = 500 if stat.endswith('_yards') or stat.endswith('_allowed') else 6
+            table[stat].append(np.nan if rng.random() < 0.25 else rng.randint(0, high))
+    player_ids = [f"p{rng.randrange(40):02d}" for _ in range(lines)]
+    return table, player_ids
+
+
+def random_customizations(rng: random.Random):
+    keys = rng.sample(sorted(DEFAULT_SCORING_CONFIG), 6)
+    return {key: rng.choice((-2.0, 0.0, 0.5, 1.0, 3.0, 6.0)) for key in keys}
+
+
+def test_row_scores_and_preview_match_calc_points():
+    rng = random.Random(5)
+    table, player_ids = make_table(rng)
+    explorer = ConfigExplorer(table, player_ids)
+    lines = [
+        {stat: table[stat][row] for stat in STATS if not math.isnan(table[stat][row])}
+        for row in range(len(player_ids))
+    ]
+
+    for _ in range(20):
+        customizations = random_customizations(rng)
+        config = {**DEFAULT_SCORING_CONFIG, **customizations}
+        expected = [calc_points(line, config) for line in lines]
+        assert explorer.row_scores(config) == pytest.approx(expected, abs=0.011)
+
+        totals = {}
+        for player_id, points in zip(player_ids, expected):
+            totals[player_id] = totals.get(player_id, 0.0) + points
+        preview = explorer.preview(customizations, top=None)
+        assert len(preview['players']) == len(totals)
+        for player_id, points, _, _ in preview['players']:
+            assert points == pytest.approx(totals[player_id], abs=0.05)
+
+
+def test_totals_cache_evicts_least_recently_used_plan():
+    rng = random.Random(6)
+    table, player_ids = make_table(rng, lines=50)
+    explorer = ConfigExplorer(table, player_ids, cache_size=2)
+    ppr = {**DEFAULT_SCORING_CONFIG, 'receiving_receptions': 1.0}
+    six = {**DEFAULT_SCORING_CONFIG, 'passing_tds': 6.0}
+
+    explorer.player_totals(ppr)
+    explorer.player_totals(DEFAULT_SCORING_CONFIG)
+    assert (explorer.hits, explorer.misses) == (1, 2)
+    explorer.player_totals(six)
+    assert len(explorer._cache) == 2
+    explorer.player_totals(DEFAULT_SCORING_CONFIG)
+    assert (explorer.hits, explorer.misses) == (2, 3)
+    explorer.player_totals(ppr)
+    assert (explorer.hits, explorer.misses) == (2, 4)
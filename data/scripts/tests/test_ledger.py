@@ -0,0 +1,53 @@
+from ledger import ScoreLedger
+from scoring import compile_scoring_plan
+
+DST = 'dst-uga'
+PPR = {'receiving_receptions': 1.0}
+
+
+def make_ledger(*leagues):
+    ledger = ScoreLedger()
+    for league_id, cfg in leagues:
+        ledger.register_league(league_id, cfg)
+        ledger.set_lineup(league_id, 'team1', 1, [DST, 'wr'])
+    return ledger
+
+
+def test_threshold_stat_appearing_at_zero_is_scored():
+    ledger = make_ledger(('league1', None))
+    plan_key = ledger.engine.league_plans['league1']
+    ledger.record('g1', 1, DST, {'def_ints': 1})
+    ledger.record('g1', 1, DST, {'def_ints': 1, 'def_points_allowed': 0})
+    expected = compile_scoring_plan(None).score({'def_ints': 1, 'def_points_allowed': 0})
+    assert ledger.points(DST, 1, plan_key) == expected
+    assert ledger.team_total('league1', 'team1', 1) == expected
+
+
+def test_threshold_stat_disappearing_at_zero_is_scored():
+    ledger = make_ledger(('league1', None))
+    plan_key = ledger.engine.league_plans['league1']
+    ledger.record('g1', 1, DST, {'def_ints': 1, 'def_points_allowed': 0})
+    ledger.record('g1', 1, DST, {'def_ints': 1})
+    assert ledger.points(DST, 1, plan_key) == compile_scoring_plan(None).score({'def_ints': 1})
+    assert ledger.team_total('league1', 'team1', 1) == ledger.points(DST, 1, plan_key)
+
+
+def test_plan_reregistered_after_corrections_is_rescored():
+    ledger = make_ledger(('league1', None), ('league2', PPR))
+    ledger.record('g1', 1, 'wr', {'receiving_receptions': 4, 'receiving_yards': 0})
+    ledger.unregister_league('league2')
+    ledger.record('g1', 1, 'wr', {'receiving_receptions': 12, 'receiving_yards': 0})
+    plan_key = ledger.register_league('league2', PPR)
+    ledger.set_lineup('league2', 'team1', 1, [DST, 'wr'])
+    assert ledger.points('wr', 1, plan_key) == 12.0
+    assert ledger.team_total('league2', 'team1', 1) == 12.0
+
+
+def test_plan_dropped_by_engine_is_rescored_on_register():
+    # Unregistered on the engine directly, bypassing the ledger
+    ledger = make_ledger(('league1', None), ('league2', PPR))
+    ledger.record('g1', 1, 'wr', {'receiving_receptions': 4})
+    ledger.engine.unregister('league2')
+    ledger.record('g1', 1, 'wr', {'receiving_receptions': 12})
+    plan_key = ledger.register_league('league2', PPR)
+    assert ledger.points('wr', 1, plan_key) == 12.0
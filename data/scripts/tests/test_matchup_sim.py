@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from matchup_sim import PlayerProfile, simulate_matchup, simulate_week
+
+PRIORS = {'uga': (68.0, 0.48), 'osu': (72.0, 0.55)}
+PROFILES = {
+    profile.player_id: profile for profile in (
+        PlayerProfile('uga_QB', 'uga', pass_share=0.95, carry_share=0.12),
+        PlayerProfile('uga_RB', 'uga', carry_share=0.5, target_share=0.06, rz_target_share=0.05),
+        PlayerProfile('uga_WR', 'uga', target_share=0.24, rz_target_share=0.2),
+        PlayerProfile('osu_QB', 'osu', pass_share=0.95, carry_share=0.08),
+        PlayerProfile('osu_RB', 'osu', carry_share=0.45, target_share=0.05, rz_target_share=0.04),
+        PlayerProfile('osu_WR', 'osu', target_share=0.28, rz_target_share=0.25),
+    )
+}
+WEEK = [
+    (['uga_QB', 'uga_RB'], ['osu_QB', 'osu_RB']),
+    (['uga_WR'], ['osu_WR']),
+    (['uga_RB'], ['uga_RB']),
+]
+
+
+def assert_probabilities(result):
+    for prob in (result.win_prob_a, result.win_prob_b, result.tie_prob):
+        assert 0.0 <= prob <= 1.0
+    assert result.win_prob_a + result.win_prob_b + result.tie_prob == pytest.approx(1.0)
+
+
+def test_same_seed_same_result():
+    first = simulate_matchup(*WEEK[0], PROFILES, PRIORS, sims=2_000, seed=7, keep_scores=True)
+    second = simulate_matchup(*WEEK[0], PROFILES, PRIORS, sims=2_000, seed=7, keep_scores=True)
+    other = simulate_matchup(*WEEK[0], PROFILES, PRIORS, sims=2_000, seed=8, keep_scores=True)
+
+    assert np.array_equal(first.scores, second.scores)
+    assert (first.win_prob_a, first.mean) == (second.win_prob_a, second.mean)
+    assert not np.array_equal(first.scores, other.scores)
+    assert first.scores.shape == (2_000, 2)
+    assert_probabilities(first)
+
+
+def test_identical_lineups_always_tie():
+    result = simulate_matchup(*WEEK[2], PROFILES, PRIORS, sims=500, seed=1)
+    assert (result.win_prob_a, result.win_prob_b, result.tie_prob) == (0.0, 0.0, 1.0)
+
+
+def test_week_matches_across_pool_sizes():
+    inline = simulate_week(WEEK, PROFILES, PRIORS, sims=1_000, seed=3, processes=1)
+    pooled = simulate_week(WEEK, PROFILES, PRIORS, sims=1_000, seed=3, processes=2)
+
+    assert inline == pooled
+    for result in inline:
+        assert_probabilities(result)
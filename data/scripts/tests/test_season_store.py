@@ -0,0 +1,73 @@
+import pytest
+
+from season_store import build_store, read_csv_export, read_export, read_json_export
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def test_csv_skips_descriptive_columns_and_blank_cells(tmp_path):
+    path = write(tmp_path, 'week1.csv', (
+        "player_id,game_id,player_name,team,passing_yards,rushing_yards\n"
+        "p1,g1,Quinn Ewers,TEX,312.0,\n"
+        "p2,g1,Ollie Gordon,OKST,,121\n"
+    ))
+    assert list(read_csv_export(path)) == [
+        {'player_id': 'p1', 'game_id': 'g1', 'passing_yards': 312},
+        {'player_id': 'p2', 'game_id': 'g1', 'rushing_yards': 121},
+    ]
+
+
+def test_csv_rejects_unknown_text_columns(tmp_path):
+    path = write(tmp_path, 'week1.csv', "player_id,game_id,status,passing_yards\np1,g1,active,312\n")
+    with pytest.raises(ValueError, match="line 2: 'status'"):
+        list(read_csv_export(path))
+    assert list(read_csv_export(path, skip=['status'])) == [
+        {'player_id': 'p1', 'game_id': 'g1', 'passing_yards': 312}
+    ]
+
+
+def test_csv_rejects_fractional_stats(tmp_path):
+    path = write(tmp_path, 'week1.csv', "player_id,game_id,rushing_yards\np1,g1,12.5\n")
+    with pytest.raises(ValueError, match="rushing_yards"):
+        list(read_csv_export(path))
+
+
+def test_csv_and_json_exports_build_the_same_store(tmp_path):
+    csv_path = write(tmp_path, 'week1.csv', (
+        "player_id,game_id,week,team,passing_yards,passing_tds\n"
+        "p1,g1,1,TEX,312,3\n"
+    ))
+    json_path = write(tmp_path, 'week1.json', (
+        '[{"player_id": "p1", "game_id": "g1", "week": 1, "team": "TEX",'
+        ' "stats": {"passing_yards": 312, "passing_tds": 3}}]'
+    ))
+    from_csv = build_store(str(tmp_path / 'csv_store'), read_csv_export(csv_path))
+    from_json = build_store(str(tmp_path / 'json_store'), read_json_export(json_path))
+    assert from_csv.stat_names == from_json.stat_names == ['passing_tds', 'passing_yards']
+    assert list(from_csv.records()) == list(from_json.records())
+
+
+def test_json_values_are_checked_like_csv(tmp_path):
+    path = write(tmp_path, 'week1.json', (
+        '[{"player_id": "p1", "game_id": "g1", "passing_yards": 212.7, "rushing_yards": "15"}]'
+    ))
+    with pytest.raises(ValueError, match="record 0: 'passing_yards'"):
+        list(read_json_export(path))
+    path = write(tmp_path, 'week2.json', (
+        '[{"player_id": "p1", "game_id": "g1", "passing_yards": 212.0, "rushing_yards": "15",'
+        ' "status": "active", "team": "TEX", "receiving_yards": null}]'
+    ))
+    with pytest.raises(ValueError, match="'status'"):
+        list(read_json_export(path))
+    assert list(read_export(path, skip=['status'])) == [
+        {'player_id': 'p1', 'game_id': 'g1', 'passing_yards': 212, 'rushing_yards': 15}
+    ]
+
+
+def test_build_store_rejects_fractional_values(tmp_path):
+    with pytest.raises(ValueError, match="player p1, game g1: 'passing_yards'"):
+        build_store(str(tmp_path / 'store'), [{'player_id': 'p1', 'game_id': 'g1', 'passing_yards': 212.7}])
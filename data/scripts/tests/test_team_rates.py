@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from bench_team_priors import make_league
+from team_rates import DEFAULT_SHRINKAGE, get_team_priors, season_noise, shrink_to_group_means
+
+
+def test_weights_recover_noise_share_of_within_conference_variance():
+    df, noise, truth = make_league(np.random.default_rng(5), teams=4000, conferences=20, metrics=6)
+    _, weights = shrink_to_group_means(df, list(truth), noise)
+    assert np.allclose(weights[list(truth)], list(truth.values()), atol=0.05)
+
+
+def test_weight_is_zero_without_noise_and_one_when_spread_is_all_noise():
+    df = pd.DataFrame({'conference': ['A', 'A', 'A', 'B', 'B', 'B'], 'x': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]})
+    _, weights = shrink_to_group_means(df, ['x'], {'x': 1e-9})
+    assert weights['x'] < 1e-6
+    # MSW is 1.0 here, so noise of 1.0 or more leaves no true spread
+    _, weights = shrink_to_group_means(df, ['x'], {'x': 2.0})
+    assert weights['x'] == 1.0
+
+
+def test_single_conference_is_estimated():
+    df = pd.DataFrame({'conference': ['A'] * 4, 'x': [1.0, 2.0, 3.0, 4.0]})
+    adjusted, weights = shrink_to_group_means(df, ['x'], {'x': 0.5})
+    # MSW 5/3, so the true variance is 5/3 - 1/2
+    assert np.isclose(weights['x'], 0.5 / (5 / 3))
+    assert np.isclose(adjusted['x'].mean(), 2.5)
+
+
+def test_degenerate_metrics_fall_back_to_default():
+    df = pd.DataFrame({
+        'conference': ['A', 'B', 'C', 'C'],
+        'solo': [1.0, 2.0, 3.0, np.nan],     # one team per conference once NaNs drop out
+        'empty': [np.nan] * 4,
+        'no_noise': [1.0, 2.0, 3.0, 5.0],
+    })
+    _, weights = shrink_to_group_means(df, ['solo', 'empty', 'no_noise'], {'solo': 1.0, 'empty': 1.0})
+    assert weights.to_dict() == {'solo': DEFAULT_SHRINKAGE, 'empty': DEFAULT_SHRINKAGE,
+                                 'no_noise': DEFAULT_SHRINKAGE}
+
+
+def test_missing_values_are_left_out_of_the_estimate():
+    df = pd.DataFrame({'conference': ['A', 'A', 'A', 'B', 'B', 'B'], 'x': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]})
+    with_nan = pd.concat([df, pd.DataFrame({'conference': ['A', 'B'], 'x': [np.nan, np.nan]})],
+                         ignore_index=True)
+    adjusted, weights = shrink_to_group_means(with_nan, ['x'], {'x': 0.5})
+    _, expected = shrink_to_group_means(df, ['x'], {'x': 0.5})
+    assert weights['x'] == expected['x']
+    assert adjusted['x'].iloc[-2:].isna().all()
+
+
+def test_season_noise():
+    df = pd.DataFrame({'pace_2024': [72.0], 'pass_rate_2024': [0.5]})
+    noise = season_noise(df, 2024, games=12)
+    assert np.isclose(noise['pace_2024'], 6.0)
+    assert np.isclose(noise['pass_rate_2024'], 0.25 / 864)
+
+
+def test_priors_are_a_copy_of_the_cache():
+    priors = get_team_priors()
+    priors.loc[0, 'pace_adj'] = -1.0
+    priors.drop(columns='pass_rate_adj', inplace=True)
+    again = get_team_priors()
+    assert again.loc[0, 'pace_adj'] != -1.0
+    assert 'pass_rate_adj' in again.columns
+    assert get_team_priors('SEC')['conference'].eq('SEC').all()
+
+
+def test_conference_filter_keeps_league_rows():
+    league = get_team_priors()
+    sec = get_team_priors('SEC')
+    assert list(sec.index) == list(league.index[league['conference'] == 'SEC'])
+    pd.testing.assert_frame_equal(sec, league.loc[sec.index])
@@ -0,0 +1,119 @@
+"""
+Benchmark: legacy extract_player_stats vs the table-driven boxscore parser
+
+Parses each fixture (a saved ESPN summary JSON) repeatedly with both
+implementations. Without fixture paths a synthetic summary in ESPN's shape
+is generated; pass --integer-averages to give the legacy parser input it
+can survive (it reads AVG columns with int()).
+
+Usage: python bench_boxscore.py [--number 2000] [fixture.json ...]
+"""
+
+import argparse
+import json
+import random
+import timeit
+from typing import Dict, List
+
+from boxscore import parse_boxscore
+
+CATEGORY_LABELS = {
+    'passing': ['C/ATT', 'YDS', 'AVG', 'TD', 'INT', 'QBR'],
+    'rushing': ['CAR', 'YDS', 'AVG', 'TD', 'LONG'],
+    'receiving': ['REC', 'YDS', 'AVG', 'TD', 'LONG'],
+    'fumbles': ['FUM', 'LOST', 'REC'],
+    'interceptions': ['INT', 'YDS', 'TD'],
+    'kicking': ['FG', 'PCT', 'LONG', 'XP', 'PTS'],
+    'defensive': ['TOT', 'SOLO', 'SACKS', 'TFL', 'PD', 'QB HUR', 'TD'],
+}
+CATEGORY_SIZES = {
+    'passing': 2, 'rushing': 6, 'receiving': 9, 'fumbles': 2,
+    'interceptions': 1, 'kicking': 1, 'defensive': 20,
+}
+
+
+def legacy_extract_player_stats(boxscore: Dict) -> Dict[str, Dict]:
+    """The original position-based parser, kept for comparison"""
+    player_stats = {}
+    if 'boxscore' in boxscore and 'players' in boxscore['boxscore']:
+        for team in boxscore['boxscore']['players']:
+            for category in team.get('statistics', []):
+                stat_type = category.get('name', '')
+                for player in category.get('athletes', []):
+                    player_id = player.get('athlete', {}).get('id')
+                    player_name = player.get('athlete', {}).get('displayName')
+                    if not player_id:
+                        continue
+                    if player_id not in player_stats:
+                        player_stats[player_id] = {'name': player_name, 'stats': {}}
+                    if stat_type == 'passing':
+                        stats = player.get('stats', [])
+                        if len(stats) >= 3:
+                            player_stats[player_id]['stats']['passing_yards'] = int(stats[1] or 0)
+                            player_stats[player_id]['stats']['passing_tds'] = int(stats[2] or 0)
+                    elif stat_type == 'rushing':
+                        stats = player.get('stats', [])
+                        if len(stats) >= 3:
+                            player_stats[player_id]['stats']['rushing_yards'] = int(stats[2] or 0)
+                            player_stats[player_id]['stats']['rushing_tds'] = int(stats[3] or 0)
+                    elif stat_type == 'receiving':
+                        stats = player.get('stats', [])
+                        if len(stats) >= 3:
+                            player_stats[player_id]['stats']['receiving_yards'] = int(stats[2] or 0)
+                            player_stats[player_id]['stats']['receiving_tds'] = int(stats[3] or 0)
+    return player_stats
+
+
+def synthetic_summary(seed: int = 1, integer_averages: bool = False) -> Dict:
+    """An ESPN-shaped summary with two full teams of athletes"""
+    rng = random.Random(seed)
+    teams = []
+    for team in range(2):
+        statistics = []
+        for category, labels in CATEGORY_LABELS.items():
+            athletes = []
+            for n in range(CATEGORY_SIZES[category]):
+                stats = []
+                for label in labels:
+                    if '/' in label or label in ('FG', 'XP'):
+                        attempts = rng.randint(0, 30)
+                        stats.append(f"{rng.randint(0, attempts)}/{attempts}")
+                    elif label in ('AVG', 'PCT', 'QBR', 'SACKS') and not integer_averages:
+                        stats.append(f"{rng.uniform(0, 12):.1f}")
+                    else:
+                        stats.append(str(rng.randint(0, 120)))
+                athletes.append({
+                    'athlete': {'id': f"{team}{category}{n}", 'displayName': f"Player {team}-{category}-{n}"},
+                    'stats': stats,
+                })
+            statistics.append({'name': category, 'labels': labels, 'athletes': athletes})
+        teams.append({'team': {'id': str(team)}, 'statistics': statistics})
+    return {'boxscore': {'players': teams}}
+
+
+def bench(fixtures: List[Dict], number: int):
+    print(f"{'fixture':<12}{'players':>9}{'legacy us':>12}{'table us':>12}")
+    for n, summary in enumerate(fixtures):
+        table = min(timeit.repeat(lambda: parse_boxscore(summary).to_dict(), number=number, repeat=5))
+        players = len(parse_boxscore(summary))
+        try:
+            legacy = min(timeit.repeat(lambda: legacy_extract_player_stats(summary), number=number, repeat=5))
+            legacy_us = f"{legacy / number * 1e6:.1f}"
+        except ValueError:
+            # The positional parser reads AVG columns as ints and fails on decimals
+            legacy_us = "fails"
+        print(f"{n:<12}{players:>9}{legacy_us:>12}{table / number * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('fixtures', nargs='*', help='Saved ESPN summary JSON files')
+    parser.add_argument('--number', type=int, default=2000)
+    parser.add_argument('--integer-averages', action='store_true')
+    args = parser.parse_args()
+
+    fixtures = []
+    for path in args.fixtures:
+        with open(path) as f:
+            fixtures.append(json.load(f))
+    bench(fixtures or [synthetic_summary(integer_averages=args.integer_averages)], args.number)
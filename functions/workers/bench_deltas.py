@@ -0,0 +1,174 @@
+"""
+Benchmark: per-player Redis loop vs pipelined delta engine
+
+Runs two polls of a synthetic Saturday slate through both implementations of
+update_player_deltas against an in-memory Redis stand-in that counts round
+trips and sleeps for a configurable RTT on each one.
+
+Usage: python bench_deltas.py [--games 40] [--players 80] [--rtt-ms 0.5]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from live_worker import LiveGameWorker, PLAYER_STATS_TTL
+
+
+class CountingRedis:
+    """Minimal async Redis stand-in that counts round trips"""
+
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.store: Dict[str, str] = {}
+        self.round_trips = 0
+
+    async def _round_trip(self):
+        self.round_trips += 1
+        await asyncio.sleep(self.rtt)
+
+    async def get(self, key):
+        await self._round_trip()
+        return self.store.get(key)
+
+    async def mget(self, keys):
+        await self._round_trip()
+        return [self.store.get(key) for key in keys]
+
+    async def setex(self, key, ttl, value):
+        await self._round_trip()
+        self.store[key] = value
+
+    def pipeline(self, transaction: bool = True):
+        return CountingPipeline(self)
+
+
+class CountingPipeline:
+    def __init__(self, redis_client: CountingRedis):
+        self.redis_client = redis_client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.commands = []
+
+    def setex(self, key, ttl, value):
+        self.commands.append((key, value))
+        return self
+
+    def hset(self, key, mapping):
+        self.commands.append((key, mapping))
+        return self
+
+    def expire(self, key, ttl):
+        return self
+
+    async def execute(self):
+        await self.redis_client._round_trip()
+        for key, value in self.commands:
+            self.redis_client.store[key] = value
+        return [True] * len(self.commands)
+
+
+async def legacy_update_player_deltas(worker: LiveGameWorker, game_id: str, current_stats: Dict[str, Dict]) -> List[Dict]:
+    """The original one-GET-one-SETEX-per-player loop, kept for comparison"""
+    deltas = []
+    for player_id, player_data in current_stats.items():
+        cache_key = f"player_stats:{game_id}:{player_id}"
+        previous_data = await worker.redis_client.get(cache_key)
+        if previous_data:
+            previous_stats = json.loads(previous_data)
+            stat_deltas = {}
+            for stat_name, current_value in player_data['stats'].items():
+                previous_value = previous_stats.get('stats', {}).get(stat_name, 0)
+                if current_value != previous_value:
+                    stat_deltas[stat_name] = current_value - previous_value
+            if stat_deltas:
+                current_points = worker.calculate_fantasy_points(player_data['stats'])
+                previous_points = worker.calculate_fantasy_points(previous_stats.get('stats', {}))
+                deltas.append({
+                    'player_id': player_id,
+                    'player_name': player_data['name'],
+                    'stat_deltas': stat_deltas,
+                    'fantasy_points_delta': round(current_points - previous_points, 2),
+                    'total_fantasy_points': current_points,
+                    'timestamp': datetime.now(timezone.utc).isoformat()
+                })
+        await worker.redis_client.setex(cache_key, PLAYER_STATS_TTL, json.dumps(player_data))
+    return deltas
+
+
+def make_slate(games: int, players: int, rng: random.Random) -> Dict[str, Dict[str, Dict]]:
+    slate = {}
+    for g in range(games):
+        slate[f"game{g}"] = {
+            f"{g}-{p}": {
+                'name': f"Player {g}-{p}",
+                'stats': {
+                    'passing_yards': rng.randint(0, 300),
+                    'rushing_yards': rng.randint(0, 120),
+                    'receiving_yards': rng.randint(0, 120),
+                    'rushing_tds': rng.randint(0, 2),
+                }
+            }
+            for p in range(players)
+        }
+    return slate
+
+
+def advance_slate(slate: Dict[str, Dict[str, Dict]], change_rate: float, rng: random.Random) -> Dict[str, Dict[str, Dict]]:
+    advanced = {}
+    for game_id, players in slate.items():
+        advanced[game_id] = {}
+        for player_id, data in players.items():
+            stats = dict(data['stats'])
+            if rng.random() < change_rate:
+                stats['rushing_yards'] += rng.randint(1, 15)
+            advanced[game_id][player_id] = {'name': data['name'], 'stats': stats}
+    return advanced
+
+
+async def run_cycle(worker: LiveGameWorker, update, slate) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(update(game_id, stats) for game_id, stats in slate.items()))
+    return time.perf_counter() - start
+
+
+async def bench(games: int, players: int, rtt_ms: float, change_rate: float):
+    rng = random.Random(7)
+    first = make_slate(games, players, rng)
+    second = advance_slate(first, change_rate, rng)
+
+    results = {}
+    for label in ('per-player', 'pipelined'):
+        worker = LiveGameWorker()
+        worker.redis_client = worker.snapshot_redis = CountingRedis(rtt_ms / 1000)
+        if label == 'per-player':
+            update = lambda game_id, stats, w=worker: legacy_update_player_deltas(w, game_id, stats)
+        else:
+            update = worker.update_player_deltas
+
+        await run_cycle(worker, update, first)
+        worker.redis_client.round_trips = 0
+        elapsed = await run_cycle(worker, update, second)
+        results[label] = (worker.redis_client.round_trips, elapsed)
+
+    print(f"{games} games x {players} players, {rtt_ms}ms RTT, {change_rate:.0%} of players changed")
+    for label, (round_trips, elapsed) in results.items():
+        print(f"  {label:<11} {round_trips:>7} round trips  {elapsed * 1000:>9.1f} ms/cycle")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=40)
+    parser.add_argument('--players', type=int, default=80)
+    parser.add_argument('--rtt-ms', type=float, default=0.5)
+    parser.add_argument('--change-rate', type=float, default=0.1)
+    args = parser.parse_args()
+    asyncio.run(bench(args.games, args.players, args.rtt_ms, args.change_rate))
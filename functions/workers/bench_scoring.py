@@ -0,0 +1,73 @@
+"""
+Micro-benchmark: calc_points config walk vs compiled ScoringPlan
+
+Times one scoring call per stat line for every preset, before (the
+original calc_points walking the full config, including its second pass
+over field goal keys, as ScoringSystem.calculate used to call it) and
+after (ScoringSystem.calculate running its compiled plan).
+
+Usage: python bench_scoring.py [--number 20000]
+"""
+
+import argparse
+import timeit
+
+from typing import Dict
+
+from scoring import (
+    SCORING_PRESETS,
+    ScoringSystem,
+    _calculate_bonuses,
+    _calculate_defense_points,
+    _calculate_defense_yards,
+)
+
+STAT_LINES = {
+    "qb": {"passing_yards": 325, "passing_tds": 3, "passing_ints": 1, "rushing_yards": 15},
+    "rb": {"rushing_yards": 112, "rushing_tds": 1, "receiving_yards": 38, "receiving_receptions": 4},
+    "wr": {"receiving_yards": 141, "receiving_tds": 2, "receiving_receptions": 9},
+    "k": {"fg_made_30_39": 1, "fg_made_40_49": 2, "fg_missed_50_plus": 1, "pat_made": 3},
+    "def": {"def_sacks": 3, "def_ints": 1, "def_points_allowed": 17, "def_yards_allowed": 312},
+}
+
+FIELD_GOAL_KEYS = (
+    "fg_made_0_19", "fg_made_20_29", "fg_made_30_39", "fg_made_40_49", "fg_made_50_plus",
+    "fg_missed_0_19", "fg_missed_20_29", "fg_missed_30_39", "fg_missed_40_49", "fg_missed_50_plus",
+)
+
+
+def baseline_calc_points(stats: Dict[str, int], scoring_cfg: Dict[str, float]) -> float:
+    """calc_points as it was before compiled plans (field goals scored twice)"""
+    total_points = 0.0
+    for stat_name, stat_value in stats.items():
+        if stat_name in scoring_cfg and stat_value:
+            total_points += stat_value * scoring_cfg[stat_name]
+    total_points += _calculate_defense_points(stats, scoring_cfg)
+    total_points += _calculate_defense_yards(stats, scoring_cfg)
+    for stat_key in FIELD_GOAL_KEYS:
+        if stat_key in stats:
+            total_points += stats[stat_key] * scoring_cfg.get(stat_key, 0)
+    total_points += _calculate_bonuses(stats, scoring_cfg)
+    return round(total_points, 2)
+
+
+def bench(number: int):
+    print(f"{'preset':<16}{'before us/call':>16}{'after us/call':>16}{'speedup':>10}")
+    for preset, config in SCORING_PRESETS.items():
+        system = ScoringSystem(preset)
+        lines = list(STAT_LINES.values())
+
+        before = timeit.timeit(lambda: [baseline_calc_points(stats, config) for stats in lines], number=number)
+        after = timeit.timeit(lambda: [system.calculate(stats) for stats in lines], number=number)
+
+        calls = number * len(lines)
+        before_us = before / calls * 1e6
+        after_us = after / calls * 1e6
+        print(f"{preset:<16}{before_us:>16.2f}{after_us:>16.2f}{before_us / after_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+    bench(args.number)
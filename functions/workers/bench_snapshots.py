@@ -0,0 +1,129 @@
+"""
+Benchmark: JSON vs binary player snapshots across a full slate
+
+Builds one snapshot per athlete for a synthetic Saturday slate (ESPN-shaped
+boxscores through the real parser, point totals for every scoring preset)
+and compares the legacy JSON encoding with snapshot.py: payload bytes per
+slate, encode and decode time per slate, and with --redis-url the memory
+Redis reports for the keys (MEMORY USAGE, so per-key overhead included).
+
+Usage: python bench_snapshots.py [--games 60] [--number 20]
+                                 [--redis-url redis://localhost:6379/15]
+"""
+
+import argparse
+import asyncio
+import json
+import timeit
+from typing import Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+
+from bench_boxscore import synthetic_summary
+from boxscore import parse_boxscore
+from scoring import SCORING_PRESETS, ScoringEngine
+from snapshot import decode_snapshot, encode_snapshot, names_key, snapshot_key
+
+# (game id, player id, name, stats, points)
+SlateRow = Tuple[str, str, str, Dict[str, int], Dict[str, float]]
+
+
+def make_slate(games: int) -> List[SlateRow]:
+    engine = ScoringEngine()
+    for name, config in SCORING_PRESETS.items():
+        if config:
+            engine.register(name, config)
+    rows = []
+    for g in range(games):
+        for player_id, data in parse_boxscore(synthetic_summary(seed=g)).to_dict().items():
+            rows.append((f"game{g}", player_id, data['name'], data['stats'], engine.score(data['stats'])))
+    return rows
+
+
+def encode_json(rows: List[SlateRow]) -> List[bytes]:
+    return [
+        json.dumps({'name': name, 'stats': stats, 'points': points}).encode()
+        for _, _, name, stats, points in rows
+    ]
+
+
+def decode_json(payloads: List[bytes]):
+    for payload in payloads:
+        previous = json.loads(payload)
+        previous.get('stats', {}), previous.get('points')
+
+
+def encode_binary(rows: List[SlateRow]) -> List[bytes]:
+    return [encode_snapshot(stats, points) for _, _, _, stats, points in rows]
+
+
+def decode_binary(payloads: List[bytes]):
+    for payload in payloads:
+        decode_snapshot(payload)
+
+
+def names_bytes(rows: List[SlateRow]) -> int:
+    """Field and value bytes of the per-game player_names hashes"""
+    return sum(len(player_id.encode()) + len(name.encode()) for _, player_id, name, _, _ in rows)
+
+
+async def redis_memory(redis_url: str, rows: List[SlateRow],
+                       json_payloads: List[bytes], binary_payloads: List[bytes]) -> Dict[str, int]:
+    client = redis.from_url(redis_url)
+    await client.flushdb()
+    usage = {}
+    for label, payloads in (('json', json_payloads), ('binary', binary_payloads)):
+        async with client.pipeline(transaction=False) as pipe:
+            for (game_id, player_id, name, _, _), payload in zip(rows, payloads):
+                pipe.set(snapshot_key(game_id, player_id), payload)
+                if label == 'binary':
+                    pipe.hset(names_key(game_id), player_id, name)
+            await pipe.execute()
+        keys = [key async for key in client.scan_iter(count=1000)]
+        async with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.memory_usage(key)
+            usage[label] = sum(await pipe.execute())
+        await client.flushdb()
+    await client.aclose()
+    return usage
+
+
+def best_of(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def bench(games: int, number: int, redis_url: Optional[str]):
+    rows = make_slate(games)
+    json_payloads = encode_json(rows)
+    binary_payloads = encode_binary(rows)
+    for payload, (_, _, _, stats, points) in zip(binary_payloads, rows):
+        assert decode_snapshot(payload) == (stats, points)
+
+    plans = len(rows[0][4])
+    json_bytes = sum(map(len, json_payloads))
+    binary_bytes = sum(map(len, binary_payloads)) + names_bytes(rows)
+    print(f"{games} games, {len(rows)} snapshots, {plans} scoring plans each")
+    print(f"{'':<8}{'bytes/key':>10}{'slate KB':>10}{'encode ms':>11}{'decode ms':>11}")
+    for label, size, encode, decode, payloads in (
+        ('json', json_bytes, encode_json, decode_json, json_payloads),
+        ('binary', binary_bytes, encode_binary, decode_binary, binary_payloads),
+    ):
+        encode_ms = best_of(lambda: encode(rows), number) * 1000
+        decode_ms = best_of(lambda: decode(payloads), number) * 1000
+        print(f"{label:<8}{size / len(rows):>10.1f}{size / 1024:>10.1f}{encode_ms:>11.2f}{decode_ms:>11.2f}")
+    print(f"binary is {binary_bytes / json_bytes:.0%} of JSON (names counted once per game)")
+
+    if redis_url:
+        usage = asyncio.run(redis_memory(redis_url, rows, json_payloads, binary_payloads))
+        print(f"Redis MEMORY USAGE: json {usage['json'] / 1024:.1f} KB, "
+              f"binary {usage['binary'] / 1024:.1f} KB ({usage['binary'] / usage['json']:.0%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=60)
+    parser.add_argument('--number', type=int, default=20)
+    parser.add_argument('--redis-url', help='Local Redis to measure key memory in (flushed!)')
+    args = parser.parse_args()
+    bench(args.games, args.number, args.redis_url)
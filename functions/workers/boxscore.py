@@ -0,0 +1,167 @@
+"""
+Table-driven ESPN boxscore parser
+
+ESPN's summary payload lists players per stat category, each with a
+`labels` header and a positional `stats` row. Instead of hard-coding
+positions, STAT_COLUMNS maps (category, label) to our stat names, and the
+column plan for a category is resolved from its labels once and cached.
+Parsed values go into one fixed-width int array per player, with player
+ids interned per game, and are only turned into dicts at the edge.
+"""
+
+from array import array
+from typing import Dict, List, Optional, Tuple, Union
+
+# (category, label) -> stat name, or (made, missed) names for "made/att" columns
+STAT_COLUMNS: Dict[Tuple[str, str], Union[str, Tuple[str, str]]] = {
+    ('passing', 'YDS'): 'passing_yards',
+    ('passing', 'TD'): 'passing_tds',
+    ('passing', 'INT'): 'passing_ints',
+    ('rushing', 'YDS'): 'rushing_yards',
+    ('rushing', 'TD'): 'rushing_tds',
+    ('receiving', 'REC'): 'receiving_receptions',
+    ('receiving', 'YDS'): 'receiving_yards',
+    ('receiving', 'TD'): 'receiving_tds',
+    # ESPN does not say which play a fumble came from; most are ball carriers'
+    ('fumbles', 'LOST'): 'rushing_fumbles_lost',
+    ('interceptions', 'INT'): 'def_ints',
+    ('interceptions', 'TD'): 'def_tds',
+    # Boxscores only give made/attempted totals; distance buckets need play-by-play
+    ('kicking', 'FG'): ('fg_made', 'fg_missed'),
+    ('kicking', 'XP'): ('pat_made', 'pat_missed'),
+}
+
+STAT_NAMES: Tuple[str, ...] = tuple(sorted({
+    name
+    for target in STAT_COLUMNS.values()
+    for name in ((target,) if isinstance(target, str) else target)
+}))
+STAT_SLOTS: Dict[str, int] = {name: slot for slot, name in enumerate(STAT_NAMES)}
+
+# Column plan: (column index, slot, missed slot or -1 for plain columns)
+ColumnPlan = Tuple[Tuple[int, int, int], ...]
+
+_plan_cache: Dict[Tuple[str, Tuple[str, ...]], ColumnPlan] = {}
+
+# Present-slot bitmask -> ((slot, name), ...), so to_dict skips absent stats
+_mask_cache: Dict[int, Tuple[Tuple[int, str], ...]] = {}
+
+_EMPTY_ROW = array('i', [0] * len(STAT_NAMES))
+
+
+def resolve_columns(category: str, labels: List[str]) -> ColumnPlan:
+    """Column plan for a category's label header, cached across games"""
+    cache_key = (category, tuple(labels))
+    plan = _plan_cache.get(cache_key)
+    if plan is None:
+        columns = []
+        for index, label in enumerate(labels):
+            target = STAT_COLUMNS.get((category, label))
+            if target is None:
+                continue
+            if isinstance(target, str):
+                columns.append((index, STAT_SLOTS[target], -1))
+            else:
+                columns.append((index, STAT_SLOTS[target[0]], STAT_SLOTS[target[1]]))
+        plan = _plan_cache[cache_key] = tuple(columns)
+    return plan
+
+
+def _to_int(raw) -> int:
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        try:
+            return int(float(raw))
+        except (TypeError, ValueError):
+            return 0  # "--" and other placeholders
+
+
+class GameStats:
+    """Per-game stat table: interned player ids and one int array per player"""
+
+    __slots__ = ('player_ids', 'names', 'index', 'values', 'present')
+
+    def __init__(self):
+        self.player_ids: List[str] = []
+        self.names: List[Optional[str]] = []
+        self.index: Dict[str, int] = {}
+        self.values: List[array] = []
+        # Bitmask of the stat slots each player has a column for
+        self.present: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
+
+    def row(self, player_id: str, name: Optional[str]) -> int:
+        row = self.index.get(player_id)
+        if row is None:
+            row = self.index[player_id] = len(self.player_ids)
+            self.player_ids.append(player_id)
+            self.names.append(name)
+            self.values.append(array('i', _EMPTY_ROW))
+            self.present.append(0)
+        return row
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """The {player_id: {'name', 'stats'}} shape used by update_player_deltas"""
+        result = {}
+        for player_id, name, values, present in zip(self.player_ids, self.names, self.values, self.present):
+            slots = _mask_cache.get(present)
+            if slots is None:
+                slots = _mask_cache[present] = tuple(
+                    (slot, stat) for slot, stat in enumerate(STAT_NAMES) if present >> slot & 1
+                )
+            result[player_id] = {
+                'name': name,
+                'stats': {stat: values[slot] for slot, stat in slots}
+            }
+        return result
+
+
+def parse_boxscore(boxscore: Dict) -> GameStats:
+    """Parse an ESPN summary payload into a GameStats table"""
+    game = GameStats()
+    rows = game.index
+    teams = (boxscore.get('boxscore') or {}).get('players') or []
+
+    for team in teams:
+        for category in team.get('statistics') or []:
+            plan = resolve_columns(category.get('name', ''), category.get('labels') or [])
+            if not plan:
+                continue
+
+            for player in category.get('athletes') or []:
+                athlete = player.get('athlete') or {}
+                player_id = athlete.get('id')
+                if not player_id:
+                    continue
+
+                row = rows.get(player_id)
+                if row is None:
+                    row = game.row(player_id, athlete.get('displayName'))
+                values = game.values[row]
+                present = game.present[row]
+                stats = player.get('stats') or []
+                width = len(stats)
+
+                for column, slot, missed_slot in plan:
+                    if column >= width:
+                        continue
+                    raw = stats[column]
+                    if missed_slot < 0:
+                        try:
+                            values[slot] = int(raw)
+                        except (TypeError, ValueError):
+                            values[slot] = _to_int(raw)
+                        present |= 1 << slot
+                    else:
+                        made, _, attempts = str(raw).partition('/')
+                        made = _to_int(made)
+                        values[slot] = made
+                        values[missed_slot] = max(_to_int(attempts) - made, 0)
+                        present |= 1 << slot | 1 << missed_slot
+
+                game.present[row] = present
+
+    return game
@@ -0,0 +1,75 @@
+"""
+Warm-start checkpoints for the live worker
+
+The worker periodically saves what it would otherwise have to relearn after
+a deploy or crash: the slate (tracked games with their CFBD -> ESPN ids,
+finished games, when the list is next due for a refresh) and, per game, the
+conditional-request validators, last payload hash, backoff and scheduler
+state. On startup it restores them, so the first cycle is an ordinary
+incremental one: games come back at their old due times, unchanged
+boxscores short-circuit on 304s and payload hashes, and backing-off games
+stay backed off.
+
+Per-game state lives in one Redis hash keyed by ESPN event id, so shards
+write only the games they poll and a shard that takes a game over inherits
+its state. Everything expires after a day, and the worker ignores a slate that
+was already due for a refresh.
+"""
+
+import json
+import time
+from typing import Dict, Optional, Tuple
+
+from metrics import MetricsRegistry
+
+KEY_PREFIX = 'live_worker:checkpoint'
+
+# How often the worker saves, and how long a checkpoint outlives its writer
+CHECKPOINT_INTERVAL_SECONDS = 30
+CHECKPOINT_TTL_SECONDS = 86400
+
+
+class CheckpointStore:
+    """Slate and per-game worker state in Redis"""
+
+    def __init__(self, redis_client, prefix: str = KEY_PREFIX,
+                 ttl: int = CHECKPOINT_TTL_SECONDS,
+                 metrics: Optional[MetricsRegistry] = None):
+        self.redis = redis_client
+        self.slate_key = f"{prefix}:slate"
+        self.games_key = f"{prefix}:games"
+        self.ttl = ttl
+
+        metrics = metrics or MetricsRegistry()
+        self.save_seconds = metrics.histogram(
+            'live_worker_checkpoint_seconds', 'Time to write a warm-start checkpoint'
+        )
+
+    async def save(self, slate: Optional[Dict], games: Dict[str, Dict]):
+        """Write the slate (when given) and merge in this worker's per-game state"""
+        started = time.perf_counter()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            if slate is not None:
+                pipe.set(self.slate_key, json.dumps({**slate, 'saved_at': time.time()}), ex=self.ttl)
+            if games:
+                pipe.hset(self.games_key, mapping={
+                    game_id: json.dumps(state) for game_id, state in games.items()
+                })
+                pipe.expire(self.games_key, self.ttl)
+            await pipe.execute()
+        self.save_seconds.observe(time.perf_counter() - started)
+
+    async def load(self) -> Tuple[Optional[Dict], Dict[str, Dict]]:
+        """The saved slate (None if there is none) and per-game state"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.get(self.slate_key)
+            pipe.hgetall(self.games_key)
+            raw_slate, raw_games = await pipe.execute()
+        slate = json.loads(raw_slate) if raw_slate else None
+        games = {game_id: json.loads(state) for game_id, state in (raw_games or {}).items()}
+        return slate, games
+
+    async def forget(self, game_ids):
+        """Drop per-game state for games no longer on the slate"""
+        if game_ids:
+            await self.redis.hdel(self.games_key, *game_ids)
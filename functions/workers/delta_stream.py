@@ -0,0 +1,235 @@
+"""
+Redis Streams log of live stat deltas
+
+The poll loop appends each game's deltas to the slate's stream (one stream
+per UTC day, trimmed to an approximate length and expired after a few days)
+and moves on. Consumers (the Appwrite publisher first; projections,
+notifications and leaderboards later) each read through their own
+consumer group, ack what they've handled, and pick up entries left pending
+by a consumer that died. A slow consumer only grows its group's pending
+list; ingestion never waits for it. The log can be replayed from any id
+with read_range or by moving a group's cursor with reset_group.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Callable, Collection, Dict, List, Optional, Tuple
+
+from metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+STREAM_PREFIX = 'live_worker:deltas'
+
+# Approximate cap per slate stream, and how long a slate's log is kept
+STREAM_MAXLEN = 100_000
+STREAM_TTL_SECONDS = 3 * 86400
+
+# Consumer defaults: entries per read, how long a read blocks, and when a
+# pending entry is considered abandoned by its consumer (a consumer retries
+# its own pending entries on every poll)
+READ_COUNT = 200
+READ_BLOCK_MS = 1000
+CLAIM_IDLE_MS = 60_000
+# Entries that keep failing are logged and acked instead of retried forever
+MAX_DELIVERIES = 5
+
+# (entry id, decoded entry)
+StreamEntry = Tuple[str, Dict]
+# Returns the ids of entries it failed to handle (None when all succeeded)
+EntryHandler = Callable[[List[StreamEntry]], Awaitable[Optional[Collection[str]]]]
+
+
+def stream_key(day: Optional[str] = None) -> str:
+    day = day or datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    return f"{STREAM_PREFIX}:{day}"
+
+
+def live_stream_keys() -> List[str]:
+    """Yesterday's and today's slate streams, so a rollover never strands entries"""
+    today = datetime.now(timezone.utc).date()
+    return [stream_key((today - timedelta(days=1)).isoformat()), stream_key(today.isoformat())]
+
+
+def decode_entry(fields: Dict[str, str]) -> Dict:
+    return {
+        'game_id': fields['game_id'],
+        'deltas': json.loads(fields['deltas']),
+        'groups': json.loads(fields.get('groups') or '[]'),
+        'timestamp': fields.get('timestamp'),
+    }
+
+
+class DeltaStream:
+    """Producer side: append one entry per game poll"""
+
+    def __init__(self, redis_client, maxlen: int = STREAM_MAXLEN,
+                 metrics: Optional[MetricsRegistry] = None):
+        self.redis = redis_client
+        self.maxlen = maxlen
+        metrics = metrics or MetricsRegistry()
+        self.appended = metrics.counter(
+            'live_worker_stream_entries_total', 'Delta entries appended to the slate stream'
+        )
+
+    async def append(self, game_id: str, deltas: List[Dict], groups: List[Dict]) -> str:
+        key = stream_key()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.xadd(key, {
+                'game_id': game_id,
+                'deltas': json.dumps(deltas),
+                'groups': json.dumps(groups),
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+            }, maxlen=self.maxlen, approximate=True)
+            pipe.expire(key, STREAM_TTL_SECONDS)
+            entry_id, _ = await pipe.execute()
+        self.appended.inc()
+        return entry_id
+
+    async def read_range(self, day: Optional[str] = None, start: str = '-', end: str = '+',
+                         page: int = 1000) -> AsyncIterator[StreamEntry]:
+        """Replay a slate's log in order, paging through XRANGE"""
+        key = stream_key(day)
+        while True:
+            entries = await self.redis.xrange(key, min=start, max=end, count=page)
+            for entry_id, fields in entries:
+                yield entry_id, decode_entry(fields)
+            if len(entries) < page:
+                return
+            start = f"({entries[-1][0]}"
+
+
+class StreamConsumer:
+    """One member of a consumer group over the live slate streams
+
+    handler gets a batch of decoded entries; the batch is acked when it
+    returns and left pending (to be retried or claimed) when it raises.
+    A handler can also return the ids of the entries it failed on, and
+    only those are left pending.
+    """
+
+    def __init__(self, redis_client, group: str, consumer: str, handler: EntryHandler,
+                 metrics: Optional[MetricsRegistry] = None,
+                 count: int = READ_COUNT, block_ms: int = READ_BLOCK_MS):
+        self.redis = redis_client
+        self.group = group
+        self.consumer = consumer
+        self.handler = handler
+        self.count = count
+        self.block_ms = block_ms
+        self._groups_ready: set = set()
+        self._task: Optional[asyncio.Task] = None
+
+        metrics = metrics or MetricsRegistry()
+        self.handled = metrics.counter(
+            'live_worker_stream_consumed_total', 'Stream entries handled by consumer group'
+        )
+        self.pending = metrics.gauge(
+            'live_worker_stream_pending', 'Entries delivered to a consumer group but not yet acked'
+        )
+        self.handle_seconds = metrics.histogram(
+            'live_worker_stream_handle_seconds', 'Consumer handler time per batch'
+        )
+
+    async def ensure_group(self, key: str):
+        if key in self._groups_ready:
+            return
+        try:
+            # New groups start at the beginning of the slate, so nothing already
+            # logged is skipped
+            await self.redis.xgroup_create(key, self.group, id='0', mkstream=True)
+        except Exception as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+        self._groups_ready.add(key)
+
+    async def reset_group(self, key: str, entry_id: str = '0'):
+        """Move the group's cursor back to replay the log from entry_id"""
+        await self.ensure_group(key)
+        await self.redis.xgroup_setid(key, self.group, entry_id)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Stream consumer {self.group}/{self.consumer} failed: {e}")
+                await asyncio.sleep(1)
+
+    async def poll_once(self) -> int:
+        """Retry own pending entries, claim abandoned ones, read new ones; returns entries handled"""
+        keys = live_stream_keys()
+        for key in keys:
+            await self.ensure_group(key)
+
+        handled = 0
+        # Id 0 re-reads this consumer's pending entries, e.g. the ones the
+        # handler failed on last poll, without waiting for CLAIM_IDLE_MS
+        response = await self.redis.xreadgroup(
+            self.group, self.consumer, {key: '0' for key in keys}, count=self.count
+        )
+        for key, entries in response or []:
+            if entries:
+                handled += await self._handle(key, entries, retried=True)
+
+        for key in keys:
+            _, claimed, *_ = await self.redis.xautoclaim(
+                key, self.group, self.consumer, min_idle_time=CLAIM_IDLE_MS, count=self.count
+            )
+            if claimed:
+                handled += await self._handle(key, claimed, retried=True)
+
+        response = await self.redis.xreadgroup(
+            self.group, self.consumer, {key: '>' for key in keys},
+            count=self.count, block=self.block_ms
+        )
+        for key, entries in response or []:
+            handled += await self._handle(key, entries)
+
+        for key in keys:
+            summary = await self.redis.xpending(key, self.group)
+            self.pending.set(summary['pending'], group=self.group, stream=key)
+        return handled
+
+    async def _handle(self, key: str, entries: List, retried: bool = False) -> int:
+        if retried:
+            entries = await self._drop_poison(key, entries)
+        if not entries:
+            return 0
+        batch = [(entry_id, decode_entry(fields)) for entry_id, fields in entries if fields]
+        started = asyncio.get_running_loop().time()
+        failed = set(await self.handler(batch) or ())
+        self.handle_seconds.observe(asyncio.get_running_loop().time() - started, group=self.group)
+        done = [entry_id for entry_id, _ in entries if entry_id not in failed]
+        if done:
+            await self.redis.xack(key, self.group, *done)
+        self.handled.inc(len(done), group=self.group)
+        return len(done)
+
+    async def _drop_poison(self, key: str, entries: List) -> List:
+        """Ack and skip entries that have failed MAX_DELIVERIES times"""
+        details = await self.redis.xpending_range(
+            key, self.group, min=entries[0][0], max=entries[-1][0], count=len(entries)
+        )
+        deliveries = {item['message_id']: item['times_delivered'] for item in details}
+        poison = [entry_id for entry_id, _ in entries if deliveries.get(entry_id, 0) > MAX_DELIVERIES]
+        if poison:
+            logger.error(f"Dropping {len(poison)} entries from {key} after {MAX_DELIVERIES} failed deliveries")
+            await self.redis.xack(key, self.group, *poison)
+        return [entry for entry in entries if entry[0] not in poison]
@@ -0,0 +1,221 @@
+"""
+CFBD game id -> ESPN event id resolution
+
+ESPN's summary endpoint needs ESPN's own event id, which CFBD doesn't carry.
+The resolver fetches ESPN's scoreboard once per date, matches events to CFBD
+games by normalized team names (folded through the alias files in
+TEAM_ALIASES_DIR, the repo's /data by default), and keeps every match in a
+small SQLite index next to the worker, so a restart only resolves games it
+hasn't seen. Lookups are a dict read.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+import unicodedata
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+ESPN_SCOREBOARD_URL = 'https://site.api.espn.com/apis/site/v2/sports/football/college-football/scoreboard'
+
+# Directory holding the alias files: the repo's data dir by default, the
+# copies baked into the image (see Dockerfile) in the container
+DATA_DIR = os.environ.get(
+    'TEAM_ALIASES_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data')
+)
+ALIAS_FILES = ('team_aliases.json', 'team_aliases_expanded.json', 'teams_map.json')
+
+# A scoreboard is fetched once per date, and again only if games on it are
+# still unmatched after this long (late-added or rescheduled games)
+SCOREBOARD_RETRY_SECONDS = 6 * 3600
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Lowercase ASCII words: "San José State" -> "san jose state", "Texas A&M" -> "texas a m" """
+    folded = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode()
+    return _NON_ALNUM.sub(' ', folded.lower()).strip()
+
+
+def load_team_aliases(data_dir: str = DATA_DIR) -> Dict[str, str]:
+    """Normalized alias -> normalized canonical school name"""
+    aliases: Dict[str, str] = {}
+    loaded = 0
+    for filename in ALIAS_FILES:
+        try:
+            with open(os.path.join(data_dir, filename)) as f:
+                mapping = json.load(f)
+        except OSError:
+            continue
+        except ValueError as e:
+            logger.warning(f"Skipping unreadable team alias file {filename}: {e}")
+            continue
+        loaded += 1
+        for alias, canonical in mapping.items():
+            if alias.startswith('__'):
+                continue
+            if filename == 'teams_map.json':
+                # School name -> internal code: the code is the alias
+                alias, canonical = canonical, alias
+            aliases.setdefault(normalize_name(alias), normalize_name(canonical))
+    if not loaded:
+        logger.warning(f"No team alias files found in {os.path.abspath(data_dir)}; "
+                       f"matching ESPN events by plain team names (set TEAM_ALIASES_DIR)")
+    return aliases
+
+
+class EventIdResolver:
+    """Persistent CFBD -> ESPN event id index"""
+
+    def __init__(self, http_client: httpx.AsyncClient, index_path: str,
+                 aliases: Optional[Dict[str, str]] = None):
+        self.http_client = http_client
+        self.aliases = load_team_aliases() if aliases is None else aliases
+        self.db = sqlite3.connect(index_path)
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS event_ids (cfbd_id TEXT PRIMARY KEY, espn_id TEXT NOT NULL, resolved_at REAL)'
+        )
+        self.db.commit()
+        self.event_ids: Dict[str, str] = dict(self.db.execute('SELECT cfbd_id, espn_id FROM event_ids'))
+        # Scoreboards fetched by this process: date -> fetched at, plus per-date
+        # (team pair -> event) and (team -> event) indexes
+        self.scoreboards: Dict[str, float] = {}
+        self.pairs: Dict[Tuple[str, str, str], str] = {}
+        self.teams: Dict[Tuple[str, str], Optional[str]] = {}
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self.event_ids)
+
+    def get(self, cfbd_id) -> Optional[str]:
+        return self.event_ids.get(str(cfbd_id))
+
+    def canonical(self, name: Optional[str]) -> str:
+        normalized = normalize_name(name)
+        return self.aliases.get(normalized, normalized)
+
+    async def resolve(self, cfbd_games: List[Dict]) -> Dict[str, str]:
+        """Resolve whatever isn't indexed yet; returns CFBD id -> ESPN id for the given games"""
+        async with self._lock:
+            pending = [game for game in cfbd_games if str(game.get('id')) not in self.event_ids]
+            if pending:
+                await self._resolve(pending)
+        return {
+            str(game.get('id')): self.event_ids[str(game.get('id'))]
+            for game in cfbd_games if str(game.get('id')) in self.event_ids
+        }
+
+    async def _resolve(self, games: List[Dict]):
+        # ESPN files games under the US date, so a late kickoff on UTC day D
+        # can be on the scoreboard for D - 1
+        days = set()
+        for game in games:
+            kickoff = self._kickoff_day(game)
+            if kickoff:
+                days.update((kickoff, kickoff - timedelta(days=1)))
+        for day in sorted(days):
+            fetched_at = self.scoreboards.get(day.isoformat())
+            if fetched_at is None or time.time() - fetched_at > SCOREBOARD_RETRY_SECONDS:
+                await self._fetch_scoreboard(day)
+
+        resolved = []
+        for game in games:
+            espn_id = self._match(game)
+            if espn_id:
+                resolved.append((str(game.get('id')), espn_id, time.time()))
+            else:
+                logger.warning(
+                    f"No ESPN event for CFBD game {game.get('id')}: "
+                    f"{game.get('away_team')} @ {game.get('home_team')}"
+                )
+        self._store(resolved)
+
+    @staticmethod
+    def _kickoff_day(game: Dict) -> Optional[date]:
+        try:
+            return date.fromisoformat((game.get('start_date') or '')[:10])
+        except ValueError:
+            return None
+
+    def _match(self, game: Dict) -> Optional[str]:
+        day = self._kickoff_day(game)
+        if day is None:
+            return None
+        home = self.canonical(game.get('home_team'))
+        away = self.canonical(game.get('away_team'))
+        for scoreboard_day in (day.isoformat(), (day - timedelta(days=1)).isoformat()):
+            # Neutral-site games may list home/away either way round
+            espn_id = self.pairs.get((scoreboard_day, home, away)) or self.pairs.get((scoreboard_day, away, home))
+            if espn_id:
+                return espn_id
+            # One side spelled differently: accept if the other side is unambiguous
+            espn_id = self.teams.get((scoreboard_day, home)) or self.teams.get((scoreboard_day, away))
+            if espn_id:
+                return espn_id
+        return None
+
+    async def _fetch_scoreboard(self, day: date):
+        day_key = day.isoformat()
+        try:
+            response = await self.http_client.get(
+                ESPN_SCOREBOARD_URL,
+                params={'dates': day.strftime('%Y%m%d'), 'groups': '80', 'limit': '500'}
+            )
+            response.raise_for_status()
+            events = response.json().get('events') or []
+        except Exception as e:
+            logger.error(f"Error fetching ESPN scoreboard for {day_key}: {e}")
+            return
+        self.scoreboards[day_key] = time.time()
+
+        for event in events:
+            competitors = ((event.get('competitions') or [{}])[0]).get('competitors') or []
+            sides = {c.get('homeAway'): self._team_keys(c.get('team') or {}) for c in competitors}
+            if 'home' not in sides or 'away' not in sides:
+                continue
+            espn_id = str(event.get('id'))
+            for home in sides['home']:
+                for away in sides['away']:
+                    self.pairs[(day_key, home, away)] = espn_id
+            for keys in sides.values():
+                for key in keys:
+                    team_key = (day_key, key)
+                    # A team name seen in two events that day is ambiguous
+                    self.teams[team_key] = espn_id if self.teams.get(team_key, espn_id) == espn_id else None
+
+    def _team_keys(self, team: Dict) -> set:
+        return {
+            self.canonical(team.get(field))
+            for field in ('location', 'displayName', 'shortDisplayName')
+            if team.get(field)
+        }
+
+    def _store(self, resolved: List[Tuple[str, str, float]]):
+        if not resolved:
+            return
+        self.db.executemany(
+            'INSERT OR REPLACE INTO event_ids (cfbd_id, espn_id, resolved_at) VALUES (?, ?, ?)',
+            resolved
+        )
+        self.db.commit()
+        for cfbd_id, espn_id, _ in resolved:
+            self.event_ids[cfbd_id] = espn_id
+
+    def remember(self, event_ids: Dict[str, str]):
+        """Index ids resolved elsewhere (e.g. a checkpoint), keeping what's already known"""
+        self._store([
+            (str(cfbd_id), espn_id, time.time())
+            for cfbd_id, espn_id in event_ids.items() if str(cfbd_id) not in self.event_ids
+        ])
+
+    def close(self):
+        self.db.close()
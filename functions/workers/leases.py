@@ -0,0 +1,203 @@
+"""
+Redis leases for sharding tracked games across worker processes
+
+Every shard computes the same tracked game list, heartbeats into a shared
+member set, and claims the games it wins by rendezvous hashing over the
+live members. A claim is a SET NX lease with a TTL that the owner renews
+on every heartbeat; a shard polls a game only while it holds an unexpired
+lease, so each game has at most one poller. When a shard stops
+heartbeating it drops out of the member set after one TTL, its leases
+lapse, and the survivors' hashing hands its games out between them. A
+shard that joins takes over only the games it now wins.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Set
+
+from metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+LEASE_TTL_SECONDS = 30
+HEARTBEAT_INTERVAL_SECONDS = 10
+
+# Stop trusting a lease locally a little before Redis expires it
+LEASE_SAFETY_MARGIN = 0.8
+
+KEY_PREFIX = 'live_worker'
+
+# Renew the leases we still hold; return the keys we lost
+RENEW_SCRIPT = """
+local lost = {}
+for _, key in ipairs(KEYS) do
+  if redis.call('get', key) == ARGV[1] then
+    redis.call('pexpire', key, ARGV[2])
+  else
+    table.insert(lost, key)
+  end
+end
+return lost
+"""
+
+RELEASE_SCRIPT = """
+local released = 0
+for _, key in ipairs(KEYS) do
+  if redis.call('get', key) == ARGV[1] then
+    released = released + redis.call('del', key)
+  end
+end
+return released
+"""
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+def _weight(worker_id: str, game_id: str) -> bytes:
+    return hashlib.blake2b(f"{worker_id}:{game_id}".encode(), digest_size=8).digest()
+
+
+def rendezvous_owner(game_id: str, workers: Iterable[str]) -> Optional[str]:
+    """Highest-random-weight member for a game"""
+    return max(workers, key=lambda worker_id: _weight(worker_id, game_id), default=None)
+
+
+class GameLeaseManager:
+    """Claims, renews and releases this shard's game leases"""
+
+    def __init__(self, redis_client, worker_id: Optional[str] = None,
+                 ttl: float = LEASE_TTL_SECONDS,
+                 metrics: Optional[MetricsRegistry] = None):
+        self.redis = redis_client
+        self.worker_id = worker_id or default_worker_id()
+        self.ttl = ttl
+        self.members_key = f"{KEY_PREFIX}:workers"
+        self.shards_key = f"{KEY_PREFIX}:shards"
+        # game id -> local monotonic deadline for trusting the lease
+        self.owned: Dict[str, float] = {}
+        self.workers: List[str] = []
+        self._renew = self.redis.register_script(RENEW_SCRIPT)
+        self._release = self.redis.register_script(RELEASE_SCRIPT)
+        self._lock = asyncio.Lock()
+
+        metrics = metrics or MetricsRegistry()
+        self.games_owned = metrics.gauge(
+            'live_worker_shard_games_owned', 'Games this shard holds leases for'
+        )
+        self.live_workers = metrics.gauge(
+            'live_worker_shard_workers', 'Shards with a heartbeat inside the lease TTL'
+        )
+        self.lease_events = metrics.counter(
+            'live_worker_lease_events_total', 'Lease claims, releases and losses'
+        )
+        self.heartbeat_seconds = metrics.histogram(
+            'live_worker_lease_heartbeat_seconds', 'Time to heartbeat, renew and rebalance leases'
+        )
+
+    def lease_key(self, game_id: str) -> str:
+        return f"{KEY_PREFIX}:lease:{game_id}"
+
+    def owns(self, game_id: str) -> bool:
+        deadline = self.owned.get(game_id)
+        return deadline is not None and time.monotonic() < deadline
+
+    async def heartbeat(self, game_ids: Iterable[str]) -> Set[str]:
+        """Refresh membership and leases for the current game list; returns owned games"""
+        async with self._lock:
+            started = time.perf_counter()
+            game_ids = set(game_ids)
+            now = time.time()
+
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.zadd(self.members_key, {self.worker_id: now})
+                pipe.zrangebyscore(self.members_key, '-inf', now - self.ttl)
+                pipe.zremrangebyscore(self.members_key, '-inf', now - self.ttl)
+                pipe.zrange(self.members_key, 0, -1)
+                _, dead, _, members = await pipe.execute()
+            if dead:
+                await self.redis.hdel(self.shards_key, *dead)
+                logger.info(f"Shards expired: {', '.join(dead)}")
+            self.workers = sorted(members)
+
+            # Renew what we hold and notice anything that lapsed
+            deadline = time.monotonic() + self.ttl * LEASE_SAFETY_MARGIN
+            if self.owned:
+                held = list(self.owned)
+                lost_keys = set(await self._renew(
+                    keys=[self.lease_key(game_id) for game_id in held],
+                    args=[self.worker_id, int(self.ttl * 1000)]
+                ))
+                for game_id in held:
+                    if self.lease_key(game_id) in lost_keys:
+                        del self.owned[game_id]
+                        self.lease_events.inc(event='lost')
+                        logger.warning(f"Lost lease on {game_id}")
+                    else:
+                        self.owned[game_id] = deadline
+
+            # Hand back games that left the list or that another live shard now wins
+            desired = {
+                game_id for game_id in game_ids
+                if rendezvous_owner(game_id, self.workers) == self.worker_id
+            }
+            surplus = [game_id for game_id in self.owned if game_id not in desired]
+            if surplus:
+                await self._release(
+                    keys=[self.lease_key(game_id) for game_id in surplus],
+                    args=[self.worker_id]
+                )
+                for game_id in surplus:
+                    del self.owned[game_id]
+                self.lease_events.inc(len(surplus), event='released')
+
+            claims = [game_id for game_id in desired if game_id not in self.owned]
+            if claims:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for game_id in claims:
+                        pipe.set(self.lease_key(game_id), self.worker_id, nx=True, px=int(self.ttl * 1000))
+                    results = await pipe.execute()
+                claimed = [game_id for game_id, ok in zip(claims, results) if ok]
+                for game_id in claimed:
+                    self.owned[game_id] = deadline
+                self.lease_events.inc(len(claimed), event='claimed')
+                if claimed or surplus:
+                    logger.info(
+                        f"Shard {self.worker_id}: claimed {len(claimed)}, released {len(surplus)}, "
+                        f"holding {len(self.owned)} of {len(game_ids)} games across {len(self.workers)} shards"
+                    )
+
+            await self.redis.hset(self.shards_key, self.worker_id, json.dumps({
+                'games': sorted(self.owned),
+                'heartbeat': now,
+            }))
+            self.games_owned.set(len(self.owned))
+            self.live_workers.set(len(self.workers))
+            self.heartbeat_seconds.observe(time.perf_counter() - started)
+            return set(self.owned)
+
+    async def assignments(self) -> Dict[str, Dict]:
+        """Every live shard's games and last heartbeat, as published in Redis"""
+        shards = await self.redis.hgetall(self.shards_key)
+        return {worker_id: json.loads(value) for worker_id, value in shards.items()}
+
+    async def stop(self):
+        """Release everything so other shards can take over without waiting for the TTL"""
+        async with self._lock:
+            if self.owned:
+                await self._release(
+                    keys=[self.lease_key(game_id) for game_id in self.owned],
+                    args=[self.worker_id]
+                )
+                self.lease_events.inc(len(self.owned), event='released')
+                self.owned.clear()
+            await self.redis.zrem(self.members_key, self.worker_id)
+            await self.redis.hdel(self.shards_key, self.worker_id)
+            self.games_owned.set(0)
@@ -1,15 +1,30 @@
 import os
 import json
+import hashlib
 import asyncio
 import random
 import logging
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 import httpx
 import redis.asyncio as redis
 from appwrite.client import Client
-from appwrite.services.realtime import Realtime
-from appwrite.services.functions import Functions
+from appwrite.query import Query
+from appwrite.services.databases import Databases
+
+from boxscore import parse_boxscore
+from checkpoint import CHECKPOINT_INTERVAL_SECONDS, CheckpointStore
+from delta_stream import DeltaStream, StreamConsumer
+from event_ids import EventIdResolver
+from leases import HEARTBEAT_INTERVAL_SECONDS, GameLeaseManager, default_worker_id
+from metrics import CycleProfiler, MetricsRegistry, MetricsServer
+from publisher import PublishError, RealtimePublisher
+from scoring import ScoringEngine, config_from_league_rules, unknown_rule_keys
+from schedule import ScheduleCache, next_refresh_deadline
+from scheduler import GameState, PollScheduler, classify_game_state, parse_kickoff
+from snapshot import SnapshotCache, decode_snapshot, encode_snapshot, is_json_snapshot, names_key, snapshot_key
+from upstream import CLOSED, CircuitOpenError, GuardedTransport, backoff_delay, is_failure, load_policies, parse_retry_after
 
 # Configure logging
 logging.basicConfig(
@@ -25,42 +40,164 @@ APPWRITE_PROJECT_ID = os.environ.get('APPWRITE_PROJECT_ID')
 APPWRITE_API_KEY = os.environ.get('APPWRITE_API_KEY')
 APPWRITE_FUNCTIONS_ENDPOINT = os.environ.get('APPWRITE_FUNCTIONS_ENDPOINT')
 APPWRITE_FUNCTIONS_KEY = os.environ.get('APPWRITE_FUNCTIONS_KEY')
+APPWRITE_DATABASE_ID = os.environ.get('APPWRITE_DATABASE_ID', 'college-football-fantasy')
+LEAGUES_COLLECTION_ID = os.environ.get('LEAGUES_COLLECTION_ID', 'leagues')
 REDIS_URL = os.environ.get('REDIS_URL')
 FANTASY_SCORING_JSON = os.environ.get('FANTASY_SCORING_JSON', '{}')
 
+# On-disk copies of the CFBD calendar and weekly schedules
+SCHEDULE_CACHE_DIR = os.environ.get('SCHEDULE_CACHE_DIR', '/tmp/cfbd-schedule')
+
+# CFBD -> ESPN event id index, kept across restarts
+EVENT_ID_INDEX_PATH = os.environ.get('EVENT_ID_INDEX_PATH', os.path.join(SCHEDULE_CACHE_DIR, 'event_ids.sqlite3'))
+
+# Run as one of several shards that split games through Redis leases
+SHARDED = os.environ.get('LIVE_WORKER_SHARDED', '').lower() in ('1', 'true', 'yes')
+WORKER_ID = os.environ.get('LIVE_WORKER_ID')
+
+# How often the tracked game list is rebuilt from the schedule
+GAME_LIST_REFRESH_SECONDS = 3600
+
+# When set, every new ESPN payload is saved here for replay.py
+BOXSCORE_RECORD_DIR = os.environ.get('BOXSCORE_RECORD_DIR')
+
+# Player stat snapshots outlive any single game
+PLAYER_STATS_TTL = 86400  # 24 hours
+
+# Memory for the in-process copy of live games' snapshots (a full slate
+# needs a few MB); least recently polled games are evicted past it
+SNAPSHOT_CACHE_BYTES = int(os.environ.get('SNAPSHOT_CACHE_BYTES', str(64 * 1024 * 1024)))
+
+# Per-host rate limits and breaker thresholds over the upstream.py defaults,
+# e.g. {"site.api.espn.com": {"rate": 5, "burst": 10}}
+UPSTREAM_LIMITS_JSON = os.environ.get('UPSTREAM_LIMITS_JSON')
+
+# Per-game backoff after throttling or errors: full jitter, doubling to the cap
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 300
+
+# Polls allowed in flight at once, and the random delay spreading them out
+POLL_CONCURRENCY = int(os.environ.get('POLL_CONCURRENCY', '16'))
+POLL_JITTER_SECONDS = float(os.environ.get('POLL_JITTER_SECONDS', '4'))
+
+# Longest the main loop sleeps between scheduler checks
+MAX_IDLE_SECONDS = 30
+
+# How often scheduler metrics are logged
+METRICS_LOG_INTERVAL = 300
+
+# Prometheus-style /metrics endpoint; port 0 turns it off
+METRICS_HOST = os.environ.get('METRICS_HOST', '127.0.0.1')
+METRICS_PORT = int(os.environ.get('METRICS_PORT', '9464'))
+
+# cProfile every Nth polling cycle (0 = only when armed via GET /profile?cycles=N)
+PROFILE_EVERY_CYCLES = int(os.environ.get('PROFILE_EVERY_CYCLES', '0'))
+PROFILE_DIR = os.environ.get('PROFILE_DIR')
+
+# How often the event loop is probed for scheduling lag
+LOOP_LAG_INTERVAL = 0.5
+
+# Per-stage work is CPU-bound and mostly sub-millisecond
+STAGE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
 # Target conferences
 TARGET_CONFERENCES = {'SEC', 'ACC', 'Big 12', 'Big Ten'}
 
-# Parse fantasy scoring rules
-SCORING_RULES = json.loads(FANTASY_SCORING_JSON) if FANTASY_SCORING_JSON else {
-    'passing_yards': 0.04,
-    'passing_tds': 4,
-    'interceptions': -2,
-    'rushing_yards': 0.1,
-    'rushing_tds': 6,
-    'receiving_yards': 0.1,
-    'receiving_tds': 6,
-    'fumbles_lost': -2,
-    'two_point_conversions': 2,
-    'pat_made': 1,
-    'fg_made_0_39': 3,
-    'fg_made_40_49': 4,
-    'fg_made_50_plus': 5
-}
+# Worker-wide scoring config. FANTASY_SCORING_JSON is read like a league's
+# scoringRules (scoring.py stat names, commissioner names or the original
+# worker's keys) on top of the ESPN-style defaults.
+SCORING_RULES = json.loads(FANTASY_SCORING_JSON or '{}')
+SCORING_CONFIG = config_from_league_rules(SCORING_RULES)
+
+# Engine key for the worker-wide config
+DEFAULT_LEAGUE_ID = 'default'
 
 class LiveGameWorker:
     def __init__(self):
         self.redis_client = None
+        self.snapshot_redis = None
         self.appwrite_client = None
         self.http_client = None
+        self.upstream: Optional[GuardedTransport] = None
+        self.publisher: Optional[RealtimePublisher] = None
+        self.schedule: Optional[ScheduleCache] = None
+        self.event_ids: Optional[EventIdResolver] = None
+        self.next_game_refresh = 0.0
         self.tracked_games: Dict[str, Dict] = {}
-        self.player_stats_cache: Dict[str, Dict] = {}
         self.backoff_times: Dict[str, float] = {}
+        self.backoff_attempts: Dict[str, int] = {}
+        self.fetch_validators: Dict[str, Dict[str, str]] = {}
+        self.payload_hashes: Dict[str, str] = {}
+        # Validators and hash of a fetched payload, committed once it is processed
+        self.pending_fetches: Dict[str, Tuple[Dict[str, str], str]] = {}
+        self.scheduler = PollScheduler()
+        self.scoring_engine = ScoringEngine()
+        self.scoring_engine.register(DEFAULT_LEAGUE_ID, SCORING_CONFIG)
+        unknown = unknown_rule_keys(SCORING_RULES)
+        if unknown:
+            logger.warning(f"FANTASY_SCORING_JSON keys that score nothing: {', '.join(unknown)}")
+        self.inflight_polls: Dict[str, asyncio.Task] = {}
+        self.cycle_tasks: Set[asyncio.Task] = set()
+        self.schedule_changed = asyncio.Event()
+        self.poll_semaphore = asyncio.Semaphore(POLL_CONCURRENCY)
+        self.poll_jitter = POLL_JITTER_SECONDS
+        
+        self.metrics = MetricsRegistry()
+        self.cycle_seconds = self.metrics.histogram(
+            'live_worker_cycle_seconds', 'Wall-clock time from dispatch to the last poll of a cycle'
+        )
+        self.fetch_seconds = self.metrics.histogram(
+            'live_worker_fetch_seconds', 'ESPN boxscore fetch latency per game'
+        )
+        self.stage_seconds = self.metrics.histogram(
+            'live_worker_stage_seconds', 'Time spent per poll stage (decode, parse, delta, publish)',
+            buckets=STAGE_BUCKETS
+        )
+        self.scoring_leagues = self.metrics.gauge(
+            'live_worker_scoring_leagues', 'Leagues registered with the scoring engine'
+        )
+        self.scoring_configs = self.metrics.gauge(
+            'live_worker_scoring_configs', 'Distinct scoring configs the engine scores per delta'
+        )
+        self.upstream_requests = self.metrics.counter(
+            'live_worker_upstream_requests_total', 'Upstream HTTP requests by host and status code'
+        )
+        self.backoff_seconds = self.metrics.gauge(
+            'live_worker_backoff_seconds', 'Current backoff per game after upstream rejections'
+        )
+        self.redis_round_trips = self.metrics.counter(
+            'live_worker_redis_round_trips_total', 'Redis round trips by operation'
+        )
+        self.redis_seconds = self.metrics.histogram(
+            'live_worker_redis_seconds', 'Redis round-trip latency by operation', buckets=STAGE_BUCKETS
+        )
+        self.deltas_emitted = self.metrics.counter(
+            'live_worker_deltas_total', 'Player deltas handed to the publisher'
+        )
+        self.loop_lag_seconds = self.metrics.histogram(
+            'live_worker_event_loop_lag_seconds', 'How late the event loop woke a fixed-interval probe',
+            buckets=STAGE_BUCKETS
+        )
+        self.profiler = CycleProfiler(PROFILE_DIR)
+        self.cycles_dispatched = 0
+        self.metrics_server: Optional[MetricsServer] = None
+        self.loop_monitor: Optional[asyncio.Task] = None
+        # One identity for this process: stream consumer name and lease owner
+        self.worker_id = WORKER_ID or default_worker_id()
+        self.leases: Optional[GameLeaseManager] = None
+        self.lease_task: Optional[asyncio.Task] = None
+        self.delta_stream: Optional[DeltaStream] = None
+        self.publish_consumer: Optional[StreamConsumer] = None
+        self.checkpoints: Optional[CheckpointStore] = None
+        self.snapshot_cache = SnapshotCache(SNAPSHOT_CACHE_BYTES, metrics=self.metrics)
+        self.checkpoint_task: Optional[asyncio.Task] = None
         
     async def setup(self):
         """Initialize all connections"""
         # Redis connection
         self.redis_client = await redis.from_url(REDIS_URL, decode_responses=True)
+        # Player snapshots are binary, so they get a client that returns bytes
+        self.snapshot_redis = await redis.from_url(REDIS_URL)
         
         # Appwrite client
         self.appwrite_client = Client()
@@ -68,18 +205,193 @@ class LiveGameWorker:
         self.appwrite_client.set_project(APPWRITE_PROJECT_ID)
         self.appwrite_client.set_key(APPWRITE_API_KEY)
         
-        # HTTP client with retries
+        # HTTP client shared by every upstream call: per-host rate limits and
+        # circuit breakers in the transport, every response counted
+        self.upstream = GuardedTransport(
+            httpx.AsyncHTTPTransport(limits=httpx.Limits(max_keepalive_connections=5)),
+            load_policies(UPSTREAM_LIMITS_JSON),
+            metrics=self.metrics
+        )
         self.http_client = httpx.AsyncClient(
             timeout=30.0,
-            limits=httpx.Limits(max_keepalive_connections=5)
+            transport=self.upstream,
+            event_hooks={'response': [self.count_upstream_response]}
+        )
+        
+        # Realtime publisher with its own connection pool
+        self.publisher = RealtimePublisher(
+            endpoint=APPWRITE_FUNCTIONS_ENDPOINT or APPWRITE_ENDPOINT,
+            project_id=APPWRITE_PROJECT_ID,
+            api_key=APPWRITE_FUNCTIONS_KEY or APPWRITE_API_KEY,
+            metrics=self.metrics
         )
+        await self.publisher.start()
+        
+        # Deltas go to the slate stream; the publisher reads them back through
+        # its own consumer group
+        self.delta_stream = DeltaStream(self.redis_client, metrics=self.metrics)
+        self.start_publish_consumer(self.worker_id)
+        
+        # CFBD calendar and schedules, shared across refreshes and restarts
+        self.schedule = ScheduleCache(self.http_client, CFBD_API_KEY, SCHEDULE_CACHE_DIR)
+        os.makedirs(os.path.dirname(EVENT_ID_INDEX_PATH) or '.', exist_ok=True)
+        self.event_ids = EventIdResolver(self.http_client, EVENT_ID_INDEX_PATH)
+        
+        # Slate and per-game state survive restarts through periodic checkpoints
+        self.checkpoints = CheckpointStore(self.redis_client, metrics=self.metrics)
+        self.checkpoint_task = asyncio.create_task(self.maintain_checkpoint())
+        
+        # Shards split the game list through Redis leases
+        if SHARDED:
+            self.leases = GameLeaseManager(self.redis_client, self.worker_id, metrics=self.metrics)
+            self.lease_task = asyncio.create_task(self.maintain_leases())
+            logger.info(f"Running as shard {self.leases.worker_id}")
+        
+        # Instrumentation
+        self.loop_monitor = asyncio.create_task(self.monitor_event_loop())
+        if METRICS_PORT:
+            self.metrics_server = MetricsServer(self.metrics, METRICS_HOST, METRICS_PORT, self.profiler)
+            await self.metrics_server.start()
         
     async def cleanup(self):
         """Cleanup connections"""
+        for task in list(self.inflight_polls.values()):
+            task.cancel()
+        if self.loop_monitor:
+            self.loop_monitor.cancel()
+        if self.metrics_server:
+            await self.metrics_server.stop()
+        if self.publish_consumer:
+            await self.publish_consumer.stop()
+        if self.publisher:
+            await self.publisher.stop()
+        if self.checkpoint_task:
+            self.checkpoint_task.cancel()
+            await self.save_checkpoint()
+        if self.lease_task:
+            self.lease_task.cancel()
+        if self.leases:
+            await self.leases.stop()
         if self.redis_client:
             await self.redis_client.close()
+        if self.snapshot_redis:
+            await self.snapshot_redis.close()
         if self.http_client:
             await self.http_client.aclose()
+        if self.event_ids:
+            self.event_ids.close()
+    
+    async def sync_schedule(self):
+        """Schedule the tracked games this worker is responsible for"""
+        game_ids = self.tracked_games
+        if self.leases:
+            game_ids = await self.leases.heartbeat(self.tracked_games)
+        self.scheduler.sync({
+            espn_id: parse_kickoff(self.tracked_games[espn_id])
+            for espn_id in game_ids if espn_id in self.tracked_games
+        })
+        # Cached snapshots are only trusted while this worker is the game's sole writer
+        self.snapshot_cache.retain(game_ids)
+        # Per-game series for games no longer polled here
+        self.fetch_seconds.retain('game_id', game_ids)
+        self.backoff_seconds.retain('game_id', game_ids)
+        self.schedule_changed.set()
+    
+    async def maintain_leases(self):
+        """Heartbeat this shard's leases and follow ownership changes"""
+        while True:
+            try:
+                await self.sync_schedule()
+            except Exception as e:
+                logger.error(f"Error renewing game leases: {e}")
+            await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+    
+    async def save_checkpoint(self, dropped_games: Iterable[str] = ()):
+        """Persist the slate and the state of every game scheduled here"""
+        games = {}
+        for game_id, scheduled in self.scheduler.checkpoint().items():
+            games[game_id] = {
+                **scheduled,
+                'validators': self.fetch_validators.get(game_id, {}),
+                'payload_hash': self.payload_hashes.get(game_id),
+                'backoff_until': self.backoff_times.get(game_id, 0.0),
+                'backoff_attempts': self.backoff_attempts.get(game_id, 0),
+            }
+        slate = None
+        if self.tracked_games:
+            slate = {
+                'tracked_games': self.tracked_games,
+                'finished': sorted(self.scheduler.finished),
+                'next_refresh': self.next_game_refresh,
+            }
+        try:
+            await self.checkpoints.forget(list(dropped_games))
+            await self.checkpoints.save(slate, games)
+        except Exception as e:
+            logger.error(f"Error saving checkpoint: {e}")
+    
+    async def maintain_checkpoint(self):
+        while True:
+            await asyncio.sleep(CHECKPOINT_INTERVAL_SECONDS)
+            await self.save_checkpoint()
+    
+    async def restore_checkpoint(self):
+        """Pick up where the previous process left off, so the first cycle is incremental
+
+        Per-game validators, payload hashes and backoffs are always restored.
+        The tracked game list, finished games and scheduler due times are
+        restored only if the slate wasn't due for a refresh yet; otherwise
+        run() rebuilds the list as usual.
+        """
+        try:
+            slate, games = await self.checkpoints.load()
+        except Exception as e:
+            logger.error(f"Error loading checkpoint: {e}")
+            return
+        
+        now = time.time()
+        for game_id, state in games.items():
+            if state.get('validators'):
+                self.fetch_validators[game_id] = state['validators']
+            if state.get('payload_hash'):
+                self.payload_hashes[game_id] = state['payload_hash']
+            if state.get('backoff_until', 0.0) > now:
+                self.backoff_times[game_id] = state['backoff_until']
+                self.backoff_attempts[game_id] = state.get('backoff_attempts', 0)
+                self.backoff_seconds.set(state['backoff_until'] - now, game_id=game_id)
+        
+        if not slate or slate['next_refresh'] <= now:
+            logger.info(f"Restored state for {len(games)} games; game list is due for a refresh")
+            return
+        
+        self.tracked_games = slate['tracked_games']
+        self.event_ids.remember({
+            str(game['id']): espn_id for espn_id, game in self.tracked_games.items() if game.get('id')
+        })
+        for game_id in slate['finished']:
+            self.scheduler.finished.setdefault(game_id, now)
+        await self.sync_schedule()
+        for game_id, state in games.items():
+            if 'state' in state:
+                due = max(state['due'], self.backoff_times.get(game_id, 0.0))
+                self.scheduler.restore(game_id, GameState(state['state']), due, now)
+        
+        await self.refresh_league_configs()
+        self.next_game_refresh = slate['next_refresh']
+        logger.info(
+            f"Restored checkpoint from {now - slate['saved_at']:.0f}s ago: tracking "
+            f"{len(self.tracked_games)} games, {len(self.scheduler)} scheduled here"
+        )
+    
+    async def count_upstream_response(self, response: httpx.Response):
+        self.upstream_requests.inc(host=response.request.url.host, status=response.status_code)
+    
+    async def monitor_event_loop(self):
+        """Measure how late the loop wakes a sleeper; CPU-bound stages show up here"""
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(LOOP_LAG_INTERVAL)
+            self.loop_lag_seconds.observe(max(time.perf_counter() - started - LOOP_LAG_INTERVAL, 0.0))
     
     def is_sleep_time(self) -> bool:
         """Check if we should sleep (midnight to 8 AM ET)"""
@@ -88,64 +400,31 @@ class LiveGameWorker:
     
     async def fetch_todays_games(self) -> List[Dict]:
         """Fetch today's games from CFBD API"""
-        today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-        
-        headers = {
-            'Authorization': f'Bearer {CFBD_API_KEY}',
-            'Accept': 'application/json'
-        }
+        today = datetime.now(timezone.utc).date()
         
         try:
-            # Get current week
-            week_url = f'https://api.collegefootballdata.com/calendar?year={datetime.now().year}'
-            week_resp = await self.http_client.get(week_url, headers=headers)
-            week_data = week_resp.json()
-            
-            current_week = None
-            for week in week_data:
-                if week['firstGameStart'] <= today <= week['lastGameStart']:
-                    current_week = week['week']
-                    break
-            
-            if not current_week:
-                logger.warning(f"No games found for today {today}")
-                return []
-            
-            # Get games for current week
-            games_url = f'https://api.collegefootballdata.com/games?year={datetime.now().year}&week={current_week}'
-            games_resp = await self.http_client.get(games_url, headers=headers)
-            games = games_resp.json()
-            
-            # Filter for today's games in target conferences
-            todays_games = []
-            for game in games:
-                game_date = game.get('start_date', '').split('T')[0]
-                home_conf = game.get('home_conference', '')
-                away_conf = game.get('away_conference', '')
-                
-                if game_date == today and (home_conf in TARGET_CONFERENCES or away_conf in TARGET_CONFERENCES):
-                    todays_games.append(game)
-                    logger.info(f"Tracking game: {game['away_team']} @ {game['home_team']}")
-            
-            return todays_games
-            
+            todays_games = await self.schedule.games_on(today, TARGET_CONFERENCES)
         except Exception as e:
             logger.error(f"Error fetching CFBD games: {e}")
             return []
+        
+        if not todays_games:
+            logger.warning(f"No games found for today {today}")
+        for game in todays_games:
+            logger.info(f"Tracking game: {game['away_team']} @ {game['home_team']}")
+        return todays_games
     
     def map_to_espn_id(self, cfbd_game: Dict) -> Optional[str]:
-        """Map CFBD game to ESPN event ID"""
-        # ESPN uses a different ID system, we'll need to search by teams and date
-        # This is a simplified mapping - in production you'd want a more robust solution
-        home_team = cfbd_game.get('home_team', '').lower().replace(' ', '')
-        away_team = cfbd_game.get('away_team', '').lower().replace(' ', '')
-        game_date = cfbd_game.get('start_date', '').split('T')[0].replace('-', '')
-        
-        # Generate a composite key for caching
-        return f"{game_date}_{away_team}_{home_team}"
+        """Map CFBD game to ESPN event ID (resolved by event_ids.resolve during refresh)"""
+        return self.event_ids.get(cfbd_game.get('id'))
     
     async def fetch_espn_boxscore(self, game_id: str) -> Optional[Dict]:
-        """Fetch ESPN boxscore data"""
+        """Fetch ESPN boxscore data
+
+        Returns None when there is nothing new to process: the game is backing
+        off, the server answered 304 to our conditional request, or the payload
+        is byte-for-byte identical to the last one we parsed.
+        """
         # ESPN API endpoint (this is a simplified example)
         # In production, you'd need to handle ESPN's actual API structure
         url = f"https://site.api.espn.com/apis/site/v2/sports/football/college-football/summary?event={game_id}"
@@ -155,190 +434,489 @@ class LiveGameWorker:
             if datetime.now().timestamp() < self.backoff_times[game_id]:
                 return None
         
+        # Conditional request headers from the last response
+        headers = {}
+        validators = self.fetch_validators.get(game_id, {})
+        if 'etag' in validators:
+            headers['If-None-Match'] = validators['etag']
+        if 'last_modified' in validators:
+            headers['If-Modified-Since'] = validators['last_modified']
+        
         try:
-            response = await self.http_client.get(url)
+            started = time.perf_counter()
+            response = await self.http_client.get(url, headers=headers)
+            self.fetch_seconds.observe(time.perf_counter() - started, game_id=game_id)
             
-            if response.status_code == 403:
-                # Implement exponential backoff
-                backoff = self.backoff_times.get(game_id, 30)
-                backoff = min(backoff * 2, 300)  # Max 5 minutes
-                self.backoff_times[game_id] = datetime.now().timestamp() + backoff
-                logger.warning(f"403 error for {game_id}, backing off for {backoff}s")
+            if is_failure(response.status_code):
+                self.back_off(
+                    game_id, f"HTTP {response.status_code}",
+                    parse_retry_after(response.headers.get('retry-after'))
+                )
+                return None
+            
+            if response.status_code == 304:
+                self.clear_backoff(game_id)
                 return None
             
             if response.status_code == 200:
-                # Clear backoff on success
-                self.backoff_times.pop(game_id, None)
-                return response.json()
+                self.clear_backoff(game_id)
+                
+                validators = {}
+                if response.headers.get('etag'):
+                    validators['etag'] = response.headers['etag']
+                if response.headers.get('last-modified'):
+                    validators['last_modified'] = response.headers['last-modified']
+                
+                # Servers that ignore conditional headers still get short-circuited
+                payload_hash = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+                if self.payload_hashes.get(game_id) == payload_hash:
+                    self.fetch_validators[game_id] = validators
+                    return None
+                # Not remembered until poll_game has stored the deltas, so a
+                # failed update is retried with the same payload
+                self.pending_fetches[game_id] = (validators, payload_hash)
+                
+                if BOXSCORE_RECORD_DIR:
+                    self.record_boxscore(game_id, response.content)
                 
+                started = time.perf_counter()
+                boxscore = response.json()
+                self.stage_seconds.observe(time.perf_counter() - started, stage='decode')
+                return boxscore
+                
+        except CircuitOpenError as e:
+            # The breaker paces the host; hold the game until the next probe
+            self.backoff_times[game_id] = e.retry_at
+            self.upstream_requests.inc(host=e.host, status=type(e).__name__)
+        except httpx.TransportError as e:
+            self.upstream_requests.inc(host=httpx.URL(url).host, status=type(e).__name__)
+            self.back_off(game_id, type(e).__name__)
         except Exception as e:
             logger.error(f"Error fetching ESPN data for {game_id}: {e}")
             
         return None
     
+    def commit_fetch(self, game_id: str):
+        """Remember a processed payload's validators and hash for the next poll"""
+        pending = self.pending_fetches.pop(game_id, None)
+        if pending is not None:
+            self.fetch_validators[game_id], self.payload_hashes[game_id] = pending
+    
+    def back_off(self, game_id: str, reason: str, retry_after: Optional[float] = None):
+        """Push a game's next poll out after throttling or an upstream error"""
+        attempt = self.backoff_attempts.get(game_id, 0)
+        self.backoff_attempts[game_id] = attempt + 1
+        delay = backoff_delay(attempt, BACKOFF_BASE_SECONDS, BACKOFF_MAX_SECONDS, retry_after)
+        self.backoff_times[game_id] = time.time() + delay
+        self.backoff_seconds.set(delay, game_id=game_id)
+        logger.warning(f"{reason} for {game_id}, backing off for {delay:.0f}s")
+    
+    def clear_backoff(self, game_id: str):
+        if self.backoff_attempts.pop(game_id, None) is not None:
+            self.backoff_seconds.remove(game_id=game_id)
+        self.backoff_times.pop(game_id, None)
+    
+    def record_boxscore(self, game_id: str, content: bytes):
+        """Save a raw summary payload for replay.py, one numbered file per change"""
+        game_dir = os.path.join(BOXSCORE_RECORD_DIR, game_id)
+        os.makedirs(game_dir, exist_ok=True)
+        sequence = len(os.listdir(game_dir))
+        with open(os.path.join(game_dir, f"{sequence:05d}.json"), 'wb') as f:
+            f.write(content)
+    
     def extract_player_stats(self, boxscore: Dict) -> Dict[str, Dict]:
         """Extract individual player statistics from boxscore"""
-        player_stats = {}
-        
-        # Parse boxscore structure (simplified - ESPN has complex structure)
-        if 'boxscore' in boxscore and 'players' in boxscore['boxscore']:
-            for team in boxscore['boxscore']['players']:
-                for category in team.get('statistics', []):
-                    stat_type = category.get('name', '')
-                    
-                    for player in category.get('athletes', []):
-                        player_id = player.get('athlete', {}).get('id')
-                        player_name = player.get('athlete', {}).get('displayName')
-                        
-                        if not player_id:
-                            continue
-                        
-                        if player_id not in player_stats:
-                            player_stats[player_id] = {
-                                'name': player_name,
-                                'stats': {}
-                            }
-                        
-                        # Map ESPN stats to our scoring categories
-                        if stat_type == 'passing':
-                            stats = player.get('stats', [])
-                            if len(stats) >= 3:
-                                player_stats[player_id]['stats']['passing_yards'] = int(stats[1] or 0)
-                                player_stats[player_id]['stats']['passing_tds'] = int(stats[2] or 0)
-                                
-                        elif stat_type == 'rushing':
-                            stats = player.get('stats', [])
-                            if len(stats) >= 3:
-                                player_stats[player_id]['stats']['rushing_yards'] = int(stats[2] or 0)
-                                player_stats[player_id]['stats']['rushing_tds'] = int(stats[3] or 0)
-                                
-                        elif stat_type == 'receiving':
-                            stats = player.get('stats', [])
-                            if len(stats) >= 3:
-                                player_stats[player_id]['stats']['receiving_yards'] = int(stats[2] or 0)
-                                player_stats[player_id]['stats']['receiving_tds'] = int(stats[3] or 0)
-        
-        return player_stats
+        return parse_boxscore(boxscore).to_dict()
     
     def calculate_fantasy_points(self, stats: Dict) -> float:
-        """Calculate fantasy points based on stats"""
-        points = 0.0
-        
-        for stat_name, value in stats.items():
-            if stat_name in SCORING_RULES:
-                points += value * SCORING_RULES[stat_name]
-        
-        return round(points, 2)
+        """Calculate fantasy points under the worker-wide scoring config"""
+        return self.scoring_engine.plan_for(DEFAULT_LEAGUE_ID).score(stats)
     
     async def update_player_deltas(self, game_id: str, current_stats: Dict[str, Dict]):
-        """Calculate and store player stat deltas in Redis"""
+        """Calculate and store player stat deltas in Redis
+
+        Previous snapshots come from the in-process snapshot cache; only a
+        game's first poll here (after a restart or a shard handoff) reads
+        them with a single MGET. Every changed snapshot is written back in
+        one pipelined transaction and then to the cache, so a steady-state
+        poll costs at most one Redis round trip regardless of how many
+        athletes are in the boxscore.
+
+        Snapshots carry running point totals per scoring plan, so a change is
+        scored from its stat deltas alone instead of rescoring both stat lines.
+        They are stored in the compact binary format from snapshot.py, with
+        player names kept once per game in a hash; JSON snapshots left by an
+        older worker are read and rewritten in the new format.
+        """
         deltas = []
+        if not current_stats:
+            return deltas
+        
+        player_ids = list(current_stats)
+        cache_keys = [snapshot_key(game_id, player_id) for player_id in player_ids]
+        previous_values = self.snapshot_cache.get(game_id, player_ids)
+        if previous_values is None:
+            started = time.perf_counter()
+            previous_values = await self.snapshot_redis.mget(cache_keys)
+            self.redis_seconds.observe(time.perf_counter() - started, op='mget')
+            self.redis_round_trips.inc(op='mget')
+            self.snapshot_cache.put(game_id, [
+                (player_id, snapshot) for player_id, snapshot in zip(player_ids, previous_values) if snapshot
+            ])
+        
+        default_key = self.scoring_engine.league_plans[DEFAULT_LEAGUE_ID]
+        timestamp = datetime.now(timezone.utc).isoformat()
+        writes = []
+        new_names = {}
         
-        for player_id, player_data in current_stats.items():
-            # Get previous stats from Redis
-            cache_key = f"player_stats:{game_id}:{player_id}"
-            previous_data = await self.redis_client.get(cache_key)
+        for player_id, cache_key, previous_data in zip(player_ids, cache_keys, previous_values):
+            player_data = current_stats[player_id]
             
-            if previous_data:
-                previous_stats = json.loads(previous_data)
-                
-                # Calculate deltas
-                stat_deltas = {}
-                for stat_name, current_value in player_data['stats'].items():
-                    previous_value = previous_stats.get('stats', {}).get(stat_name, 0)
-                    if current_value != previous_value:
-                        stat_deltas[stat_name] = current_value - previous_value
-                
-                if stat_deltas:
-                    # Calculate fantasy point delta
-                    current_points = self.calculate_fantasy_points(player_data['stats'])
-                    previous_points = self.calculate_fantasy_points(previous_stats.get('stats', {}))
-                    
-                    delta = {
-                        'player_id': player_id,
-                        'player_name': player_data['name'],
-                        'stat_deltas': stat_deltas,
-                        'fantasy_points_delta': round(current_points - previous_points, 2),
-                        'total_fantasy_points': current_points,
-                        'timestamp': datetime.now(timezone.utc).isoformat()
-                    }
-                    deltas.append(delta)
+            if not previous_data:
+                new_names[player_id] = player_data['name']
+                writes.append((player_id, cache_key, encode_snapshot(
+                    player_data['stats'], self.scoring_engine.score(player_data['stats'])
+                )))
+                continue
+            
+            if is_json_snapshot(previous_data):
+                new_names[player_id] = player_data['name']
+            previous_stats, previous_points = decode_snapshot(previous_data)
+            
+            # Calculate deltas
+            stat_deltas = {}
+            for stat_name, current_value in player_data['stats'].items():
+                previous_value = previous_stats.get(stat_name, 0)
+                if current_value != previous_value:
+                    stat_deltas[stat_name] = current_value - previous_value
+            
+            if not stat_deltas:
+                continue
             
-            # Update cache with current stats
-            await self.redis_client.setex(
-                cache_key,
-                86400,  # 24 hour TTL
-                json.dumps(player_data)
+            # Fantasy point deltas for every scoring plan
+            plan_points = self.scoring_engine.score_deltas(
+                previous_stats, player_data['stats'], stat_deltas, previous_points
             )
+            points_delta, total_points = plan_points[default_key]
+            
+            deltas.append({
+                'player_id': player_id,
+                'player_name': player_data['name'],
+                'stat_deltas': stat_deltas,
+                'fantasy_points_delta': points_delta,
+                'total_fantasy_points': total_points,
+                'points': {
+                    key: {'delta': delta, 'total': total}
+                    for key, (delta, total) in plan_points.items()
+                },
+                'timestamp': timestamp
+            })
+            writes.append((player_id, cache_key, encode_snapshot(
+                player_data['stats'], {key: total for key, (_, total) in plan_points.items()}
+            )))
+        
+        # Unchanged snapshots are left alone; the TTL outlives any game
+        if writes:
+            started = time.perf_counter()
+            async with self.snapshot_redis.pipeline(transaction=True) as pipe:
+                for _, cache_key, snapshot in writes:
+                    pipe.setex(cache_key, PLAYER_STATS_TTL, snapshot)
+                if new_names:
+                    pipe.hset(names_key(game_id), mapping=new_names)
+                    pipe.expire(names_key(game_id), PLAYER_STATS_TTL)
+                await pipe.execute()
+            self.redis_seconds.observe(time.perf_counter() - started, op='pipeline')
+            self.redis_round_trips.inc(op='pipeline')
+            self.snapshot_cache.put(game_id, [(player_id, snapshot) for player_id, _, snapshot in writes])
         
         return deltas
     
-    async def publish_updates(self, game_id: str, deltas: List[Dict]):
-        """Publish updates to Appwrite Realtime"""
-        if not deltas:
-            return
+    def list_league_scoring_rules(self) -> Dict[str, Optional[Dict]]:
+        """Read every league's scoringRules from Appwrite (blocking SDK calls)"""
+        databases = Databases(self.appwrite_client)
+        rules: Dict[str, Optional[Dict]] = {}
+        cursor = None
         
-        try:
-            # Use Appwrite Functions to publish to Realtime
-            functions = Functions(self.appwrite_client)
-            
-            payload = {
-                'channel': 'score_updates',
-                'event': 'player_stats_update',
-                'data': {
-                    'game_id': game_id,
-                    'updates': deltas,
-                    'timestamp': datetime.now(timezone.utc).isoformat()
-                }
-            }
-            
-            # Execute a function to publish to Realtime
-            # You'll need to create this function in Appwrite
-            await functions.create_execution(
-                function_id='publish_realtime',
-                data=json.dumps(payload)
-            )
+        while True:
+            queries = [Query.limit(100), Query.select(['$id', 'scoringRules'])]
+            if cursor:
+                queries.append(Query.cursor_after(cursor))
+            page = databases.list_documents(APPWRITE_DATABASE_ID, LEAGUES_COLLECTION_ID, queries)
+            documents = page.get('documents', [])
             
-            logger.info(f"Published {len(deltas)} updates for game {game_id}")
+            for document in documents:
+                raw_rules = document.get('scoringRules')
+                try:
+                    parsed = json.loads(raw_rules) if raw_rules else None
+                except ValueError:
+                    logger.warning(f"Ignoring invalid scoringRules for league {document['$id']}")
+                    parsed = None
+                rules[document['$id']] = parsed if isinstance(parsed, dict) else None
             
+            if len(documents) < 100:
+                return rules
+            cursor = documents[-1]['$id']
+    
+    async def refresh_league_configs(self):
+        """Register every league's scoring config with the engine"""
+        try:
+            league_rules = await asyncio.to_thread(self.list_league_scoring_rules)
         except Exception as e:
-            logger.error(f"Error publishing to Appwrite: {e}")
+            logger.error(f"Error loading league scoring configs: {e}")
+            return
+        
+        for league_id in list(self.scoring_engine.league_plans):
+            if league_id != DEFAULT_LEAGUE_ID and league_id not in league_rules:
+                self.scoring_engine.unregister(league_id)
+        for league_id, rules in league_rules.items():
+            self.scoring_engine.register(league_id, config_from_league_rules(rules))
+        
+        leagues = len(self.scoring_engine.league_plans) - 1
+        configs = len(self.scoring_engine.plans)
+        self.scoring_leagues.set(leagues)
+        self.scoring_configs.set(configs)
+        logger.info(f"Scoring {leagues} leagues with {configs} distinct configs")
     
-    async def poll_game(self, game_id: str):
-        """Poll a single game for updates"""
+    def fan_out_deltas(self, deltas: List[Dict]) -> List[Dict]:
+        """Split deltas into one update stream per distinct scoring config
+
+        Points were already computed once per config in update_player_deltas;
+        here each config group just picks its own numbers and lists the
+        leagues that share it.
+        """
+        groups = []
+        for config_key, league_ids in self.scoring_engine.groups().items():
+            league_ids = [league_id for league_id in league_ids if league_id != DEFAULT_LEAGUE_ID]
+            if not league_ids:
+                continue
+            groups.append({
+                'config_key': config_key,
+                'league_ids': league_ids,
+                'updates': [
+                    {
+                        'player_id': delta['player_id'],
+                        'fantasy_points_delta': delta['points'][config_key]['delta'],
+                        'total_fantasy_points': delta['points'][config_key]['total'],
+                    }
+                    for delta in deltas
+                ]
+            })
+        return groups
+    
+    async def publish_updates(self, game_id: str, deltas: List[Dict]):
+        """Append updates to the slate's delta stream (or, without one, hand them to the publisher)"""
+        if not deltas:
+            return
+        groups = self.fan_out_deltas(deltas)
+        updates = [
+            {key: value for key, value in delta.items() if key != 'points'}
+            for delta in deltas
+        ]
+        if self.delta_stream:
+            await self.delta_stream.append(game_id, updates, groups)
+        else:
+            await self.publisher.publish(game_id, updates, groups)
+    
+    def start_publish_consumer(self, consumer: str):
+        """Read the delta stream into the Realtime publisher as group 'appwrite-publisher'"""
+        self.publish_consumer = StreamConsumer(
+            self.redis_client, 'appwrite-publisher', consumer, self.publish_entries, metrics=self.metrics
+        )
+        self.publish_consumer.start()
+    
+    async def publish_entries(self, entries: List) -> List[str]:
+        """Publish a batch of stream entries; returns once Appwrite has them
+
+        Returns the ids of entries whose publish batch failed, so only those
+        are left pending and retried.
+        """
+        for entry_id, entry in entries:
+            await self.publisher.publish(entry['game_id'], entry['deltas'], entry['groups'], entry_id)
+        try:
+            await self.publisher.flush()
+        except PublishError as e:
+            return e.entry_ids
+        return []
+    
+    async def poll_game(self, game_id: str) -> Optional[GameState]:
+        """Poll a single game for updates
+
+        Returns the game's state when a new boxscore was processed, or None
+        when the poll learned nothing new.
+        """
+        # A lapsed lease means another shard may own the game by now
+        if self.leases and not self.leases.owns(game_id):
+            self.snapshot_cache.evict(game_id, 'handoff')
+            self.fetch_seconds.remove(game_id=game_id)
+            return None
+        
         boxscore = await self.fetch_espn_boxscore(game_id)
         if not boxscore:
-            return
+            return None
+        
+        state = classify_game_state(boxscore)
         
         # Extract player stats
+        started = time.perf_counter()
         current_stats = self.extract_player_stats(boxscore)
+        self.stage_seconds.observe(time.perf_counter() - started, stage='parse')
         
         # Calculate deltas
+        started = time.perf_counter()
         deltas = await self.update_player_deltas(game_id, current_stats)
+        self.stage_seconds.observe(time.perf_counter() - started, stage='delta')
+        self.commit_fetch(game_id)
         
         # Publish updates
         if deltas:
+            self.deltas_emitted.inc(len(deltas))
+            started = time.perf_counter()
             await self.publish_updates(game_id, deltas)
+            self.stage_seconds.observe(time.perf_counter() - started, stage='publish')
+        
+        # Final stat lines are durable in Redis; free the memory
+        if state == GameState.FINAL:
+            self.snapshot_cache.evict(game_id)
+            self.fetch_seconds.remove(game_id=game_id)
+        
+        return state
     
-    async def run_polling_cycle(self):
-        """Run one polling cycle for all tracked games"""
-        tasks = []
+    async def poll_game_task(self, game_id: str) -> Optional[GameState]:
+        """Jittered, concurrency-capped poll that reschedules the game when done"""
+        state = None
+        try:
+            # Jitter inside the task so dispatch never waits on it
+            await asyncio.sleep(random.uniform(0, self.poll_jitter))
+            async with self.poll_semaphore:
+                state = await self.poll_game(game_id)
+        except Exception as e:
+            logger.error(f"Error polling {game_id}: {e}")
+        finally:
+            self.inflight_polls.pop(game_id, None)
+            self.scheduler.reschedule(game_id, state, self.backoff_times.get(game_id, 0.0))
+            self.schedule_changed.set()
+        return state
+    
+    async def run_polling_cycle(self, game_ids: Optional[List[str]] = None) -> Optional[asyncio.Task]:
+        """Dispatch one polling cycle for the given games (default: all tracked)
+
+        Returns as soon as the polls are scheduled. Games still in flight from
+        an earlier cycle are skipped, so a slow game never holds up the
+        others. The returned task completes when this cycle's polls finish.
+        """
+        if game_ids is None:
+            game_ids = list(self.tracked_games)
         
-        for game_id in self.tracked_games:
-            # Add jitter ±4 seconds
-            jitter = random.uniform(-4, 4)
-            await asyncio.sleep(max(0, jitter))
-            
-            task = asyncio.create_task(self.poll_game(game_id))
+        tasks = []
+        for game_id in game_ids:
+            if game_id in self.inflight_polls:
+                continue
+            task = asyncio.create_task(self.poll_game_task(game_id))
+            self.inflight_polls[game_id] = task
             tasks.append(task)
         
-        # Wait for all polling tasks to complete
-        if tasks:
+        if not tasks:
+            return None
+        
+        self.cycles_dispatched += 1
+        if PROFILE_EVERY_CYCLES and self.cycles_dispatched % PROFILE_EVERY_CYCLES == 0:
+            self.profiler.arm()
+        profile_label = None
+        if self.profiler.start_cycle():
+            profile_label = f"cycle {self.cycles_dispatched} ({len(tasks)} games)"
+        
+        cycle = asyncio.create_task(self.track_cycle(tasks, profile_label))
+        self.cycle_tasks.add(cycle)
+        cycle.add_done_callback(self.cycle_tasks.discard)
+        return cycle
+    
+    async def track_cycle(self, tasks: List[asyncio.Task], profile_label: Optional[str] = None):
+        """Record a cycle's wall-clock time once all of its polls are done"""
+        started = time.perf_counter()
+        try:
             await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            if profile_label:
+                self.profiler.finish_cycle(profile_label)
+        self.cycle_seconds.observe(time.perf_counter() - started)
+    
+    def log_metrics(self):
+        """Log upstream polls against the fixed 15s cadence, plus latency histograms"""
+        metrics = self.scheduler.metrics()
+        baseline = metrics['baseline_polls']
+        saved = 1 - metrics['polls'] / baseline if baseline else 0.0
+        states = {}
+        for game in metrics['games'].values():
+            states[game['state']] = states.get(game['state'], 0) + 1
+        logger.info(
+            f"Scheduler: {metrics['tracked']} scheduled {states}, {metrics['finished']} final, "
+            f"{metrics['polls']} polls vs {baseline} at fixed cadence ({saved:.0%} fewer)"
+        )
+        
+        cycle = self.cycle_seconds.merged().summary()
+        fetch = self.fetch_seconds.merged().summary()
+        slowest = max(
+            self.fetch_seconds.summaries().items(),
+            key=lambda item: item[1]['p95'],
+            default=None
+        )
+        logger.info(
+            f"Cycle wall-clock: p50={cycle['p50']}s p95={cycle['p95']}s max={cycle['max']}s "
+            f"over {cycle['count']} cycles; fetch: p50={fetch['p50']}s p95={fetch['p95']}s"
+            + (f", slowest {dict(slowest[0]).get('game_id')} p95={slowest[1]['p95']}s" if slowest else "")
+        )
+        
+        stages = ", ".join(
+            f"{dict(key)['stage']} p95={summary['p95']}s"
+            for key, summary in sorted(self.stage_seconds.summaries().items())
+        )
+        if stages:
+            logger.info(f"Poll stages: {stages}")
+        
+        statuses = ", ".join(
+            f"{dict(key)['host']} {dict(key)['status']}: {int(count)}"
+            for key, count in sorted(self.upstream_requests.values.items())
+        )
+        redis_rtt = self.redis_seconds.merged().summary()
+        lag = self.loop_lag_seconds.merged().summary()
+        open_circuits = [
+            host for host, breaker in (self.upstream.breakers.items() if self.upstream else ())
+            if breaker.state != CLOSED
+        ]
+        logger.info(
+            f"Upstream: {statuses or 'no requests'}; open circuits: {open_circuits or 'none'}; "
+            f"{len(self.backoff_seconds.values)} games backing off; "
+            f"Redis: {int(self.redis_round_trips.total())} round trips p95={redis_rtt['p95']}s; "
+            f"snapshot cache: {len(self.snapshot_cache.games)} games, {self.snapshot_cache.bytes / 1e6:.1f} MB, "
+            f"{int(self.snapshot_cache.lookups.get(result='miss'))} misses; "
+            f"{int(self.deltas_emitted.total())} deltas; loop lag p95={lag['p95']}s max={lag['max']}s"
+        )
+
+        if self.leases:
+            logger.info(
+                f"Shard {self.leases.worker_id}: {len(self.leases.owned)} of {len(self.tracked_games)} games "
+                f"across {len(self.leases.workers)} shards, {int(self.leases.lease_events.get(event='lost'))} leases lost"
+            )
+        
+        logger.info(
+            f"Scoring: {int(self.scoring_leagues.get())} leagues share "
+            f"{int(self.scoring_configs.get())} distinct configs"
+        )
+        
+        if self.publisher:
+            publish = self.publisher.publish_seconds.merged().summary()
+            wait = self.publisher.queue_wait_seconds.merged().summary()
+            logger.info(
+                f"Publisher: queue depth {self.publisher.queue.qsize()}, "
+                f"{publish['count']} batches p50={publish['p50']}s p95={publish['p95']}s, "
+                f"queue wait p95={wait['p95']}s"
+            )
     
     async def run(self):
         """Main worker loop"""
         await self.setup()
+        await self.restore_checkpoint()
+        last_metrics_log = time.time()
         
         try:
             while True:
@@ -348,29 +926,56 @@ class LiveGameWorker:
                     await asyncio.sleep(3600)  # Check every hour
                     continue
                 
-                # Refresh game list every hour
-                if not self.tracked_games or datetime.now().minute == 0:
+                # Refresh game list hourly and at the UTC day boundary
+                if time.time() >= self.next_game_refresh:
                     logger.info("Refreshing game list...")
                     cfbd_games = await self.fetch_todays_games()
+                    await self.event_ids.resolve(cfbd_games)
                     
+                    previous_games = set(self.tracked_games)
                     self.tracked_games = {}
                     for game in cfbd_games:
                         espn_id = self.map_to_espn_id(game)
                         if espn_id:
                             self.tracked_games[espn_id] = game
                     
-                    logger.info(f"Tracking {len(self.tracked_games)} games")
+                    await self.sync_schedule()
+                    logger.info(f"Tracking {len(self.tracked_games)} games, {len(self.scheduler)} scheduled here")
+                    
+                    await self.refresh_league_configs()
+                    self.next_game_refresh = next_refresh_deadline(time.time(), GAME_LIST_REFRESH_SECONDS)
+                    await self.save_checkpoint(previous_games - set(self.tracked_games))
                 
-                if self.tracked_games:
-                    # Run polling cycle
-                    await self.run_polling_cycle()
+                if len(self.scheduler):
+                    # Poll whichever games are due
+                    due = self.scheduler.pop_due()
+                    if due:
+                        await self.run_polling_cycle(due)
+                    
+                    if time.time() - last_metrics_log >= METRICS_LOG_INTERVAL:
+                        self.log_metrics()
+                        last_metrics_log = time.time()
                     
-                    # Wait 15 seconds before next cycle
-                    await asyncio.sleep(15)
+                    # Sleep until the next game is due or a finished poll reschedules one,
+                    # waking often enough for refreshes
+                    next_due = self.scheduler.next_due()
+                    wait = MAX_IDLE_SECONDS if next_due is None else next_due - time.time()
+                    self.schedule_changed.clear()
+                    try:
+                        await asyncio.wait_for(
+                            self.schedule_changed.wait(),
+                            timeout=min(max(wait, 0), MAX_IDLE_SECONDS)
+                        )
+                    except asyncio.TimeoutError:
+                        pass
                 else:
-                    # No games to track, wait 5 minutes
+                    # No games to track, wait 5 minutes or until a lease comes our way
                     logger.info("No games to track, waiting...")
-                    await asyncio.sleep(300)
+                    self.schedule_changed.clear()
+                    try:
+                        await asyncio.wait_for(self.schedule_changed.wait(), timeout=300)
+                    except asyncio.TimeoutError:
+                        pass
                     
         except KeyboardInterrupt:
             logger.info("Shutting down...")
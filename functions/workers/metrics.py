@@ -0,0 +1,332 @@
+"""
+In-process metrics for the live worker
+
+Histograms keep Prometheus-style bucket counts per label set, so the same
+numbers can be logged as summaries or exported without re-sampling.
+Gauges hold the latest value per label set; counters only go up.
+MetricsServer serves the registry in the Prometheus text format, and
+CycleProfiler takes opt-in cProfile snapshots of whole polling cycles.
+"""
+
+import asyncio
+import bisect
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+from typing import Dict, Optional, Sequence, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from a fast cache hit to a stalled upstream
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class HistogramSeries:
+    """Bucket counts, sum, min and max for one label set"""
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum', 'min', 'max')
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation, within the observed range"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                bound = self.buckets[index] if index < len(self.buckets) else self.max
+                return min(max(bound, self.min), self.max)
+        return self.max
+
+    def fold(self, other: 'HistogramSeries') -> None:
+        """Add another series' observations into this one"""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'mean': round(self.sum / self.count, 4) if self.count else 0.0,
+            'p50': round(self.quantile(0.5), 4),
+            'p95': round(self.quantile(0.95), 4),
+            'max': round(self.max, 4),
+        }
+
+
+class Histogram:
+    """Histogram metric with optional labels"""
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self.series: Dict[LabelKey, HistogramSeries] = {}
+        # Removed label sets, still counted by merged()
+        self.retired = HistogramSeries(self.buckets)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = HistogramSeries(self.buckets)
+        series.observe(value)
+
+    def remove(self, **labels: str) -> None:
+        series = self.series.pop(_label_key(labels), None)
+        if series is not None:
+            self.retired.fold(series)
+
+    def retain(self, label: str, values) -> None:
+        """Drop series whose value for label is not in values (e.g. games no longer polled)"""
+        for key in [key for key in self.series if dict(key).get(label) not in values]:
+            self.retired.fold(self.series.pop(key))
+
+    def merged(self) -> HistogramSeries:
+        """All label sets, including removed ones, folded into a single series"""
+        merged = HistogramSeries(self.buckets)
+        merged.fold(self.retired)
+        for series in self.series.values():
+            merged.fold(series)
+        return merged
+
+    def summaries(self) -> Dict[LabelKey, Dict[str, float]]:
+        return {key: series.summary() for key, series in self.series.items()}
+
+
+class Gauge:
+    """Point-in-time value with optional labels"""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.values: Dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self.values[_label_key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self.values.get(_label_key(labels), 0.0)
+
+    def remove(self, **labels: str) -> None:
+        self.values.pop(_label_key(labels), None)
+
+    def retain(self, label: str, values) -> None:
+        """Drop values whose value for label is not in values"""
+        for key in [key for key in self.values if dict(key).get(label) not in values]:
+            del self.values[key]
+
+
+class Counter:
+    """Monotonic count with optional labels"""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self.values.get(_label_key(labels), 0.0)
+
+    def total(self) -> float:
+        return sum(self.values.values())
+
+
+class MetricsRegistry:
+    """Named metrics owned by one worker"""
+
+    def __init__(self):
+        self.metrics: Dict[str, Union[Histogram, Gauge, Counter]] = {}
+
+    def histogram(self, name: str, description: str,
+                  buckets: Optional[Sequence[float]] = None) -> Histogram:
+        if name not in self.metrics:
+            self.metrics[name] = Histogram(name, description, buckets or DEFAULT_BUCKETS)
+        return self.metrics[name]
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        if name not in self.metrics:
+            self.metrics[name] = Gauge(name, description)
+        return self.metrics[name]
+
+    def counter(self, name: str, description: str) -> Counter:
+        if name not in self.metrics:
+            self.metrics[name] = Counter(name, description)
+        return self.metrics[name]
+
+
+def _format_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ''
+    escaped = (
+        (name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in pairs
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+def render_prometheus(registry: MetricsRegistry) -> str:
+    """The registry in Prometheus text exposition format"""
+    lines = []
+    for name, metric in sorted(registry.metrics.items()):
+        lines.append(f"# HELP {name} {metric.description}")
+        if isinstance(metric, Histogram):
+            lines.append(f"# TYPE {name} histogram")
+            for key, series in sorted(metric.series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(metric.buckets, series.counts):
+                    cumulative += bucket_count
+                    lines.append(f"{name}_bucket{_format_labels(key, (('le', repr(bound)),))} {cumulative}")
+                lines.append(f"{name}_bucket{_format_labels(key, (('le', '+Inf'),))} {series.count}")
+                lines.append(f"{name}_sum{_format_labels(key)} {series.sum}")
+                lines.append(f"{name}_count{_format_labels(key)} {series.count}")
+        else:
+            lines.append(f"# TYPE {name} {'counter' if isinstance(metric, Counter) else 'gauge'}")
+            for key, value in sorted(metric.values.items()):
+                lines.append(f"{name}{_format_labels(key)} {value}")
+    return '\n'.join(lines) + '\n'
+
+
+class CycleProfiler:
+    """cProfile snapshots of polling cycles, armed on demand
+
+    Profiles the whole event loop thread from a cycle's dispatch until its
+    last poll finishes, one cycle at a time. Each snapshot is logged as a
+    top-N cumulative-time table and, with an output dir, dumped as a .prof
+    file for snakeviz/pstats.
+    """
+
+    def __init__(self, output_dir: Optional[str] = None, top: int = 25):
+        self.output_dir = output_dir
+        self.top = top
+        self.pending = 0
+        self.active: Optional[cProfile.Profile] = None
+        self.last_report = ''
+
+    # Upper bound on cycles armed at once, however many requests ask for more
+    MAX_PENDING = 100
+
+    def arm(self, cycles: int = 1) -> None:
+        self.pending = min(self.pending + max(cycles, 0), self.MAX_PENDING)
+
+    def start_cycle(self) -> bool:
+        """Begin profiling if armed and idle; the caller must finish_cycle on True"""
+        if not self.pending or self.active is not None:
+            return False
+        self.pending -= 1
+        self.active = cProfile.Profile()
+        self.active.enable()
+        return True
+
+    def finish_cycle(self, label: str) -> None:
+        profile, self.active = self.active, None
+        if profile is None:
+            return
+        profile.disable()
+
+        out = io.StringIO()
+        pstats.Stats(profile, stream=out).sort_stats('cumulative').print_stats(self.top)
+        self.last_report = f"# {label}\n{out.getvalue()}"
+        logger.info(f"Profile of {label}:\n{out.getvalue()}")
+
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+            path = os.path.join(self.output_dir, f"cycle-{int(time.time())}.prof")
+            profile.dump_stats(path)
+            logger.info(f"Profile written to {path}")
+
+
+class MetricsServer:
+    """Minimal HTTP endpoint: GET /metrics, and GET /profile[?cycles=N] to arm the profiler"""
+
+    def __init__(self, registry: MetricsRegistry, host: str, port: int,
+                 profiler: Optional[CycleProfiler] = None):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.profiler = profiler
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f"Metrics endpoint on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = (await reader.readline()).decode('latin-1').split()
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            status, content_type, body = self._route(request_line)
+            payload = body.encode()
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode() + payload
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.debug(f"Metrics request failed: {e}")
+        finally:
+            writer.close()
+
+    def _route(self, request_line) -> Tuple[str, str, str]:
+        if len(request_line) < 2 or request_line[0] != 'GET':
+            return '405 Method Not Allowed', 'text/plain', 'GET only\n'
+        url = urlsplit(request_line[1])
+        if url.path == '/metrics':
+            return '200 OK', 'text/plain; version=0.0.4', render_prometheus(self.registry)
+        if url.path == '/profile' and self.profiler is not None:
+            cycles = parse_qs(url.query).get('cycles')
+            if cycles:
+                if not cycles[0].isdigit():
+                    return '400 Bad Request', 'text/plain', 'cycles must be a non-negative integer\n'
+                self.profiler.arm(int(cycles[0]))
+                return '202 Accepted', 'text/plain', f"Profiling the next {self.profiler.pending} cycle(s)\n"
+            return '200 OK', 'text/plain', self.profiler.last_report or "No profile yet; GET /profile?cycles=1\n"
+        return '404 Not Found', 'text/plain', 'Not found\n'
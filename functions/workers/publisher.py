@@ -0,0 +1,208 @@
+"""
+Async publisher stage for live score updates
+
+Polls hand their deltas to a bounded queue and return immediately. A single
+sender drains the queue, coalesces everything that arrives within a short
+flush window (across games) into one payload, and posts it to the Appwrite
+Functions REST endpoint over a pooled async HTTP client. When Appwrite is
+slow the queue fills up and publish() waits, which pushes back on polling
+instead of buffering without bound.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+# Defaults for the flush window and batch limits
+FLUSH_INTERVAL_SECONDS = 0.25
+MAX_BATCH_UPDATES = 500
+MAX_QUEUE_SIZE = 200
+
+# (game_id, deltas, per-config groups, enqueued at, delta stream entry id)
+QueueItem = Tuple[str, List[Dict], List[Dict], float, Optional[str]]
+
+
+class PublishError(RuntimeError):
+    """Batches failed since the last flush; entry_ids are the stream entries they carried"""
+
+    def __init__(self, batches: int, entry_ids: List[str]):
+        super().__init__(f"{batches} publish batches failed")
+        self.batches = batches
+        self.entry_ids = entry_ids
+
+
+class RealtimePublisher:
+    """Batches player deltas into Appwrite function executions"""
+
+    def __init__(self, endpoint: str, project_id: str, api_key: str,
+                 function_id: str = 'publish_realtime',
+                 metrics: Optional[MetricsRegistry] = None,
+                 flush_interval: float = FLUSH_INTERVAL_SECONDS,
+                 max_batch_updates: int = MAX_BATCH_UPDATES,
+                 max_queue_size: int = MAX_QUEUE_SIZE,
+                 http_client: Optional[httpx.AsyncClient] = None):
+        self.url = f"{(endpoint or '').rstrip('/')}/functions/{function_id}/executions"
+        self.headers = {
+            'X-Appwrite-Project': project_id or '',
+            'X-Appwrite-Key': api_key or '',
+            'Content-Type': 'application/json',
+        }
+        self.flush_interval = flush_interval
+        self.max_batch_updates = max_batch_updates
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self.http_client = http_client
+        self._owns_client = http_client is None
+        self._sender: Optional[asyncio.Task] = None
+        self._failed_batches = 0
+        self._failed_entries: List[str] = []
+
+        metrics = metrics or MetricsRegistry()
+        self.queue_depth = metrics.gauge(
+            'live_worker_publish_queue_depth', 'Delta batches waiting to be published'
+        )
+        self.publish_seconds = metrics.histogram(
+            'live_worker_publish_seconds', 'Appwrite execution request latency per batch'
+        )
+        self.queue_wait_seconds = metrics.histogram(
+            'live_worker_publish_queue_wait_seconds', 'Time from enqueue to publish for the oldest delta in a batch'
+        )
+        self.batches = metrics.counter(
+            'live_worker_publish_batches_total', 'Published batches by outcome'
+        )
+
+    async def start(self):
+        """Open the HTTP pool and start the sender"""
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=2)
+            )
+        self._sender = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Flush whatever is queued, then close"""
+        if self._sender:
+            await self.queue.join()
+            self._sender.cancel()
+            try:
+                await self._sender
+            except asyncio.CancelledError:
+                pass
+            self._sender = None
+        if self._owns_client and self.http_client:
+            await self.http_client.aclose()
+            self.http_client = None
+
+    async def publish(self, game_id: str, deltas: List[Dict], groups: Optional[List[Dict]] = None,
+                      entry_id: Optional[str] = None):
+        """Queue a game's deltas, waiting for room when the sink is behind
+
+        groups are the per-scoring-config fan-out of the same deltas, each
+        with the league ids it applies to. entry_id is the delta stream entry
+        they came from; it goes out with the game so consumers can drop a
+        redelivered entry, and flush reports it if its batch failed.
+        """
+        if not deltas:
+            return
+        await self.queue.put((game_id, deltas, groups or [], time.perf_counter(), entry_id))
+        self.queue_depth.set(self.queue.qsize())
+
+    async def flush(self):
+        """Wait until everything queued so far has been sent
+
+        Raises PublishError if any batch failed since the last flush, so
+        callers that ack upstream work (the delta stream consumer) leave the
+        failed entries to be retried.
+        """
+        await self.queue.join()
+        failed, self._failed_batches = self._failed_batches, 0
+        entry_ids, self._failed_entries = self._failed_entries, []
+        if failed:
+            raise PublishError(failed, entry_ids)
+    
+    async def _collect(self) -> List[QueueItem]:
+        """Take the next item plus anything else that arrives within the flush window"""
+        batch = [await self.queue.get()]
+        updates = len(batch[0][1])
+        deadline = time.perf_counter() + self.flush_interval
+        while updates < self.max_batch_updates:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self.queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            batch.append(item)
+            updates += len(item[1])
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            try:
+                await self._send(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+                self.queue_depth.set(self.queue.qsize())
+
+    def build_payload(self, batch: List[QueueItem]) -> Dict:
+        """Coalesce queued deltas into one payload with a single entry per game"""
+        games: Dict[str, Dict] = {}
+        for game_id, deltas, groups, _, entry_id in batch:
+            game = games.setdefault(game_id, {'game_id': game_id, 'entry_ids': [], 'updates': [], 'groups': {}})
+            game['updates'].extend(deltas)
+            if entry_id:
+                game['entry_ids'].append(entry_id)
+            for group in groups:
+                merged = game['groups'].setdefault(
+                    group['config_key'],
+                    {'config_key': group['config_key'], 'league_ids': group['league_ids'], 'updates': []}
+                )
+                merged['updates'].extend(group['updates'])
+        return {
+            'channel': 'score_updates',
+            'event': 'player_stats_batch',
+            'data': {
+                'games': [
+                    {**game, 'groups': list(game['groups'].values())}
+                    for game in games.values()
+                ],
+                'timestamp': datetime.now(timezone.utc).isoformat()
+            }
+        }
+
+    async def _send(self, batch: List[QueueItem]):
+        payload = self.build_payload(batch)
+        oldest = min(item[3] for item in batch)
+        self.queue_wait_seconds.observe(time.perf_counter() - oldest)
+
+        started = time.perf_counter()
+        try:
+            # async execution: Appwrite queues the function and answers right away
+            response = await self.http_client.post(
+                self.url,
+                headers=self.headers,
+                json={'body': json.dumps(payload), 'async': True}
+            )
+            response.raise_for_status()
+            updates = sum(len(game['updates']) for game in payload['data']['games'])
+            self.batches.inc(outcome='ok')
+            logger.info(f"Published {updates} updates for {len(payload['data']['games'])} games")
+        except Exception as e:
+            self.batches.inc(outcome='error')
+            self._failed_batches += 1
+            self._failed_entries.extend(item[4] for item in batch if item[4])
+            logger.error(f"Error publishing to Appwrite: {e}")
+        finally:
+            self.publish_seconds.observe(time.perf_counter() - started)
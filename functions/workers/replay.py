@@ -0,0 +1,272 @@
+"""
+Record-and-replay harness for the live worker
+
+Feeds boxscore sequences for N concurrent games through the real
+LiveGameWorker.poll_game pipeline with every external service replaced by a
+local stand-in:
+
+- ESPN: an httpx transport serving recorded payloads (see
+  BOXSCORE_RECORD_DIR in live_worker.py) or synthetic Saturday games
+- Redis: fakeredis, or a local Redis via --redis-url
+- Appwrite: a capture transport behind the real RealtimePublisher, fed
+  through the delta stream's consumer group as in production
+
+Reports cycles/sec, per-stage latency (fetch, decode, parse, delta,
+publish) and memory, for sizing workers and catching regressions.
+
+Usage: python replay.py [--games 60] [--cycles 40] [--record-dir DIR]
+                        [--leagues 200] [--redis-url redis://localhost:6379/15]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import resource
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+import httpx
+import redis.asyncio as redis
+
+from delta_stream import DeltaStream
+from live_worker import LiveGameWorker
+from publisher import RealtimePublisher
+from scoring import SCORING_PRESETS
+
+# Roster shape per team: (category, labels, athletes)
+SYNTHETIC_CATEGORIES = (
+    ('passing', ['C/ATT', 'YDS', 'AVG', 'TD', 'INT', 'QBR'], 2),
+    ('rushing', ['CAR', 'YDS', 'AVG', 'TD', 'LONG'], 5),
+    ('receiving', ['REC', 'YDS', 'AVG', 'TD', 'LONG'], 9),
+    ('fumbles', ['FUM', 'LOST', 'REC'], 2),
+    ('kicking', ['FG', 'PCT', 'LONG', 'XP', 'PTS'], 1),
+    ('defensive', ['TOT', 'SOLO', 'SACKS', 'TFL', 'PD', 'QB HUR', 'TD'], 22),
+)
+
+
+class SyntheticGame:
+    """A game whose stats advance a little on most polls"""
+
+    def __init__(self, event_id: str, polls: int, change_rate: float, seed: int):
+        self.event_id = event_id
+        self.polls = max(polls, 3)
+        self.change_rate = change_rate
+        self.rng = random.Random(seed)
+        self.poll = 0
+        # category -> athlete id -> list of raw column values
+        self.rows: List[Dict[str, Dict[str, List]]] = []
+        for team in range(2):
+            categories = {}
+            for category, labels, athletes in SYNTHETIC_CATEGORIES:
+                categories[category] = {
+                    f"{event_id}-{team}-{category}-{n}": [0] * len(labels)
+                    for n in range(athletes)
+                }
+            self.rows.append(categories)
+
+    def advance(self):
+        if self.poll and self.rng.random() < self.change_rate:
+            team = self.rows[self.rng.randrange(2)]
+            for category in ('passing', 'rushing', 'receiving', 'defensive'):
+                athlete = self.rng.choice(list(team[category]))
+                values = team[category][athlete]
+                values[1] += self.rng.randint(1, 12)
+                if self.rng.random() < 0.05:
+                    values[3] += 1
+        self.poll += 1
+
+    def status(self) -> Dict:
+        if self.poll <= 1:
+            return {'period': 0, 'clock': 900.0, 'type': {'state': 'pre', 'name': 'STATUS_SCHEDULED'}}
+        if self.poll >= self.polls:
+            return {'period': 4, 'clock': 0.0, 'type': {'state': 'post', 'name': 'STATUS_FINAL', 'completed': True}}
+        period = 1 + 4 * self.poll // (self.polls + 1)
+        return {'period': period, 'clock': 450.0, 'type': {'state': 'in', 'name': 'STATUS_IN_PROGRESS'}}
+
+    def payload(self) -> bytes:
+        self.advance()
+        players = []
+        for team, categories in enumerate(self.rows):
+            statistics = []
+            for category, labels, _ in SYNTHETIC_CATEGORIES:
+                statistics.append({
+                    'name': category,
+                    'labels': labels,
+                    'athletes': [
+                        {
+                            'athlete': {'id': athlete_id, 'displayName': athlete_id},
+                            'stats': [str(value) for value in values],
+                        }
+                        for athlete_id, values in categories[category].items()
+                    ],
+                })
+            players.append({'team': {'id': str(team)}, 'statistics': statistics})
+        return json.dumps({
+            'header': {'competitions': [{'status': self.status()}]},
+            'boxscore': {'players': players},
+        }).encode()
+
+
+class RecordedGame:
+    """Payloads saved by the worker, served in order, repeating the last one"""
+
+    def __init__(self, paths: List[str]):
+        self.paths = paths
+        self.poll = 0
+
+    def payload(self) -> bytes:
+        path = self.paths[min(self.poll, len(self.paths) - 1)]
+        self.poll += 1
+        with open(path, 'rb') as f:
+            return f.read()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Stands in for ESPN's summary endpoint"""
+
+    def __init__(self, games: Dict[str, object]):
+        self.games = games
+        self.requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        game = self.games.get(request.url.params.get('event'))
+        if game is None:
+            return httpx.Response(404)
+        return httpx.Response(200, content=game.payload(), headers={'content-type': 'application/json'})
+
+
+class CaptureSink:
+    """Stands in for the Appwrite executions endpoint"""
+
+    def __init__(self):
+        self.batches = 0
+        self.updates = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(json.loads(request.content)['body'])
+        self.batches += 1
+        self.updates += sum(len(game['updates']) for game in payload['data']['games'])
+        return httpx.Response(202, json={'status': 'waiting'})
+
+
+def load_recorded_games(record_dir: str) -> Dict[str, RecordedGame]:
+    games = {}
+    for event_id in sorted(os.listdir(record_dir)):
+        game_dir = os.path.join(record_dir, event_id)
+        paths = sorted(
+            os.path.join(game_dir, name) for name in os.listdir(game_dir) if name.endswith('.json')
+        )
+        if paths:
+            games[event_id] = RecordedGame(paths)
+    return games
+
+
+async def make_redis(redis_url: Optional[str]):
+    """Text and binary (snapshot) clients on the same database"""
+    if redis_url:
+        client = await redis.from_url(redis_url, decode_responses=True)
+        await client.flushdb()
+        return client, await redis.from_url(redis_url)
+    try:
+        import fakeredis
+    except ImportError:
+        raise SystemExit("Install fakeredis or pass --redis-url for a local Redis")
+    server = fakeredis.FakeServer()
+    return fakeredis.FakeAsyncRedis(server=server, decode_responses=True), fakeredis.FakeAsyncRedis(server=server)
+
+
+async def replay(games: Dict[str, object], cycles: int, leagues: int,
+                 redis_url: Optional[str], trace_memory: bool = False):
+    worker = LiveGameWorker()
+    worker.poll_jitter = 0
+    transport = ReplayTransport(games)
+    sink = CaptureSink()
+    worker.http_client = httpx.AsyncClient(transport=transport)
+    worker.redis_client, worker.snapshot_redis = await make_redis(redis_url)
+    worker.publisher = RealtimePublisher(
+        endpoint='http://appwrite.replay/v1', project_id='replay', api_key='replay',
+        metrics=worker.metrics,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(sink)),
+    )
+    await worker.publisher.start()
+    worker.delta_stream = DeltaStream(worker.redis_client, metrics=worker.metrics)
+    worker.start_publish_consumer('replay')
+
+    presets = [config for name, config in SCORING_PRESETS.items() if config]
+    for n in range(leagues):
+        worker.scoring_engine.register(f"league-{n}", presets[n % len(presets)])
+
+    game_ids = list(games)
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    for _ in range(cycles):
+        cycle = await worker.run_polling_cycle(game_ids)
+        if cycle:
+            await cycle
+    # Let the publisher's consumer group catch up with the stream
+    while worker.publish_consumer.handled.total() < worker.delta_stream.appended.total():
+        await asyncio.sleep(0.01)
+    await worker.publish_consumer.stop()
+    await worker.publisher.stop()
+    elapsed = time.perf_counter() - started
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    polls = transport.requests
+    print(f"{len(game_ids)} games x {cycles} cycles in {elapsed:.2f}s: "
+          f"{cycles / elapsed:.2f} cycles/s, {polls / elapsed:.0f} polls/s")
+    print(f"{'stage':<10}{'count':>8}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    stages = {'fetch': worker.fetch_seconds.merged()}
+    for labels, series in worker.stage_seconds.series.items():
+        stages[dict(labels)['stage']] = series
+    for stage in ('fetch', 'decode', 'parse', 'delta', 'publish'):
+        series = stages.get(stage)
+        if series is None:
+            continue
+        summary = series.summary()
+        print(f"{stage:<10}{summary['count']:>8}{summary['mean'] * 1000:>10.2f}"
+              f"{summary['p95'] * 1000:>10.2f}{summary['max'] * 1000:>10.2f}")
+    cache = worker.snapshot_cache.lookups
+    print(f"redis: {int(worker.redis_round_trips.get(op='mget'))} snapshot reads, "
+          f"{int(worker.redis_round_trips.get(op='pipeline'))} writes; snapshot cache "
+          f"{int(cache.get(result='hit'))} hits, {int(cache.get(result='miss'))} misses")
+    print(f"published {sink.updates} updates in {sink.batches} batches "
+          f"({len(worker.scoring_engine.plans)} scoring configs for {leagues} leagues)")
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"memory: max RSS {max_rss_mb:.1f} MB"
+          + (f", peak traced {peak / 1e6:.1f} MB" if trace_memory else ""))
+
+    await worker.http_client.aclose()
+    await worker.redis_client.aclose()
+    await worker.snapshot_redis.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=60)
+    parser.add_argument('--cycles', type=int, default=40)
+    parser.add_argument('--change-rate', type=float, default=0.7,
+                        help='Share of synthetic polls that carry new stats')
+    parser.add_argument('--record-dir', help='Replay payloads saved via BOXSCORE_RECORD_DIR')
+    parser.add_argument('--leagues', type=int, default=0, help='Synthetic leagues to fan out to')
+    parser.add_argument('--redis-url', help='Local Redis to use instead of fakeredis (flushed!)')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Report peak Python allocations (slows the run down)')
+    args = parser.parse_args()
+
+    if args.record_dir:
+        replay_games = load_recorded_games(args.record_dir)
+    else:
+        replay_games = {
+            str(400000 + n): SyntheticGame(str(400000 + n), args.cycles, args.change_rate, seed=n)
+            for n in range(args.games)
+        }
+    logging.getLogger().setLevel(logging.WARNING)
+    asyncio.run(replay(replay_games, args.cycles, args.leagues, args.redis_url, args.trace_memory))
@@ -0,0 +1,185 @@
+"""
+Cached CFBD season calendar and weekly schedules
+
+The season calendar is fetched once and expanded into a date -> week map.
+Each week's game list is kept in memory and on disk with a TTL, and indexed
+by UTC date and conference when it loads, so finding the games for a day is
+a couple of dictionary lookups. A failed CFBD request falls back to the
+last copy we have, however stale, rather than dropping every game.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+CFBD_BASE_URL = 'https://api.collegefootballdata.com'
+
+# The calendar barely changes within a season; kickoff times do
+CALENDAR_TTL_SECONDS = 7 * 86400
+WEEK_GAMES_TTL_SECONDS = 3600
+
+# (season, season type, week)
+WeekKey = Tuple[int, str, int]
+
+# date -> conference -> games
+DayIndex = Dict[str, Dict[str, List[Dict]]]
+
+
+def _day(value: Optional[str]) -> str:
+    """YYYY-MM-DD part of a CFBD ISO timestamp"""
+    return (value or '')[:10]
+
+
+class ScheduleCache:
+    """Season calendars and weekly game lists with a day/conference index"""
+
+    def __init__(self, http_client: httpx.AsyncClient, api_key: Optional[str],
+                 cache_dir: Optional[str] = None,
+                 calendar_ttl: float = CALENDAR_TTL_SECONDS,
+                 games_ttl: float = WEEK_GAMES_TTL_SECONDS):
+        self.http_client = http_client
+        self.headers = {
+            'Authorization': f'Bearer {api_key}',
+            'Accept': 'application/json'
+        }
+        self.cache_dir = cache_dir
+        self.calendar_ttl = calendar_ttl
+        self.games_ttl = games_ttl
+
+        # season -> (fetched at, date -> weeks covering it)
+        self.calendars: Dict[int, Tuple[float, Dict[str, List[WeekKey]]]] = {}
+        # week -> (fetched at, date/conference index of its games)
+        self.weeks: Dict[WeekKey, Tuple[float, DayIndex]] = {}
+        self._lock = asyncio.Lock()
+
+    async def games_on(self, day: date, conferences: Iterable[str]) -> List[Dict]:
+        """Games on a UTC day involving any of the given conferences"""
+        day_key = day.isoformat()
+        async with self._lock:
+            week_keys = []
+            # Bowl games in January belong to the previous season
+            for season in (day.year, day.year - 1):
+                day_weeks = await self._calendar(season)
+                week_keys = day_weeks.get(day_key, [])
+                if week_keys or day.month > 2:
+                    break
+
+            games: Dict[str, Dict] = {}
+            for week_key in week_keys:
+                by_conference = (await self._week(week_key)).get(day_key, {})
+                for conference in conferences:
+                    for game in by_conference.get(conference, ()):
+                        games.setdefault(str(game.get('id')), game)
+        return list(games.values())
+
+    async def _calendar(self, season: int) -> Dict[str, List[WeekKey]]:
+        cached = self.calendars.get(season)
+        if cached and time.time() - cached[0] < self.calendar_ttl:
+            return cached[1]
+
+        weeks = await self._load(
+            f'calendar-{season}.json', self.calendar_ttl,
+            f'{CFBD_BASE_URL}/calendar', {'year': season}
+        )
+        if weeks is None:
+            return cached[1] if cached else {}
+
+        fetched_at, data = weeks
+        day_weeks: Dict[str, List[WeekKey]] = {}
+        for week in data:
+            first = _day(week.get('firstGameStart') or week.get('startDate'))
+            last = _day(week.get('lastGameStart') or week.get('endDate'))
+            if not first or not last:
+                continue
+            week_key = (season, week.get('seasonType', 'regular'), int(week['week']))
+            current = date.fromisoformat(first)
+            while current.isoformat() <= last:
+                day_weeks.setdefault(current.isoformat(), []).append(week_key)
+                current += timedelta(days=1)
+
+        self.calendars[season] = (fetched_at, day_weeks)
+        return day_weeks
+
+    async def _week(self, week_key: WeekKey) -> DayIndex:
+        cached = self.weeks.get(week_key)
+        if cached and time.time() - cached[0] < self.games_ttl:
+            return cached[1]
+
+        season, season_type, week = week_key
+        games = await self._load(
+            f'games-{season}-{season_type}-{week}.json', self.games_ttl,
+            f'{CFBD_BASE_URL}/games', {'year': season, 'week': week, 'seasonType': season_type}
+        )
+        if games is None:
+            return cached[1] if cached else {}
+
+        fetched_at, data = games
+        index: DayIndex = {}
+        for game in data:
+            by_conference = index.setdefault(_day(game.get('start_date')), {})
+            for side in ('home_conference', 'away_conference'):
+                conference = game.get(side)
+                if conference:
+                    by_conference.setdefault(conference, []).append(game)
+
+        self.weeks[week_key] = (fetched_at, index)
+        return index
+
+    async def _load(self, filename: str, ttl: float, url: str, params: Dict) -> Optional[Tuple[float, List[Dict]]]:
+        """Fresh disk copy, else CFBD, else a stale disk copy"""
+        stored = self._read(filename)
+        if stored and time.time() - stored[0] < ttl:
+            return stored
+
+        try:
+            response = await self.http_client.get(url, params=params, headers=self.headers)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            if stored:
+                age = (time.time() - stored[0]) / 3600
+                logger.warning(f"CFBD request for {filename} failed ({e}), using copy from {age:.1f}h ago")
+            else:
+                logger.error(f"CFBD request for {filename} failed: {e}")
+            return stored
+
+        fetched_at = time.time()
+        self._write(filename, fetched_at, data)
+        return fetched_at, data
+
+    def _read(self, filename: str) -> Optional[Tuple[float, List[Dict]]]:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(os.path.join(self.cache_dir, filename)) as f:
+                stored = json.load(f)
+            return stored['fetched_at'], stored['data']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write(self, filename: str, fetched_at: float, data: List[Dict]):
+        if not self.cache_dir:
+            return
+        path = os.path.join(self.cache_dir, filename)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(f'{path}.tmp', 'w') as f:
+                json.dump({'fetched_at': fetched_at, 'data': data}, f)
+            os.replace(f'{path}.tmp', path)
+        except OSError as e:
+            logger.warning(f"Could not cache {filename}: {e}")
+
+
+def next_refresh_deadline(now: float, interval: float) -> float:
+    """now + interval, pulled in to the next UTC midnight so a new day's games load promptly"""
+    today = datetime.fromtimestamp(now, timezone.utc).date()
+    midnight = datetime.combine(today + timedelta(days=1), datetime.min.time(), timezone.utc)
+    return min(now + interval, midnight.timestamp())
@@ -0,0 +1,240 @@
+"""
+Adaptive per-game polling scheduler for the live worker
+
+Games sit in a min-heap keyed by their next due time. Each poll reports the
+game's state back, and the state picks the next interval: pregame games are
+checked rarely until kickoff approaches, live games keep the old 15s cadence,
+red-zone and late-game situations are polled faster, halftime slows down and
+final games drop out of the schedule.
+"""
+
+import heapq
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+# Fixed cadence the scheduler replaced; used as the baseline for savings
+BASELINE_INTERVAL = 15.0
+
+# Start polling a pregame game this long before kickoff
+PREGAME_LEAD_SECONDS = 600
+
+
+class GameState(str, Enum):
+    PREGAME = "pregame"
+    LIVE = "live"
+    CRITICAL = "critical"  # red zone, final five minutes or overtime
+    HALFTIME = "halftime"
+    FINAL = "final"
+
+
+POLL_INTERVALS: Dict[GameState, float] = {
+    GameState.PREGAME: 120.0,
+    GameState.LIVE: 15.0,
+    GameState.CRITICAL: 8.0,
+    GameState.HALFTIME: 60.0,
+}
+
+
+def classify_game_state(boxscore: Dict) -> GameState:
+    """Derive the polling state from an ESPN summary payload"""
+    competitions = boxscore.get('header', {}).get('competitions') or [{}]
+    competition = competitions[0]
+    status = competition.get('status', {})
+    status_type = status.get('type', {})
+
+    if status_type.get('completed') or status_type.get('state') == 'post':
+        return GameState.FINAL
+    if status_type.get('state') == 'pre':
+        return GameState.PREGAME
+    if status_type.get('name') == 'STATUS_HALFTIME':
+        return GameState.HALFTIME
+
+    situation = boxscore.get('situation') or competition.get('situation') or {}
+    period = status.get('period', 0) or 0
+    clock = status.get('clock')
+    if situation.get('isRedZone') or period > 4:
+        return GameState.CRITICAL
+    if period == 4 and clock is not None and float(clock) <= 300:
+        return GameState.CRITICAL
+
+    return GameState.LIVE
+
+
+def parse_kickoff(cfbd_game: Dict) -> Optional[float]:
+    """Kickoff time of a CFBD game as a UNIX timestamp"""
+    start_date = cfbd_game.get('start_date')
+    if not start_date:
+        return None
+    try:
+        return datetime.fromisoformat(start_date.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+@dataclass
+class ScheduledGame:
+    game_id: str
+    state: GameState
+    kickoff: Optional[float]
+    due: float
+    interval: float
+    added_at: float
+    polls: int = 0
+    token: int = 0
+
+
+class PollScheduler:
+    """Min-heap of games keyed by next due time"""
+
+    def __init__(self, intervals: Optional[Dict[GameState, float]] = None):
+        self.intervals = {**POLL_INTERVALS, **(intervals or {})}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._games: Dict[str, ScheduledGame] = {}
+        self._tokens = 0
+        self.finished: Dict[str, float] = {}
+        # Totals carried over from games no longer in the schedule
+        self._retired_polls = 0
+        self._retired_baseline = 0.0
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._games
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def _push(self, game: ScheduledGame) -> None:
+        # Re-pushing invalidates any older heap entry for the same game
+        self._tokens += 1
+        game.token = self._tokens
+        heapq.heappush(self._heap, (game.due, game.token, game.game_id))
+
+    def _interval_for(self, game: ScheduledGame, now: float) -> float:
+        interval = self.intervals[game.state]
+        if game.state == GameState.PREGAME and game.kickoff is not None:
+            interval = max(interval, game.kickoff - PREGAME_LEAD_SECONDS - now)
+        return interval
+
+    def add(self, game_id: str, kickoff: Optional[float] = None, now: Optional[float] = None) -> None:
+        """Start tracking a game; no-op if it is tracked or already final"""
+        if game_id in self._games or game_id in self.finished:
+            return
+        now = time.time() if now is None else now
+        game = ScheduledGame(
+            game_id=game_id,
+            state=GameState.PREGAME,
+            kickoff=kickoff,
+            due=now,
+            interval=0.0,
+            added_at=now,
+        )
+        # Poll immediately to learn the real state, unless kickoff is still far off
+        if kickoff is not None:
+            game.due = max(now, kickoff - PREGAME_LEAD_SECONDS)
+        game.interval = self._interval_for(game, now)
+        self._games[game_id] = game
+        self._push(game)
+
+    def remove(self, game_id: str, now: Optional[float] = None) -> None:
+        game = self._games.pop(game_id, None)
+        if game is not None:
+            now = time.time() if now is None else now
+            self._retired_polls += game.polls
+            self._retired_baseline += max(0.0, now - game.added_at) / BASELINE_INTERVAL
+
+    def sync(self, kickoffs: Dict[str, Optional[float]], now: Optional[float] = None) -> None:
+        """Align the schedule with a refreshed game list"""
+        for game_id in list(self._games):
+            if game_id not in kickoffs:
+                self.remove(game_id, now)
+        for game_id, kickoff in kickoffs.items():
+            self.add(game_id, kickoff, now)
+
+    def pop_due(self, now: Optional[float] = None) -> List[str]:
+        """Remove and return every game whose poll is due"""
+        now = time.time() if now is None else now
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, token, game_id = heapq.heappop(self._heap)
+            game = self._games.get(game_id)
+            if game is not None and game.token == token:
+                due.append(game_id)
+        return due
+
+    def next_due(self) -> Optional[float]:
+        """Due time of the earliest scheduled game, if any"""
+        while self._heap:
+            _, token, game_id = self._heap[0]
+            game = self._games.get(game_id)
+            if game is not None and game.token == token:
+                return self._heap[0][0]
+            heapq.heappop(self._heap)
+        return None
+
+    def reschedule(self, game_id: str, state: Optional[GameState] = None,
+                   not_before: float = 0.0, now: Optional[float] = None) -> None:
+        """Schedule a game's next poll from its latest observed state
+
+        A None state means the poll learned nothing new (unchanged payload,
+        backoff) and the previous state is kept. Final games are dropped.
+        """
+        game = self._games.get(game_id)
+        if game is None:
+            return
+        now = time.time() if now is None else now
+        game.polls += 1
+        if state is not None:
+            game.state = state
+        if game.state == GameState.FINAL:
+            self.finished[game_id] = now
+            self.remove(game_id, now)
+            return
+        game.interval = self._interval_for(game, now)
+        game.due = max(now + game.interval, not_before)
+        self._push(game)
+
+    def checkpoint(self) -> Dict[str, Dict]:
+        """State and next due time per scheduled game, for a warm restart"""
+        return {
+            game_id: {'state': game.state.value, 'due': game.due}
+            for game_id, game in self._games.items()
+        }
+
+    def restore(self, game_id: str, state: GameState, due: float, now: Optional[float] = None) -> None:
+        """Carry a checkpointed state and due time over to a game added since"""
+        game = self._games.get(game_id)
+        if game is None:
+            return
+        now = time.time() if now is None else now
+        game.state = state
+        game.interval = self._interval_for(game, now)
+        game.due = due
+        self._push(game)
+
+    def metrics(self, now: Optional[float] = None) -> Dict:
+        """Per-game intervals, plus total polls against the fixed 15s cadence"""
+        now = time.time() if now is None else now
+        games = {}
+        polls = float(self._retired_polls)
+        baseline = self._retired_baseline
+        for game_id, game in self._games.items():
+            tracked = max(0.0, now - game.added_at)
+            game_baseline = tracked / BASELINE_INTERVAL
+            games[game_id] = {
+                'state': game.state.value,
+                'interval': round(game.interval, 1),
+                'next_poll_in': round(max(0.0, game.due - now), 1),
+                'polls': game.polls,
+                'baseline_polls': int(game_baseline),
+            }
+            polls += game.polls
+            baseline += game_baseline
+        return {
+            'games': games,
+            'tracked': len(self._games),
+            'finished': len(self.finished),
+            'polls': int(polls),
+            'baseline_polls': int(baseline),
+        }
@@ -0,0 +1,655 @@
+"""
+Fantasy Football Scoring System
+Comprehensive scoring calculation with ESPN-style defaults and commissioner customization
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+import hashlib
+import json
+
+try:
+    import numpy as np
+except ImportError:  # only needed for calc_points_batch
+    np = None
+
+# Default ESPN-style scoring configuration
+DEFAULT_SCORING_CONFIG = {
+    # Passing
+    "passing_yards": 0.04,  # 1 point per 25 yards
+    "passing_tds": 4.0,
+    "passing_ints": -2.0,
+    "passing_2pt": 2.0,
+    "passing_fumbles_lost": -2.0,
+    
+    # Rushing
+    "rushing_yards": 0.1,  # 1 point per 10 yards
+    "rushing_tds": 6.0,
+    "rushing_2pt": 2.0,
+    "rushing_fumbles_lost": -2.0,
+    
+    # Receiving
+    "receiving_yards": 0.1,  # 1 point per 10 yards
+    "receiving_tds": 6.0,
+    "receiving_receptions": 0.0,  # PPR variants: 0.5 or 1.0
+    "receiving_2pt": 2.0,
+    "receiving_fumbles_lost": -2.0,
+    
+    # Kicking. ESPN boxscores only give made/attempted totals, scored flat;
+    # sources with kick distances use the buckets instead
+    "fg_made": 3.0,
+    "fg_missed": -1.0,
+    "fg_made_0_19": 3.0,
+    "fg_made_20_29": 3.0,
+    "fg_made_30_39": 3.0,
+    "fg_made_40_49": 4.0,
+    "fg_made_50_plus": 5.0,
+    "fg_missed_0_19": -2.0,
+    "fg_missed_20_29": -1.0,
+    "fg_missed_30_39": -1.0,
+    "fg_missed_40_49": 0.0,
+    "fg_missed_50_plus": 0.0,
+    "pat_made": 1.0,
+    "pat_missed": -1.0,
+    
+    # Defense/Special Teams
+    "def_sacks": 1.0,
+    "def_ints": 2.0,
+    "def_fumbles_recovered": 2.0,
+    "def_fumbles_forced": 1.0,
+    "def_tds": 6.0,
+    "def_safeties": 2.0,
+    "def_blocks": 2.0,
+    "return_tds": 6.0,
+    
+    # Defense Points Allowed (team defense)
+    "def_points_allowed_0": 10.0,
+    "def_points_allowed_1_6": 7.0,
+    "def_points_allowed_7_13": 4.0,
+    "def_points_allowed_14_20": 1.0,
+    "def_points_allowed_21_27": 0.0,
+    "def_points_allowed_28_34": -1.0,
+    "def_points_allowed_35_plus": -4.0,
+    
+    # Defense Yards Allowed (team defense)
+    "def_yards_allowed_0_99": 10.0,
+    "def_yards_allowed_100_199": 5.0,
+    "def_yards_allowed_200_299": 3.0,
+    "def_yards_allowed_300_399": 0.0,
+    "def_yards_allowed_400_449": -1.0,
+    "def_yards_allowed_450_499": -3.0,
+    "def_yards_allowed_500_plus": -5.0,
+    
+    # Bonus scoring (optional)
+    "passing_300_yard_bonus": 0.0,
+    "passing_400_yard_bonus": 0.0,
+    "rushing_100_yard_bonus": 0.0,
+    "rushing_200_yard_bonus": 0.0,
+    "receiving_100_yard_bonus": 0.0,
+    "receiving_200_yard_bonus": 0.0,
+}
+
+# Scoring presets for common league types
+SCORING_PRESETS = {
+    "standard": DEFAULT_SCORING_CONFIG.copy(),
+    "ppr": {**DEFAULT_SCORING_CONFIG, "receiving_receptions": 1.0},
+    "half_ppr": {**DEFAULT_SCORING_CONFIG, "receiving_receptions": 0.5},
+    "6pt_passing_td": {**DEFAULT_SCORING_CONFIG, "passing_tds": 6.0},
+    "custom": {}  # Empty for full customization
+}
+
+# Bucketed rules, shared by the per-player and batch scorers.
+# Points allowed buckets are closed on the right: 0, 1-6, 7-13, ... 35+
+POINTS_ALLOWED_EDGES = (6, 13, 20, 27, 34)
+POINTS_ALLOWED_KEYS = (
+    "def_points_allowed_0",
+    "def_points_allowed_1_6",
+    "def_points_allowed_7_13",
+    "def_points_allowed_14_20",
+    "def_points_allowed_21_27",
+    "def_points_allowed_28_34",
+    "def_points_allowed_35_plus",
+)
+
+# Yards allowed buckets are closed on the left: 0-99, 100-199, ... 500+
+YARDS_ALLOWED_EDGES = (100, 200, 300, 400, 450, 500)
+YARDS_ALLOWED_KEYS = (
+    "def_yards_allowed_0_99",
+    "def_yards_allowed_100_199",
+    "def_yards_allowed_200_299",
+    "def_yards_allowed_300_399",
+    "def_yards_allowed_400_449",
+    "def_yards_allowed_450_499",
+    "def_yards_allowed_500_plus",
+)
+
+# Milestone bonuses: only the highest threshold reached pays out
+MILESTONE_BONUSES = (
+    ("passing_yards", (300, 400), ("passing_300_yard_bonus", "passing_400_yard_bonus")),
+    ("rushing_yards", (100, 200), ("rushing_100_yard_bonus", "rushing_200_yard_bonus")),
+    ("receiving_yards", (100, 200), ("receiving_100_yard_bonus", "receiving_200_yard_bonus")),
+)
+# Commissioner UI (camelCase) scoring rule names -> config keys
+LEAGUE_RULE_ALIASES = {
+    "passingYards": ("passing_yards",),
+    "passingTouchdowns": ("passing_tds",),
+    "interceptions": ("passing_ints",),
+    "rushingYards": ("rushing_yards",),
+    "rushingTouchdowns": ("rushing_tds",),
+    "receptions": ("receiving_receptions",),
+    "receivingYards": ("receiving_yards",),
+    "receivingTouchdowns": ("receiving_tds",),
+    "extraPointMade": ("pat_made",),
+    "extraPointMissed": ("pat_missed",),
+    "fieldGoalMade": ("fg_made", "fg_made_0_19", "fg_made_20_29", "fg_made_30_39", "fg_made_40_49", "fg_made_50_plus"),
+    "fieldGoalMissed": ("fg_missed", "fg_missed_0_19", "fg_missed_20_29", "fg_missed_30_39", "fg_missed_40_49",
+                        "fg_missed_50_plus"),
+    "fieldGoal_0_39": ("fg_made_0_19", "fg_made_20_29", "fg_made_30_39"),
+    "fieldGoal_40_49": ("fg_made_40_49",),
+    "fieldGoal_50_plus": ("fg_made_50_plus",),
+    # Keys of the worker's original FANTASY_SCORING_JSON format
+    "fumbles_lost": ("passing_fumbles_lost", "rushing_fumbles_lost", "receiving_fumbles_lost"),
+    "two_point_conversions": ("passing_2pt", "rushing_2pt", "receiving_2pt"),
+    "fg_made_0_39": ("fg_made_0_19", "fg_made_20_29", "fg_made_30_39"),
+}
+
+
+def config_from_league_rules(rules: Optional[Dict]) -> Dict[str, float]:
+    """
+    Build a scoring config from a league's stored scoringRules.
+    
+    Starts from DEFAULT_SCORING_CONFIG and applies both commissioner UI
+    names and native config keys. Non-numeric entries are ignored, and
+    distance-specific field goal values win over the flat fieldGoalMade.
+    """
+    config = DEFAULT_SCORING_CONFIG.copy()
+    if not rules:
+        return config
+    
+    numeric = {
+        name: float(value) for name, value in rules.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+    # Flat field goal values first so the bucketed ones override them
+    ordered = sorted(numeric.items(), key=lambda item: item[0] not in ("fieldGoalMade", "fieldGoalMissed"))
+    for name, value in ordered:
+        if name in LEAGUE_RULE_ALIASES:
+            for key in LEAGUE_RULE_ALIASES[name]:
+                config[key] = value
+        elif name in DEFAULT_SCORING_CONFIG:
+            config[name] = value
+    return config
+
+
+def unknown_rule_keys(rules: Optional[Dict]) -> List[str]:
+    """Numeric rule names config_from_league_rules would ignore"""
+    return sorted(
+        name for name, value in (rules or {}).items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+        and name not in LEAGUE_RULE_ALIASES and name not in DEFAULT_SCORING_CONFIG
+    )
+
+
+def calc_points(stats: Dict[str, int], scoring_cfg: Optional[Dict[str, float]] = None) -> float:
+    """
+    Calculate fantasy points based on player statistics and scoring configuration.
+    
+    Args:
+        stats: Dictionary of player statistics (stat_name -> value)
+        scoring_cfg: Optional scoring configuration. Uses DEFAULT_SCORING_CONFIG if None.
+    
+    Returns:
+        Total fantasy points as a float, rounded to 2 decimal places
+    """
+    if scoring_cfg is None:
+        scoring_cfg = DEFAULT_SCORING_CONFIG
+    
+    total_points = 0.0
+    
+    # Direct stat calculations
+    for stat_name, stat_value in stats.items():
+        if stat_name in scoring_cfg and stat_value:
+            points = stat_value * scoring_cfg[stat_name]
+            total_points += points
+    
+    # Handle special calculations (defense points/yards allowed, bonuses).
+    # Field goals (flat or by distance bucket) are scored in the linear pass above.
+    total_points += _calculate_defense_points(stats, scoring_cfg)
+    total_points += _calculate_defense_yards(stats, scoring_cfg)
+    total_points += _calculate_bonuses(stats, scoring_cfg)
+    
+    return round(total_points, 2)
+
+
+def calc_points_batch(
+    stats_table: Mapping[str, Sequence[float]],
+    scoring_cfgs: Optional[Sequence[Optional[Dict[str, float]]]] = None,
+) -> "np.ndarray":
+    """
+    Calculate fantasy points for many players under many scoring configurations.
+    
+    Linear stats are scored with a single matrix product; points allowed,
+    yards allowed and milestone bonuses are bucketed with searchsorted.
+    Each cell matches calc_points for the same stat line and configuration.
+    
+    Args:
+        stats_table: Columnar statistics keyed by stat name, e.g. a dict of
+            equal-length arrays or a pandas DataFrame. NaN marks a stat the
+            player does not have.
+        scoring_cfgs: Scoring configurations to evaluate. None entries (or
+            None for the whole list) use DEFAULT_SCORING_CONFIG.
+    
+    Returns:
+        Array of shape (players, configs), rounded to 2 decimal places
+    """
+    if np is None:
+        raise ImportError("calc_points_batch requires numpy")
+    
+    if scoring_cfgs is None:
+        scoring_cfgs = [None]
+    cfgs = [DEFAULT_SCORING_CONFIG if cfg is None else cfg for cfg in scoring_cfgs]
+    
+    stat_names = list(stats_table.keys())
+    columns = {name: np.asarray(stats_table[name], dtype=float) for name in stat_names}
+    n_players = len(next(iter(columns.values()))) if columns else 0
+    if not stat_names:
+        return np.zeros((n_players, len(cfgs)))
+    
+    values = np.column_stack([columns[name] for name in stat_names])
+    # column_stack copied, so absent stats can be zeroed in place
+    values[np.isnan(values)] = 0.0
+    
+    # Linear stats: (players x stats) @ (stats x configs)
+    weights = np.array([[cfg.get(name, 0) for cfg in cfgs] for name in stat_names], dtype=float)
+    total = values @ weights
+    
+    # Defense points allowed, only for players that carry the stat
+    points_allowed = columns.get("def_points_allowed")
+    if points_allowed is not None:
+        present = ~np.isnan(points_allowed)
+        filled = np.where(present, points_allowed, 0.0)
+        buckets = np.searchsorted(POINTS_ALLOWED_EDGES, filled, side="left") + 1
+        buckets[filled == 0] = 0
+        table = _bucket_table(cfgs, POINTS_ALLOWED_KEYS)
+        total += np.where(present[:, None], table[:, buckets].T, 0.0)
+    
+    # Defense yards allowed
+    yards_allowed = columns.get("def_yards_allowed")
+    if yards_allowed is not None:
+        present = ~np.isnan(yards_allowed)
+        filled = np.where(present, yards_allowed, 0.0)
+        buckets = np.searchsorted(YARDS_ALLOWED_EDGES, filled, side="right")
+        table = _bucket_table(cfgs, YARDS_ALLOWED_KEYS)
+        total += np.where(present[:, None], table[:, buckets].T, 0.0)
+    
+    # Milestone bonuses, bucket 0 pays nothing
+    for stat_name, thresholds, keys in MILESTONE_BONUSES:
+        if stat_name not in columns:
+            continue
+        yards = values[:, stat_names.index(stat_name)]
+        table = np.hstack([np.zeros((len(cfgs), 1)), _bucket_table(cfgs, keys)])
+        if not table.any():
+            continue
+        buckets = np.searchsorted(thresholds, yards, side="right")
+        total += table[:, buckets].T
+    
+    return np.round(total, 2)
+
+
+def _bucket_table(cfgs: Sequence[Dict[str, float]], keys: Sequence[str]) -> "np.ndarray":
+    """Configs x buckets matrix of point values."""
+    return np.array([[cfg.get(key, 0) for key in keys] for cfg in cfgs], dtype=float)
+
+
+def _calculate_defense_points(stats: Dict[str, int], scoring_cfg: Dict[str, float]) -> float:
+    """Calculate points based on defensive points allowed."""
+    points_allowed = stats.get("def_points_allowed", None)
+    if points_allowed is None:
+        return 0.0
+    
+    if points_allowed == 0:
+        return scoring_cfg.get("def_points_allowed_0", 0)
+    elif points_allowed <= 6:
+        return scoring_cfg.get("def_points_allowed_1_6", 0)
+    elif points_allowed <= 13:
+        return scoring_cfg.get("def_points_allowed_7_13", 0)
+    elif points_allowed <= 20:
+        return scoring_cfg.get("def_points_allowed_14_20", 0)
+    elif points_allowed <= 27:
+        return scoring_cfg.get("def_points_allowed_21_27", 0)
+    elif points_allowed <= 34:
+        return scoring_cfg.get("def_points_allowed_28_34", 0)
+    else:
+        return scoring_cfg.get("def_points_allowed_35_plus", 0)
+
+
+def _calculate_defense_yards(stats: Dict[str, int], scoring_cfg: Dict[str, float]) -> float:
+    """Calculate points based on defensive yards allowed."""
+    yards_allowed = stats.get("def_yards_allowed", None)
+    if yards_allowed is None:
+        return 0.0
+    
+    if yards_allowed < 100:
+        return scoring_cfg.get("def_yards_allowed_0_99", 0)
+    elif yards_allowed < 200:
+        return scoring_cfg.get("def_yards_allowed_100_199", 0)
+    elif yards_allowed < 300:
+        return scoring_cfg.get("def_yards_allowed_200_299", 0)
+    elif yards_allowed < 400:
+        return scoring_cfg.get("def_yards_allowed_300_399", 0)
+    elif yards_allowed < 450:
+        return scoring_cfg.get("def_yards_allowed_400_449", 0)
+    elif yards_allowed < 500:
+        return scoring_cfg.get("def_yards_allowed_450_499", 0)
+    else:
+        return scoring_cfg.get("def_yards_allowed_500_plus", 0)
+
+
+def _calculate_bonuses(stats: Dict[str, int], scoring_cfg: Dict[str, float]) -> float:
+    """Calculate bonus points for milestone achievements."""
+    total_points = 0.0
+    
+    # Passing bonuses
+    passing_yards = stats.get("passing_yards", 0)
+    if passing_yards >= 400:
+        total_points += scoring_cfg.get("passing_400_yard_bonus", 0)
+    elif passing_yards >= 300:
+        total_points += scoring_cfg.get("passing_300_yard_bonus", 0)
+    
+    # Rushing bonuses
+    rushing_yards = stats.get("rushing_yards", 0)
+    if rushing_yards >= 200:
+        total_points += scoring_cfg.get("rushing_200_yard_bonus", 0)
+    elif rushing_yards >= 100:
+        total_points += scoring_cfg.get("rushing_100_yard_bonus", 0)
+    
+    # Receiving bonuses
+    receiving_yards = stats.get("receiving_yards", 0)
+    if receiving_yards >= 200:
+        total_points += scoring_cfg.get("receiving_200_yard_bonus", 0)
+    elif receiving_yards >= 100:
+        total_points += scoring_cfg.get("receiving_100_yard_bonus", 0)
+    
+    return total_points
+
+
+# Config keys that drive bucketed rules rather than scoring a stat directly
+THRESHOLD_KEYS = frozenset(
+    POINTS_ALLOWED_KEYS
+    + YARDS_ALLOWED_KEYS
+    + tuple(key for _, _, keys in MILESTONE_BONUSES for key in keys)
+)
+
+# Stats that feed bucketed rules
+THRESHOLD_STATS = frozenset(
+    ("def_points_allowed", "def_yards_allowed")
+    + tuple(stat for stat, _, _ in MILESTONE_BONUSES)
+)
+
+
+@dataclass(frozen=True)
+class ScoringPlan:
+    """
+    Immutable, pre-compiled form of a scoring configuration.
+    
+    Zero weights are dropped, bucketed rules become lookup tables (or None
+    when every bucket is worth zero), and the plan carries a key that is
+    equal for any two configs that score identically.
+    """
+    linear: Tuple[Tuple[str, float], ...]
+    points_allowed: Optional[Tuple[float, ...]]
+    yards_allowed: Optional[Tuple[float, ...]]
+    bonuses: Tuple[Tuple[str, Tuple[int, ...], Tuple[float, ...]], ...]
+    key: str
+    weights: Dict[str, float] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "weights", dict(self.linear))
+    
+    def score(self, stats: Dict[str, int]) -> float:
+        """Score a stat line; identical to calc_points with the source config."""
+        total_points = 0.0
+        weights = self.weights
+        
+        for stat_name, stat_value in stats.items():
+            weight = weights.get(stat_name)
+            if weight is not None and stat_value:
+                total_points += stat_value * weight
+        
+        return round(self._threshold_points(stats, total_points), 2)
+    
+    def score_delta(self, previous_stats: Dict[str, int], current_stats: Dict[str, int],
+                    stat_deltas: Dict[str, int]) -> float:
+        """
+        Points gained between two stat lines, given the stats that changed.
+        
+        Linear rules are scored straight from the deltas; bucketed rules are
+        only re-evaluated when one of their own stats changed value or
+        appeared/disappeared (a shutout's def_points_allowed first shows up
+        as 0, which is no value delta but moves it into a bucket).
+        """
+        delta = 0.0
+        weights = self.weights
+        for stat_name, stat_delta in stat_deltas.items():
+            weight = weights.get(stat_name)
+            if weight is not None:
+                delta += stat_delta * weight
+        
+        if not stat_deltas.keys() & THRESHOLD_STATS and all(
+            (stat_name in previous_stats) == (stat_name in current_stats) for stat_name in THRESHOLD_STATS
+        ):
+            return delta
+        return delta + self._threshold_points(current_stats) - self._threshold_points(previous_stats)
+    
+    def _threshold_points(self, stats: Dict[str, int], total_points: float = 0.0) -> float:
+        """Add points from defense buckets and milestone bonuses to total_points."""
+        if self.points_allowed is not None:
+            points_allowed = stats.get("def_points_allowed")
+            if points_allowed is not None:
+                bucket = 0 if points_allowed == 0 else bisect_left(POINTS_ALLOWED_EDGES, points_allowed) + 1
+                total_points += self.points_allowed[bucket]
+        
+        if self.yards_allowed is not None:
+            yards_allowed = stats.get("def_yards_allowed")
+            if yards_allowed is not None:
+                total_points += self.yards_allowed[bisect_right(YARDS_ALLOWED_EDGES, yards_allowed)]
+        
+        for stat_name, thresholds, values in self.bonuses:
+            bucket = bisect_right(thresholds, stats.get(stat_name, 0))
+            if bucket:
+                total_points += values[bucket - 1]
+        
+        return total_points
+
+
+def compile_scoring_plan(scoring_cfg: Optional[Dict[str, float]] = None) -> ScoringPlan:
+    """Compile a scoring configuration into a ScoringPlan (cached per distinct config)."""
+    if scoring_cfg is None:
+        scoring_cfg = DEFAULT_SCORING_CONFIG
+    return _compile_scoring_plan(frozenset(scoring_cfg.items()))
+
+
+@lru_cache(maxsize=256)
+def _compile_scoring_plan(items: FrozenSet[Tuple[str, float]]) -> ScoringPlan:
+    scoring_cfg = dict(items)
+    
+    linear = tuple(sorted(
+        (stat, float(weight))
+        for stat, weight in scoring_cfg.items()
+        if weight and stat not in THRESHOLD_KEYS
+    ))
+    
+    def table(keys: Sequence[str]) -> Optional[Tuple[float, ...]]:
+        values = tuple(float(scoring_cfg.get(key, 0)) for key in keys)
+        return values if any(values) else None
+    
+    bonuses = tuple(
+        (stat, thresholds, values)
+        for stat, thresholds, keys in MILESTONE_BONUSES
+        for values in [table(keys)]
+        if values is not None
+    )
+    points_allowed = table(POINTS_ALLOWED_KEYS)
+    yards_allowed = table(YARDS_ALLOWED_KEYS)
+    
+    # Key on the effective (non-zero) rules so equivalent configs share a plan key
+    canonical = json.dumps(
+        sorted((key, float(value)) for key, value in scoring_cfg.items() if value),
+        separators=(",", ":")
+    )
+    key = hashlib.sha1(canonical.encode()).hexdigest()[:16]
+    
+    return ScoringPlan(
+        linear=linear,
+        points_allowed=points_allowed,
+        yards_allowed=yards_allowed,
+        bonuses=bonuses,
+        key=key,
+    )
+
+
+class ScoringEngine:
+    """
+    Shared scorer for several leagues' configurations at once.
+    
+    Leagues are registered with their configs; leagues whose configs score
+    identically share one compiled plan, so each stat change is scored once
+    per distinct plan rather than once per league.
+    """
+    
+    def __init__(self):
+        self.plans: Dict[str, ScoringPlan] = {}
+        self.league_plans: Dict[str, str] = {}
+    
+    def register(self, league_id: str, scoring_cfg: Optional[Dict[str, float]] = None) -> str:
+        """Register (or re-register) a league and return its plan key."""
+        plan = compile_scoring_plan(scoring_cfg)
+        self.unregister(league_id)
+        self.plans.setdefault(plan.key, plan)
+        self.league_plans[league_id] = plan.key
+        return plan.key
+    
+    def unregister(self, league_id: str) -> None:
+        """Forget a league, dropping its plan once no league uses it."""
+        key = self.league_plans.pop(league_id, None)
+        if key is not None and key not in self.league_plans.values():
+            self.plans.pop(key, None)
+    
+    def plan_for(self, league_id: str) -> ScoringPlan:
+        return self.plans[self.league_plans[league_id]]
+    
+    def groups(self) -> Dict[str, List[str]]:
+        """League ids grouped by the plan they score with."""
+        groups: Dict[str, List[str]] = {}
+        for league_id, key in self.league_plans.items():
+            groups.setdefault(key, []).append(league_id)
+        return groups
+    
+    def score(self, stats: Dict[str, int]) -> Dict[str, float]:
+        """Total points for a stat line under every registered plan."""
+        return {key: plan.score(stats) for key, plan in self.plans.items()}
+    
+    def score_deltas(self, previous_stats: Dict[str, int], current_stats: Dict[str, int],
+                     stat_deltas: Dict[str, int],
+                     previous_points: Optional[Dict[str, float]] = None) -> Dict[str, Tuple[float, float]]:
+        """
+        (points delta, new total) per plan for one player's stat change.
+        
+        previous_points holds the running totals from the last snapshot;
+        plans missing from it are scored from previous_stats once.
+        """
+        previous_points = previous_points or {}
+        results = {}
+        for key, plan in self.plans.items():
+            previous_total = previous_points.get(key)
+            if previous_total is None:
+                previous_total = plan.score(previous_stats)
+            delta = plan.score_delta(previous_stats, current_stats, stat_deltas)
+            results[key] = (round(delta, 2), round(previous_total + delta, 2))
+        return results
+
+
+class ScoringSystem:
+    """Commissioner-configurable scoring system with presets and validation."""
+    
+    def __init__(self, preset: str = "standard"):
+        """Initialize with a scoring preset."""
+        if preset not in SCORING_PRESETS:
+            raise ValueError(f"Invalid preset: {preset}. Choose from: {list(SCORING_PRESETS.keys())}")
+        
+        self.config = SCORING_PRESETS[preset].copy()
+        self.preset_name = preset
+    
+    @property
+    def config(self) -> Mapping[str, float]:
+        """The scoring configuration, read-only. Change it via customize() or by reassigning."""
+        return MappingProxyType(self._config)
+    
+    @config.setter
+    def config(self, config: Mapping[str, float]) -> None:
+        # Copied so later changes to the caller's dict can't go stale against the plan
+        self._config = dict(config)
+        self.plan = compile_scoring_plan(self._config)
+    
+    @property
+    def cache_key(self) -> str:
+        """Key shared by every configuration that scores identically."""
+        return self.plan.key
+    
+    def customize(self, customizations: Dict[str, float]) -> None:
+        """Apply custom scoring values to the configuration."""
+        for stat, value in customizations.items():
+            if not isinstance(value, (int, float)):
+                raise ValueError(f"Scoring value for {stat} must be numeric, got {type(value)}")
+        self.config = {**self._config, **{stat: float(value) for stat, value in customizations.items()}}
+    
+    def calculate(self, stats: Dict[str, int]) -> float:
+        """Calculate points using the compiled scoring plan."""
+        return self.plan.score(stats)
+    
+    def get_config(self) -> Dict[str, float]:
+        """Get the current scoring configuration."""
+        return dict(self._config)
+    
+    def save_to_json(self, filepath: str) -> None:
+        """Save the scoring configuration to a JSON file."""
+        with open(filepath, 'w') as f:
+            json.dump({
+                "preset": self.preset_name,
+                "config": self._config
+            }, f, indent=2)
+    
+    @classmethod
+    def load_from_json(cls, filepath: str) -> 'ScoringSystem':
+        """Load a scoring configuration from a JSON file."""
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+        
+        system = cls(data.get("preset", "custom"))
+        system.config = data["config"]
+        return system
+    
+    def validate_config(self) -> List[str]:
+        """Validate the scoring configuration and return any warnings."""
+        warnings = []
+        
+        # Check for missing essential stats
+        essential_stats = [
+            "passing_yards", "passing_tds", "rushing_yards", "rushing_tds",
+            "receiving_yards", "receiving_tds"
+        ]
+        for stat in essential_stats:
+            if stat not in self.config:
+                warnings.append(f"Missing essential stat: {stat}")
+        
+        # Check for unusual values
+        if self.config.get("passing_tds", 0) > 10:
+            warnings.append("Passing TD value seems unusually high")
+        
+        if self.config.get("receiving_receptions", 0) > 2:
+            warnings.append("Reception value seems unusually high for PPR")
+        
+        return warnings
\ No newline at end of file
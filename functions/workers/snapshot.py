@@ -0,0 +1,252 @@
+"""
+Binary encoding for player_stats:{game}:{player} snapshots
+
+A snapshot used to be the JSON of {'name', 'stats', 'points'}, so every
+key repeated the player's name and every stat name. Now it is a versioned
+little-endian record:
+
+    version   u8     schema version (indexes SNAPSHOT_SCHEMAS)
+    n_points  u16    number of scoring plan totals (u8 in version 1)
+    present   u32    bitmask of the schema slots that follow
+    values    i32 x popcount(present), in schema order
+    points    (8-byte plan key, f64 total) x n_points
+
+Names live once per game in the player_names:{game} hash. JSON snapshots
+written before the switch still decode, and they are rewritten in the new
+format the next time the player's line changes (or in bulk with
+`python snapshot.py migrate`).
+
+SnapshotCache keeps a write-through copy of each game's snapshots in
+process, so steady-state polls never read them back from Redis.
+"""
+
+import json
+import os
+import struct
+import sys
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from boxscore import STAT_NAMES
+from metrics import MetricsRegistry
+
+# Stat slot order per version. Changing boxscore.STAT_NAMES means adding a
+# version here; old snapshots keep decoding with their own schema.
+_SCHEMA_V1 = (
+    'def_ints', 'def_tds', 'fg_made', 'fg_missed', 'passing_ints',
+    'passing_tds', 'passing_yards', 'pat_made', 'pat_missed',
+    'receiving_receptions', 'receiving_tds', 'receiving_yards',
+    'rushing_fumbles_lost', 'rushing_tds', 'rushing_yards',
+)
+SNAPSHOT_SCHEMAS: Dict[int, Tuple[str, ...]] = {
+    1: _SCHEMA_V1,
+    2: _SCHEMA_V1,  # n_points widened to u16 for workers serving over 255 plans
+}
+SNAPSHOT_VERSION = 2
+
+if SNAPSHOT_SCHEMAS[SNAPSHOT_VERSION] != STAT_NAMES:
+    raise RuntimeError("boxscore.STAT_NAMES changed: add a new SNAPSHOT_SCHEMAS version")
+
+# Header per version: (version, n_points, present)
+_HEADERS = {1: struct.Struct('<BBI'), 2: struct.Struct('<BHI')}
+_HEADER = _HEADERS[SNAPSHOT_VERSION]
+_POINT = struct.Struct('<8sd')
+_SLOTS = {name: 1 << slot for slot, name in enumerate(STAT_NAMES)}
+
+# (version, present mask) -> (values struct, slot names)
+_layouts: Dict[Tuple[int, int], Tuple[struct.Struct, Tuple[str, ...]]] = {}
+
+
+def snapshot_key(game_id: str, player_id: str) -> str:
+    return f"player_stats:{game_id}:{player_id}"
+
+
+def names_key(game_id: str) -> str:
+    return f"player_names:{game_id}"
+
+
+def _layout(version: int, present: int) -> Tuple[struct.Struct, Tuple[str, ...]]:
+    layout = _layouts.get((version, present))
+    if layout is None:
+        names = tuple(name for slot, name in enumerate(SNAPSHOT_SCHEMAS[version]) if present >> slot & 1)
+        layout = _layouts[(version, present)] = (struct.Struct(f'<{len(names)}i'), names)
+    return layout
+
+
+def encode_snapshot(stats: Dict[str, int], points: Dict[str, float]) -> bytes:
+    """Pack a stat line and its per-plan point totals"""
+    present = 0
+    for name in stats:
+        present |= _SLOTS[name]
+    values, names = _layout(SNAPSHOT_VERSION, present)
+    parts = [
+        _HEADER.pack(SNAPSHOT_VERSION, len(points), present),
+        values.pack(*[stats[name] for name in names]),
+    ]
+    parts.extend(_POINT.pack(bytes.fromhex(key), total) for key, total in points.items())
+    return b''.join(parts)
+
+
+def is_json_snapshot(raw: bytes) -> bool:
+    """Written before the binary format (a JSON object never starts with a version byte)"""
+    return raw[:1] == b'{'
+
+
+def decode_snapshot(raw: bytes) -> Tuple[Dict[str, int], Dict[str, float]]:
+    """(stats, points) from a binary snapshot or a legacy JSON one"""
+    if is_json_snapshot(raw):
+        legacy = json.loads(raw)
+        return legacy.get('stats', {}), legacy.get('points') or {}
+
+    header = _HEADERS[raw[0]]
+    version, n_points, present = header.unpack_from(raw)
+    values, names = _layout(version, present)
+    stats = dict(zip(names, values.unpack_from(raw, header.size)))
+    offset = header.size + values.size
+    points = {}
+    for _ in range(n_points):
+        key, total = _POINT.unpack_from(raw, offset)
+        points[key.hex()] = total
+        offset += _POINT.size
+    return stats, points
+
+
+class SnapshotCache:
+    """Latest encoded snapshot per game and player, LRU by game under a byte budget
+
+    A game is either wholly cached or absent: once loaded from Redis, a
+    player missing from a cached game is a new player, not a cache miss.
+    Redis stays the durable copy; callers put() only what they've written
+    there, and evict a game when it finishes or moves to another shard.
+    """
+
+    def __init__(self, max_bytes: int, metrics: Optional[MetricsRegistry] = None):
+        self.max_bytes = max_bytes
+        self.games: OrderedDict[str, Dict[str, bytes]] = OrderedDict()
+        self.game_bytes: Dict[str, int] = {}
+        self.bytes = 0
+
+        metrics = metrics or MetricsRegistry()
+        self.lookups = metrics.counter(
+            'live_worker_snapshot_cache_lookups_total', 'Per-game snapshot cache lookups by result'
+        )
+        self.evictions = metrics.counter(
+            'live_worker_snapshot_cache_evictions_total', 'Games dropped from the snapshot cache by reason'
+        )
+        self.size_bytes = metrics.gauge(
+            'live_worker_snapshot_cache_bytes', 'Approximate memory held by cached snapshots'
+        )
+
+    @staticmethod
+    def _cost(player_id: str, snapshot: bytes) -> int:
+        return sys.getsizeof(player_id) + sys.getsizeof(snapshot)
+
+    def get(self, game_id: str, player_ids: List[str]) -> Optional[List[Optional[bytes]]]:
+        """Cached snapshots in player_ids order, or None if the game isn't cached"""
+        game = self.games.get(game_id)
+        if game is None:
+            self.lookups.inc(result='miss')
+            return None
+        self.games.move_to_end(game_id)
+        self.lookups.inc(result='hit')
+        return [game.get(player_id) for player_id in player_ids]
+
+    def put(self, game_id: str, snapshots: Iterable[Tuple[str, bytes]]) -> None:
+        """Record snapshots as stored in Redis, caching the game if it wasn't"""
+        game = self.games.get(game_id)
+        if game is None:
+            game = self.games[game_id] = {}
+            self.game_bytes[game_id] = 0
+        self.games.move_to_end(game_id)
+        added = 0
+        for player_id, snapshot in snapshots:
+            previous = game.get(player_id)
+            added += self._cost(player_id, snapshot) - (self._cost(player_id, previous) if previous else 0)
+            game[player_id] = snapshot
+        self.game_bytes[game_id] += added
+        self.bytes += added
+        # Least recently polled games go first; the game just written stays
+        while self.bytes > self.max_bytes and len(self.games) > 1:
+            self._drop(next(iter(self.games)), 'budget')
+        self.size_bytes.set(self.bytes)
+
+    def evict(self, game_id: str, reason: str = 'final') -> None:
+        if game_id in self.games:
+            self._drop(game_id, reason)
+            self.size_bytes.set(self.bytes)
+
+    def retain(self, game_ids: Iterable[str]) -> None:
+        """Drop every game not in game_ids (no longer tracked or owned here)"""
+        keep = set(game_ids)
+        for game_id in [game_id for game_id in self.games if game_id not in keep]:
+            self._drop(game_id, 'unscheduled')
+        self.size_bytes.set(self.bytes)
+
+    def _drop(self, game_id: str, reason: str) -> None:
+        del self.games[game_id]
+        self.bytes -= self.game_bytes.pop(game_id)
+        self.evictions.inc(reason=reason)
+
+
+async def migrate_json_snapshots(redis_client, batch: int = 500) -> int:
+    """Rewrite every JSON player_stats key in the binary format, keeping TTLs
+
+    redis_client must not decode responses. Returns the number of keys
+    migrated; safe to run while the worker is live (a key rewritten by the
+    worker in between is simply skipped as already binary).
+    """
+    migrated = 0
+    keys = []
+    async for key in redis_client.scan_iter(match='player_stats:*', count=batch):
+        keys.append(key)
+        if len(keys) >= batch:
+            migrated += await _migrate_batch(redis_client, keys)
+            keys = []
+    if keys:
+        migrated += await _migrate_batch(redis_client, keys)
+    return migrated
+
+
+async def _migrate_batch(redis_client, keys) -> int:
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.get(key)
+            pipe.pttl(key)
+        results = await pipe.execute()
+
+    migrated = 0
+    names: Dict[str, Dict[str, str]] = {}
+    names_ttl: Dict[str, int] = {}
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for key, raw, ttl in zip(keys, results[::2], results[1::2]):
+            if not raw or not is_json_snapshot(raw):
+                continue
+            legacy = json.loads(raw)
+            _, game_id, player_id = key.decode().split(':', 2)
+            pipe.set(key, encode_snapshot(legacy.get('stats', {}), legacy.get('points') or {}),
+                     px=ttl if ttl > 0 else None)
+            if legacy.get('name'):
+                names.setdefault(game_id, {})[player_id] = legacy['name']
+                names_ttl[game_id] = max(names_ttl.get(game_id, 0), ttl)
+            migrated += 1
+        for game_id, mapping in names.items():
+            pipe.hset(names_key(game_id), mapping=mapping)
+            if names_ttl[game_id] > 0:
+                pipe.pexpire(names_key(game_id), names_ttl[game_id])
+        await pipe.execute()
+    return migrated
+
+
+if __name__ == "__main__":
+    import asyncio
+    import redis.asyncio as redis
+
+    if sys.argv[1:] != ['migrate']:
+        sys.exit("Usage: REDIS_URL=redis://... python snapshot.py migrate")
+
+    async def main():
+        client = redis.from_url(os.environ['REDIS_URL'])
+        print(f"Migrated {await migrate_json_snapshots(client)} JSON snapshots")
+        await client.aclose()
+
+    asyncio.run(main())
@@ -0,0 +1,23 @@
+from boxscore import parse_boxscore
+from scoring import calc_points, config_from_league_rules
+
+
+def kicking_boxscore(fg: str, xp: str):
+    return {'boxscore': {'players': [{'statistics': [{
+        'name': 'kicking',
+        'labels': ['FG', 'PCT', 'LONG', 'XP', 'PTS'],
+        'athletes': [{'athlete': {'id': 'k1', 'displayName': 'Kicker'}, 'stats': [fg, '66.7', '47', xp, '9']}],
+    }]}]}}
+
+
+def test_parsed_field_goals_score():
+    stats = parse_boxscore(kicking_boxscore('2/3', '3/3')).to_dict()['k1']['stats']
+    assert stats == {'fg_made': 2, 'fg_missed': 1, 'pat_made': 3, 'pat_missed': 0}
+    # 2 x 3 made, 1 x -1 missed, 3 PATs
+    assert calc_points(stats) == 8.0
+
+
+def test_league_field_goal_rules_apply_to_boxscore_kicks():
+    stats = parse_boxscore(kicking_boxscore('2/2', '0/0')).to_dict()['k1']['stats']
+    config = config_from_league_rules({'fieldGoalMade': 4, 'fieldGoalMissed': -2})
+    assert calc_points(stats, config) == 8.0
@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+import fakeredis
+
+from checkpoint import CheckpointStore
+from event_ids import EventIdResolver
+from live_worker import LiveGameWorker
+from scheduler import GameState
+
+TRACKED = {
+    '401': {'id': 1001, 'start_date': '2024-08-31T16:00:00.000Z'},
+    '402': {'id': 1002, 'start_date': '2024-08-31T19:30:00.000Z'},
+    '403': {'id': 1003, 'start_date': '2024-08-31T12:00:00.000Z'},
+}
+
+
+def worker_on(server) -> LiveGameWorker:
+    worker = LiveGameWorker()
+    worker.redis_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    worker.checkpoints = CheckpointStore(worker.redis_client)
+    worker.event_ids = EventIdResolver(None, ':memory:', aliases={})
+    return worker
+
+
+def saved_worker(server, next_refresh: float) -> LiveGameWorker:
+    worker = worker_on(server)
+    worker.tracked_games = dict(TRACKED)
+    worker.next_game_refresh = next_refresh
+    now = time.time()
+
+    async def run():
+        await worker.sync_schedule()
+        worker.scheduler.reschedule('401', GameState.CRITICAL, now=now)
+        worker.scheduler.reschedule('402', GameState.HALFTIME, now=now)
+        worker.scheduler.reschedule('403', GameState.FINAL, now=now)
+        worker.fetch_validators['401'] = {'etag': '"abc"', 'last_modified': 'Sat, 31 Aug 2024 17:00:00 GMT'}
+        worker.payload_hashes['401'] = 'f' * 32
+        worker.backoff_times['402'] = now + 120
+        worker.backoff_attempts['402'] = 2
+        await worker.save_checkpoint()
+
+    asyncio.run(run())
+    return worker
+
+
+def test_checkpoint_round_trips_into_a_fresh_worker():
+    server = fakeredis.FakeServer()
+    before = saved_worker(server, next_refresh=time.time() + 3600)
+    after = worker_on(server)
+    asyncio.run(after.restore_checkpoint())
+
+    assert after.tracked_games == TRACKED
+    assert after.next_game_refresh == before.next_game_refresh
+    assert after.fetch_validators == before.fetch_validators
+    assert after.payload_hashes == before.payload_hashes
+    assert after.backoff_times == before.backoff_times
+    assert after.backoff_attempts == before.backoff_attempts
+    assert set(after.scheduler.finished) == {'403'}
+    # Same states; the backing-off game stays held until its backoff ends
+    expected = before.scheduler.checkpoint()
+    expected['402']['due'] = max(expected['402']['due'], before.backoff_times['402'])
+    assert after.scheduler.checkpoint() == expected
+    assert set(expected) == {'401', '402'}
+    assert after.event_ids.event_ids == {'1001': '401', '1002': '402', '1003': '403'}
+
+
+def test_stale_slate_restores_only_per_game_state():
+    server = fakeredis.FakeServer()
+    before = saved_worker(server, next_refresh=time.time() - 1)
+    after = worker_on(server)
+    asyncio.run(after.restore_checkpoint())
+
+    assert after.tracked_games == {}
+    assert len(after.scheduler) == 0
+    assert after.fetch_validators == before.fetch_validators
+    assert after.payload_hashes == before.payload_hashes
+    assert after.backoff_times == before.backoff_times
@@ -0,0 +1,19 @@
+import json
+import logging
+
+from event_ids import ALIAS_FILES, DATA_DIR, load_team_aliases
+
+
+def test_repo_alias_files_load():
+    assert load_team_aliases(DATA_DIR)
+
+
+def test_alias_dir_is_read(tmp_path):
+    (tmp_path / ALIAS_FILES[0]).write_text(json.dumps({'Miami (FL)': 'Miami', '__comment': 'skipped'}))
+    assert load_team_aliases(str(tmp_path)) == {'miami fl': 'miami'}
+
+
+def test_missing_alias_files_warn(tmp_path, caplog):
+    with caplog.at_level(logging.WARNING, logger='event_ids'):
+        assert load_team_aliases(str(tmp_path)) == {}
+    assert 'No team alias files found' in caplog.text
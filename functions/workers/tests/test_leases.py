@@ -0,0 +1,82 @@
+import asyncio
+
+import fakeredis
+
+from leases import GameLeaseManager, rendezvous_owner
+
+GAMES = [f"4015{n:02d}" for n in range(40)]
+
+
+def shards(ttl=30.0):
+    server = fakeredis.FakeServer()
+    client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    return client, GameLeaseManager(client, 'w1', ttl=ttl), GameLeaseManager(client, 'w2', ttl=ttl)
+
+
+async def settle(*managers):
+    # The first heartbeat of each shard can't see members that joined after it
+    for _ in range(2):
+        for manager in managers:
+            await manager.heartbeat(GAMES)
+
+
+def test_two_shards_split_games_by_rendezvous_hash():
+    client, w1, w2 = shards()
+
+    async def run():
+        await settle(w1, w2)
+        return await client.get(w1.lease_key(GAMES[0])), await w1.assignments()
+
+    holder, assignments = asyncio.run(run())
+    assert set(w1.owned).isdisjoint(w2.owned)
+    assert set(w1.owned) | set(w2.owned) == set(GAMES)
+    assert all(rendezvous_owner(game_id, ['w1', 'w2']) == 'w1' for game_id in w1.owned)
+    assert 5 < len(w1.owned) < 35
+    assert holder == rendezvous_owner(GAMES[0], ['w1', 'w2'])
+    assert sorted(assignments['w2']['games']) == sorted(w2.owned)
+    assert all(w1.owns(game_id) != w2.owns(game_id) for game_id in GAMES)
+
+
+def test_expired_shard_games_are_taken_over():
+    _, w1, w2 = shards(ttl=0.2)
+
+    async def run():
+        await settle(w1, w2)
+        orphaned = set(w2.owned)
+        # w2 stops heartbeating: its membership and leases lapse after one TTL
+        await asyncio.sleep(0.3)
+        assert not any(w2.owns(game_id) for game_id in orphaned)
+        await w1.heartbeat(GAMES)
+        return orphaned
+
+    orphaned = asyncio.run(run())
+    assert orphaned and set(w1.owned) == set(GAMES)
+    assert w1.workers == ['w1']
+
+
+def test_stop_releases_leases_without_waiting_for_the_ttl():
+    client, w1, w2 = shards()
+
+    async def run():
+        await settle(w1, w2)
+        await w2.stop()
+        assert await client.zrange(w2.members_key, 0, -1) == ['w1']
+        assert 'w2' not in await w1.assignments()
+        await w1.heartbeat(GAMES)
+
+    asyncio.run(run())
+    assert not w2.owned
+    assert set(w1.owned) == set(GAMES)
+
+
+def test_lease_taken_by_another_shard_is_dropped_on_renewal():
+    client, w1, _ = shards()
+
+    async def run():
+        await w1.heartbeat(GAMES)
+        await client.set(w1.lease_key(GAMES[0]), 'intruder')
+        await w1.heartbeat(GAMES)
+
+    asyncio.run(run())
+    assert GAMES[0] not in w1.owned
+    assert len(w1.owned) == len(GAMES) - 1
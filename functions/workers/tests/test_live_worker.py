@@ -0,0 +1,123 @@
+import asyncio
+
+import fakeredis
+import httpx
+import pytest
+
+from live_worker import LiveGameWorker
+from replay import SyntheticGame
+from scheduler import GameState
+from scoring import config_from_league_rules
+
+
+def make_worker(payload: bytes) -> LiveGameWorker:
+    """Worker whose ESPN requests always return one payload"""
+    worker = LiveGameWorker()
+    worker.http_client = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, content=payload, headers={'etag': '"v1"'})
+    ))
+    server = fakeredis.FakeServer()
+    worker.redis_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    worker.snapshot_redis = fakeredis.FakeAsyncRedis(server=server)
+    return worker
+
+
+def test_failed_update_is_retried_with_the_same_payload():
+    game = SyntheticGame('401', polls=10, change_rate=1.0, seed=1)
+    game.payload()
+    worker = make_worker(game.payload())
+    calls = []
+    update_player_deltas = worker.update_player_deltas
+
+    async def flaky_update(game_id, current_stats):
+        calls.append(game_id)
+        if len(calls) == 1:
+            raise ConnectionError("redis went away")
+        return await update_player_deltas(game_id, current_stats)
+
+    worker.update_player_deltas = flaky_update
+
+    async def run():
+        with pytest.raises(ConnectionError):
+            await worker.poll_game('401')
+        assert '401' not in worker.payload_hashes
+        assert '401' not in worker.fetch_validators
+        assert await worker.poll_game('401') is not None
+        # Processed now: the identical payload is skipped
+        assert await worker.poll_game('401') is None
+
+    asyncio.run(run())
+    assert calls == ['401', '401']
+    assert worker.fetch_validators['401'] == {'etag': '"v1"'}
+
+
+def test_slow_game_does_not_delay_other_polls():
+    worker = make_worker(b'')
+    worker.poll_jitter = 0.0
+    stuck = asyncio.Event()
+    polled = []
+
+    async def poll_game(game_id):
+        polled.append(game_id)
+        if game_id == '401':
+            await stuck.wait()
+        return GameState.LIVE
+
+    worker.poll_game = poll_game
+
+    async def run():
+        for game_id in ('401', '402', '403'):
+            worker.scheduler.add(game_id)
+        first = await asyncio.wait_for(worker.run_polling_cycle(['401', '402', '403']), timeout=0.1)
+        # The fast games finish and are rescheduled while 401 is still out
+        for _ in range(20):
+            await asyncio.sleep(0)
+        assert sorted(polled) == ['401', '402', '403']
+        assert set(worker.inflight_polls) == {'401'}
+        games = worker.scheduler.metrics()['games']
+        assert games['402']['polls'] == games['403']['polls'] == 1 and games['401']['polls'] == 0
+
+        # The next cycle skips the game in flight instead of waiting on it
+        second = await asyncio.wait_for(worker.run_polling_cycle(['401', '402', '403']), timeout=0.1)
+        await asyncio.wait_for(second, timeout=0.5)
+        assert polled.count('402') == polled.count('403') == 2 and polled.count('401') == 1
+        assert not first.done()
+
+        stuck.set()
+        await asyncio.wait_for(first, timeout=0.5)
+        assert not worker.inflight_polls
+
+    asyncio.run(run())
+
+
+def test_group_payloads_share_points_between_leagues_on_one_plan():
+    worker = make_worker(b'')
+    ppr = worker.scoring_engine.register('league-a', config_from_league_rules({'receptions': 1}))
+    assert worker.scoring_engine.register('league-b', config_from_league_rules({'receptions': 1.0})) == ppr
+    standard = worker.scoring_engine.register('league-c', config_from_league_rules({'passingTouchdowns': 6}))
+    published = []
+
+    class Recorder:
+        async def publish(self, game_id, deltas, groups=None, entry_id=None):
+            published.append((game_id, deltas, groups))
+
+    worker.publisher = Recorder()
+
+    def line(receptions, yards):
+        return {'wr1': {'name': 'Receiver', 'stats': {'receiving_receptions': receptions, 'receiving_yards': yards}}}
+
+    async def run():
+        await worker.update_player_deltas('401', line(2, 20))
+        deltas = await worker.update_player_deltas('401', line(5, 50))
+        await worker.publish_updates('401', deltas)
+
+    asyncio.run(run())
+    [(game_id, deltas, groups)] = published
+    assert game_id == '401' and 'points' not in deltas[0]
+    assert deltas[0]['stat_deltas'] == {'receiving_receptions': 3, 'receiving_yards': 30}
+    assert {group['config_key']: group for group in groups} == {
+        ppr: {'config_key': ppr, 'league_ids': ['league-a', 'league-b'], 'updates': [
+            {'player_id': 'wr1', 'fantasy_points_delta': 6.0, 'total_fantasy_points': 10.0}]},
+        standard: {'config_key': standard, 'league_ids': ['league-c'], 'updates': [
+            {'player_id': 'wr1', 'fantasy_points_delta': 3.0, 'total_fantasy_points': 5.0}]},
+    }
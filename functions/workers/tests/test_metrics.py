@@ -0,0 +1,90 @@
+import asyncio
+import random
+
+import httpx
+
+from scheduler import GameState
+from metrics import CycleProfiler, Histogram, MetricsRegistry, MetricsServer
+from replay import SyntheticGame
+from test_live_worker import make_worker
+
+
+def test_quantiles_stay_within_observed_range():
+    rng = random.Random(4)
+    for _ in range(200):
+        histogram = Histogram('latency_seconds', '', buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25))
+        values = [rng.uniform(0.0001, 0.3) ** rng.choice((1, 3)) for _ in range(rng.randint(1, 40))]
+        for value in values:
+            histogram.observe(value, game_id='401')
+        series = histogram.merged()
+        for q in (0.0, 0.5, 0.95, 0.99, 1.0):
+            assert min(values) <= series.quantile(q) <= max(values)
+
+
+def test_merged_tracks_min_across_series():
+    histogram = Histogram('latency_seconds', '', buckets=(0.1, 1.0))
+    histogram.observe(0.2, game_id='401')
+    histogram.observe(0.05, game_id='402')
+    assert histogram.merged().min == 0.05
+    assert histogram.merged().quantile(1.0) == 0.2
+
+
+def test_fetch_series_removed_when_game_finishes():
+    game = SyntheticGame('401', polls=3, change_rate=1.0, seed=1)
+    worker = make_worker(b'')
+    worker.http_client = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, content=game.payload())
+    ))
+
+    async def publish_updates(game_id, deltas):
+        pass
+
+    worker.publish_updates = publish_updates
+
+    async def run():
+        states = []
+        for _ in range(3):
+            states.append(await worker.poll_game('401'))
+            if states[-1] != GameState.FINAL:
+                assert worker.fetch_seconds.series
+        return states
+
+    assert asyncio.run(run())[-1] == GameState.FINAL
+    assert not worker.fetch_seconds.series
+    # Still counted in the worker-wide latency
+    assert worker.fetch_seconds.merged().count == 3
+
+
+def test_retain_drops_games_no_longer_polled():
+    histogram = Histogram('latency_seconds', '', buckets=(0.1,))
+    for game_id in ('401', '402', '403'):
+        histogram.observe(0.05, game_id=game_id)
+    histogram.retain('game_id', {'402'})
+    assert list(histogram.series) == [(('game_id', '402'),)]
+
+
+def test_profile_request_validates_and_clamps_cycles():
+    profiler = CycleProfiler()
+    server = MetricsServer(MetricsRegistry(), '127.0.0.1', 0, profiler=profiler)
+
+    async def get(path):
+        port = server.server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        response = await reader.read()
+        writer.close()
+        return response.decode().split('\r\n', 1)[0]
+
+    async def run():
+        await server.start()
+        try:
+            return [await get(path) for path in (
+                '/profile?cycles=abc', '/profile?cycles=-1', '/profile?cycles=2', '/profile?cycles=1000000',
+            )]
+        finally:
+            await server.stop()
+
+    assert asyncio.run(run()) == [
+        'HTTP/1.1 400 Bad Request', 'HTTP/1.1 400 Bad Request', 'HTTP/1.1 202 Accepted', 'HTTP/1.1 202 Accepted',
+    ]
+    assert profiler.pending == CycleProfiler.MAX_PENDING
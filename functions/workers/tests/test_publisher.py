@@ -0,0 +1,153 @@
+import asyncio
+import json
+import time
+
+import fakeredis
+import httpx
+
+from delta_stream import MAX_DELIVERIES, DeltaStream, StreamConsumer, stream_key
+from live_worker import LiveGameWorker
+from publisher import RealtimePublisher
+
+UPDATE = {'player_id': 'p1', 'stats': {'passing_yards': 10}}
+
+
+def test_partial_batch_failure_retries_only_failed_entries():
+    published = []
+    failures = {'402': 1}
+
+    def appwrite(request):
+        games = json.loads(json.loads(request.content)['body'])['data']['games']
+        if any(failures.get(game['game_id']) for game in games):
+            for game in games:
+                failures[game['game_id']] = failures.get(game['game_id'], 0) - 1
+            return httpx.Response(503)
+        published.extend(games)
+        return httpx.Response(202)
+
+    async def run():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        worker = LiveGameWorker()
+        # One entry per Appwrite batch, so the three entries succeed or fail separately
+        worker.publisher = RealtimePublisher(
+            'https://appwrite.test/v1', 'project', 'key', flush_interval=0.01, max_batch_updates=1,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(appwrite))
+        )
+        await worker.publisher.start()
+        stream = DeltaStream(redis_client)
+        entry_ids = {game_id: await stream.append(game_id, [UPDATE], []) for game_id in ('401', '402', '403')}
+        consumer = StreamConsumer(redis_client, 'publisher', 'w1', worker.publish_entries, block_ms=10)
+
+        assert await consumer.poll_once() == 2
+        pending = await redis_client.xpending_range(stream_key(), 'publisher', min='-', max='+', count=10)
+        assert [item['message_id'] for item in pending] == [entry_ids['402']]
+
+        # The next poll re-reads the consumer's own pending entry and publishes it alone
+        assert await consumer.poll_once() == 1
+        assert await redis_client.xpending(stream_key(), 'publisher') == {
+            'pending': 0, 'min': None, 'max': None, 'consumers': []
+        }
+        await worker.publisher.stop()
+        return entry_ids
+
+    entry_ids = asyncio.run(run())
+    assert sorted(game['game_id'] for game in published) == ['401', '402', '403']
+    assert {game['game_id']: game['entry_ids'] for game in published} == {
+        game_id: [entry_id] for game_id, entry_id in entry_ids.items()
+    }
+
+
+def recording_publisher(posts, **options):
+    def appwrite(request):
+        posts.append(json.loads(json.loads(request.content)['body'])['data']['games'])
+        return httpx.Response(202)
+
+    return RealtimePublisher('https://appwrite.test/v1', 'project', 'key',
+                             http_client=httpx.AsyncClient(transport=httpx.MockTransport(appwrite)), **options)
+
+
+def test_batch_flushes_when_it_reaches_max_updates():
+    posts = []
+
+    async def run():
+        # A long window, so only the size limit can end a batch early
+        publisher = recording_publisher(posts, flush_interval=5.0, max_batch_updates=3)
+        await publisher.start()
+        for game_id in ('401', '402', '403'):
+            await publisher.publish(game_id, [UPDATE])
+        await asyncio.wait_for(publisher.flush(), timeout=1.0)
+        await publisher.stop()
+
+    asyncio.run(run())
+    assert [[game['game_id'] for game in games] for games in posts] == [['401', '402', '403']]
+
+
+def test_batch_flushes_after_the_interval_and_coalesces_games():
+    posts = []
+
+    async def run():
+        publisher = recording_publisher(posts, flush_interval=0.05, max_batch_updates=500)
+        await publisher.start()
+        started = time.perf_counter()
+        await publisher.publish('401', [UPDATE], [{'config_key': 'k1', 'league_ids': ['l1'], 'updates': [UPDATE]}])
+        await publisher.publish('401', [UPDATE], [{'config_key': 'k1', 'league_ids': ['l1'], 'updates': [UPDATE]}])
+        await publisher.publish('402', [UPDATE])
+        await asyncio.wait_for(publisher.flush(), timeout=1.0)
+        elapsed = time.perf_counter() - started
+        await publisher.stop()
+        return elapsed
+
+    elapsed = asyncio.run(run())
+    assert 0.05 <= elapsed < 0.5
+    assert len(posts) == 1
+    games = {game['game_id']: game for game in posts[0]}
+    assert len(games['401']['updates']) == 2 and len(games['402']['updates']) == 1
+    assert games['401']['groups'] == [{'config_key': 'k1', 'league_ids': ['l1'], 'updates': [UPDATE, UPDATE]}]
+
+
+def test_publish_waits_when_the_queue_is_full():
+    posts = []
+    release = asyncio.Event()
+
+    async def run():
+        publisher = recording_publisher(posts, flush_interval=0.0, max_batch_updates=1, max_queue_size=2)
+        blocked = publisher.http_client.post
+
+        async def slow_post(*args, **kwargs):
+            await release.wait()
+            return await blocked(*args, **kwargs)
+
+        publisher.http_client.post = slow_post
+        await publisher.start()
+        # The sender holds one item in flight; two more fill the queue
+        for game_id in ('401', '402', '403'):
+            await asyncio.wait_for(publisher.publish(game_id, [UPDATE]), timeout=0.5)
+        assert publisher.queue.full()
+        waiting = asyncio.create_task(publisher.publish('404', [UPDATE]))
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+
+        release.set()
+        await asyncio.wait_for(waiting, timeout=0.5)
+        await publisher.stop()
+
+    asyncio.run(run())
+    assert [games[0]['game_id'] for games in posts] == ['401', '402', '403', '404']
+
+
+def test_entry_failing_every_poll_is_dropped_after_max_deliveries():
+    async def always_fails(batch):
+        return [entry_id for entry_id, _ in batch]
+
+    async def run():
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        await DeltaStream(redis_client).append('401', [UPDATE], [])
+        consumer = StreamConsumer(redis_client, 'publisher', 'w1', always_fails, block_ms=10)
+        polls = 0
+        while True:
+            await consumer.poll_once()
+            polls += 1
+            if not (await redis_client.xpending(stream_key(), 'publisher'))['pending'] or polls > 10:
+                return polls
+
+    assert asyncio.run(run()) == MAX_DELIVERIES + 1
@@ -0,0 +1,110 @@
+import asyncio
+from datetime import date, datetime, timezone
+
+import httpx
+
+import schedule
+from schedule import ScheduleCache, next_refresh_deadline
+
+CALENDARS = {
+    '2024': [
+        {'week': 1, 'seasonType': 'regular', 'firstGameStart': '2024-08-31T16:00:00.000Z',
+         'lastGameStart': '2024-09-02T23:30:00.000Z'},
+        {'week': 1, 'seasonType': 'postseason', 'firstGameStart': '2024-12-14T17:00:00.000Z',
+         'lastGameStart': '2025-01-20T23:30:00.000Z'},
+    ],
+    '2025': [],
+}
+GAMES = {
+    ('2024', '1', 'regular'): [
+        {'id': 1, 'start_date': '2024-08-31T16:00:00.000Z', 'home_conference': 'SEC', 'away_conference': 'SEC'},
+        {'id': 2, 'start_date': '2024-08-31T19:30:00.000Z', 'home_conference': 'Big Ten', 'away_conference': 'MAC'},
+        {'id': 3, 'start_date': '2024-09-01T00:00:00.000Z', 'home_conference': 'ACC', 'away_conference': 'SEC'},
+        {'id': 4, 'start_date': '2024-08-31T20:00:00.000Z', 'home_conference': 'MWC', 'away_conference': 'MAC'},
+    ],
+    ('2024', '1', 'postseason'): [
+        {'id': 9, 'start_date': '2025-01-01T21:00:00.000Z', 'home_conference': 'SEC', 'away_conference': 'Big 12'},
+    ],
+}
+
+
+def make_cache(requests, cache_dir=None, fail=False, **ttls):
+    def cfbd(request):
+        requests.append(request.url.path)
+        if fail:
+            return httpx.Response(503)
+        params = request.url.params
+        if request.url.path == '/calendar':
+            return httpx.Response(200, json=CALENDARS[params['year']])
+        return httpx.Response(200, json=GAMES[(params['year'], params['week'], params['seasonType'])])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(cfbd))
+    return ScheduleCache(client, 'key', str(cache_dir) if cache_dir else None, **ttls)
+
+
+def game_ids(games):
+    return sorted(game['id'] for game in games)
+
+
+def test_day_lookup_filters_by_conference_and_dedupes():
+    cache = make_cache([])
+
+    async def run():
+        return (await cache.games_on(date(2024, 8, 31), ['SEC', 'Big Ten', 'ACC']),
+                await cache.games_on(date(2024, 9, 1), ['SEC']),
+                await cache.games_on(date(2024, 9, 5), ['SEC']))
+
+    saturday, sunday, off_week = asyncio.run(run())
+    # Game 1 is SEC on both sides but listed once; game 4 has no target conference
+    assert game_ids(saturday) == [1, 2]
+    assert game_ids(sunday) == [3]
+    assert off_week == []
+
+
+def test_january_bowls_come_from_the_previous_season():
+    cache = make_cache([])
+    assert game_ids(asyncio.run(cache.games_on(date(2025, 1, 1), ['SEC']))) == [9]
+
+
+def test_weeks_expire_before_the_calendar(monkeypatch):
+    requests = []
+    now = [1_000_000.0]
+    monkeypatch.setattr(schedule.time, 'time', lambda: now[0])
+    cache = make_cache(requests, calendar_ttl=86400, games_ttl=3600)
+
+    async def run():
+        await cache.games_on(date(2024, 8, 31), ['SEC'])
+        await cache.games_on(date(2024, 9, 1), ['SEC'])
+        assert requests == ['/calendar', '/games']
+        now[0] += 3601
+        await cache.games_on(date(2024, 8, 31), ['SEC'])
+        assert requests == ['/calendar', '/games', '/games']
+        now[0] += 86400
+        await cache.games_on(date(2024, 8, 31), ['SEC'])
+        assert requests == ['/calendar', '/games', '/games', '/calendar', '/games']
+
+    asyncio.run(run())
+
+
+def test_disk_copy_is_reused_and_kept_when_cfbd_fails(tmp_path, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(schedule.time, 'time', lambda: now[0])
+    asyncio.run(make_cache([], tmp_path).games_on(date(2024, 8, 31), ['SEC']))
+
+    # A restarted worker reads the fresh disk copy without calling CFBD
+    requests = []
+    assert game_ids(asyncio.run(make_cache(requests, tmp_path).games_on(date(2024, 8, 31), ['SEC']))) == [1]
+    assert requests == []
+
+    # Past every TTL with CFBD down: the stale copy still answers
+    now[0] += 30 * 86400
+    requests = []
+    games = asyncio.run(make_cache(requests, tmp_path, fail=True).games_on(date(2024, 8, 31), ['SEC']))
+    assert game_ids(games) == [1]
+    assert requests == ['/calendar', '/games']
+
+
+def test_next_refresh_deadline_stops_at_utc_midnight():
+    evening = datetime(2024, 8, 31, 23, 30, tzinfo=timezone.utc).timestamp()
+    assert next_refresh_deadline(evening, 3600) == datetime(2024, 9, 1, tzinfo=timezone.utc).timestamp()
+    assert next_refresh_deadline(evening - 7200, 3600) == evening - 3600
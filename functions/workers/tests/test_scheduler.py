@@ -0,0 +1,91 @@
+import pytest
+
+from scheduler import PREGAME_LEAD_SECONDS, POLL_INTERVALS, GameState, PollScheduler, classify_game_state
+
+
+def summary(state='in', name='STATUS_IN_PROGRESS', period=2, clock=450.0, red_zone=False, completed=False):
+    return {
+        'header': {'competitions': [{'status': {
+            'period': period, 'clock': clock,
+            'type': {'state': state, 'name': name, 'completed': completed},
+        }}]},
+        'situation': {'isRedZone': red_zone},
+    }
+
+
+@pytest.mark.parametrize('boxscore, state', [
+    (summary('pre', 'STATUS_SCHEDULED', period=0), GameState.PREGAME),
+    (summary(), GameState.LIVE),
+    (summary(red_zone=True), GameState.CRITICAL),
+    (summary(period=4, clock=240.0), GameState.CRITICAL),
+    (summary(period=5), GameState.CRITICAL),
+    (summary(name='STATUS_HALFTIME'), GameState.HALFTIME),
+    (summary('post', 'STATUS_FINAL', completed=True), GameState.FINAL),
+])
+def test_classify_game_state(boxscore, state):
+    assert classify_game_state(boxscore) == state
+
+
+@pytest.mark.parametrize('state', [GameState.LIVE, GameState.CRITICAL, GameState.HALFTIME])
+def test_interval_follows_state(state):
+    scheduler = PollScheduler()
+    scheduler.add('401', now=0.0)
+    scheduler.reschedule('401', state, now=100.0)
+    assert scheduler.metrics(now=100.0)['games']['401']['interval'] == POLL_INTERVALS[state]
+    assert scheduler.next_due() == 100.0 + POLL_INTERVALS[state]
+
+
+def test_pregame_waits_for_kickoff_lead():
+    scheduler = PollScheduler()
+    kickoff = 10_000.0
+    scheduler.add('401', kickoff=kickoff, now=0.0)
+    assert scheduler.next_due() == kickoff - PREGAME_LEAD_SECONDS
+    assert scheduler.pop_due(now=kickoff - PREGAME_LEAD_SECONDS - 1) == []
+    assert scheduler.pop_due(now=kickoff - PREGAME_LEAD_SECONDS) == ['401']
+    # Still pregame inside the lead: the regular pregame interval
+    scheduler.reschedule('401', GameState.PREGAME, now=kickoff - 300)
+    assert scheduler.next_due() == kickoff - 300 + POLL_INTERVALS[GameState.PREGAME]
+
+
+def test_pop_due_in_due_order_and_skips_stale_entries():
+    scheduler = PollScheduler()
+    for game_id, kickoff in (('c', 3000.0), ('a', 1000.0), ('b', 2000.0)):
+        scheduler.add(game_id, kickoff=kickoff + PREGAME_LEAD_SECONDS, now=0.0)
+    assert scheduler.pop_due(now=2500.0) == ['a', 'b']
+    # Rescheduling leaves the old heap entry behind; it must not fire
+    scheduler.reschedule('a', GameState.LIVE, now=2500.0)
+    scheduler.reschedule('a', GameState.HALFTIME, now=2500.0)
+    assert scheduler.pop_due(now=2500.0 + POLL_INTERVALS[GameState.LIVE]) == []
+    # a is due at 2560 under the halftime interval, c at 3000
+    assert scheduler.pop_due(now=3000.0) == ['a', 'c']
+
+
+def test_reschedule_keeps_state_on_no_news_and_respects_not_before():
+    scheduler = PollScheduler()
+    scheduler.add('401', now=0.0)
+    scheduler.reschedule('401', GameState.CRITICAL, now=10.0)
+    scheduler.reschedule('401', None, now=20.0)
+    assert scheduler.metrics(now=20.0)['games']['401']['state'] == 'critical'
+    scheduler.reschedule('401', None, not_before=500.0, now=30.0)
+    assert scheduler.next_due() == 500.0
+    assert scheduler.metrics(now=30.0)['games']['401']['polls'] == 3
+
+
+def test_final_games_leave_the_schedule_for_good():
+    scheduler = PollScheduler()
+    scheduler.add('401', now=0.0)
+    scheduler.reschedule('401', GameState.FINAL, now=60.0)
+    assert '401' not in scheduler
+    assert scheduler.next_due() is None
+    scheduler.sync({'401': None}, now=120.0)
+    assert '401' not in scheduler
+    metrics = scheduler.metrics(now=120.0)
+    assert (metrics['finished'], metrics['polls'], metrics['baseline_polls']) == (1, 1, 4)
+
+
+def test_sync_drops_games_off_the_slate():
+    scheduler = PollScheduler()
+    scheduler.sync({'401': None, '402': None}, now=0.0)
+    scheduler.sync({'402': None}, now=30.0)
+    assert '401' not in scheduler and '402' in scheduler
+    assert scheduler.pop_due(now=30.0) == ['402']
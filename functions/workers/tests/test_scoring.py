@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+from scoring import (
+    DEFAULT_SCORING_CONFIG,
+    SCORING_PRESETS,
+    THRESHOLD_STATS,
+    ScoringEngine,
+    ScoringSystem,
+    calc_points,
+    compile_scoring_plan,
+    config_from_league_rules,
+    unknown_rule_keys,
+)
+
+BONUS_CONFIG = {
+    **DEFAULT_SCORING_CONFIG,
+    "passing_300_yard_bonus": 2.0,
+    "rushing_100_yard_bonus": 3.0,
+    "receiving_100_yard_bonus": 3.0,
+}
+
+
+def random_line(rng: random.Random):
+    stats = {}
+    for stat in ("passing_yards", "rushing_yards", "receiving_yards", "receiving_tds", "def_sacks"):
+        if rng.random() < 0.5:
+            stats[stat] = rng.choice((0, rng.randint(0, 450)))
+    for stat in ("def_points_allowed", "def_yards_allowed"):
+        if rng.random() < 0.4:
+            stats[stat] = rng.choice((0, 0, rng.randint(0, 520)))
+    return stats
+
+
+def stat_deltas(previous, current):
+    deltas = {
+        stat: value - previous.get(stat, 0)
+        for stat, value in current.items() if value != previous.get(stat, 0)
+    }
+    deltas.update({stat: -value for stat, value in previous.items() if stat not in current and value})
+    return deltas
+
+
+def test_score_delta_matches_rescoring():
+    rng = random.Random(8)
+    plans = [compile_scoring_plan(config) for config in (DEFAULT_SCORING_CONFIG, BONUS_CONFIG)]
+    for _ in range(20000):
+        previous, current = random_line(rng), random_line(rng)
+        for plan in plans:
+            delta = plan.score_delta(previous, current, stat_deltas(previous, current))
+            assert round(plan.score(previous) + delta, 2) == plan.score(current), (previous, current)
+
+
+def test_threshold_stat_appearing_at_zero_scores():
+    plan = compile_scoring_plan()
+    # No value delta, but the shutout bucket now applies
+    assert plan.score_delta({"def_sacks": 1}, {"def_sacks": 1, "def_points_allowed": 0}, {}) == 10.0
+    assert plan.score_delta({"def_points_allowed": 0}, {}, {}) == -10.0
+    assert "def_points_allowed" in THRESHOLD_STATS
+
+
+def test_engine_matches_calc_points_for_presets():
+    engine = ScoringEngine()
+    for name, config in SCORING_PRESETS.items():
+        if config:
+            engine.register(name, config)
+    rng = random.Random(3)
+    for _ in range(500):
+        stats = random_line(rng)
+        scores = engine.score(stats)
+        for name in engine.league_plans:
+            assert scores[engine.league_plans[name]] == calc_points(stats, SCORING_PRESETS[name])
+
+
+# FANTASY_SCORING_JSON as the original worker documented it
+LEGACY_WORKER_RULES = {
+    'passing_yards': 0.04, 'passing_tds': 4, 'interceptions': -2, 'rushing_yards': 0.1,
+    'rushing_tds': 6, 'receiving_yards': 0.1, 'receiving_tds': 6, 'fumbles_lost': -2,
+    'two_point_conversions': 2, 'pat_made': 1, 'fg_made_0_39': 3, 'fg_made_40_49': 4,
+    'fg_made_50_plus': 5,
+}
+
+
+def test_legacy_worker_rules_keep_scoring():
+    config = config_from_league_rules({**LEGACY_WORKER_RULES, 'interceptions': -3, 'fumbles_lost': -1,
+                                       'fg_made_0_39': 2.5})
+    assert unknown_rule_keys(LEGACY_WORKER_RULES) == []
+    assert config['passing_ints'] == -3
+    assert config['rushing_fumbles_lost'] == config['receiving_fumbles_lost'] == -1
+    assert config['fg_made_20_29'] == config['fg_made_30_39'] == 2.5
+    assert calc_points({'passing_ints': 1, 'rushing_fumbles_lost': 1}, config) == -4.0
+
+
+def test_worker_warns_about_rules_that_score_nothing(monkeypatch, caplog):
+    import live_worker
+
+    monkeypatch.setattr(live_worker, 'SCORING_RULES', {**LEGACY_WORKER_RULES, 'sacks_taken': -1})
+    with caplog.at_level('WARNING', logger='live_worker'):
+        live_worker.LiveGameWorker()
+    assert 'sacks_taken' in caplog.text
+    assert unknown_rule_keys({'sacks_taken': -1, 'note': 'x'}) == ['sacks_taken']
+
+
+def test_scoring_system_config_cannot_go_stale():
+    system = ScoringSystem('standard')
+    with pytest.raises(TypeError):
+        system.config['passing_tds'] = 6.0
+
+    config = system.get_config()
+    system.config = config
+    config['passing_tds'] = 6.0
+    assert system.calculate({'passing_tds': 1}) == calc_points({'passing_tds': 1}, system.get_config())
+
+    system.customize({'passing_tds': 6.0})
+    assert system.calculate({'passing_tds': 1}) == 6.0
+    assert system.cache_key == compile_scoring_plan(config).key
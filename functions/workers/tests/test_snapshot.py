@@ -0,0 +1,89 @@
+import asyncio
+import json
+import struct
+
+from replay import SyntheticGame
+from snapshot import SnapshotCache, decode_snapshot, encode_snapshot
+from test_live_worker import make_worker
+
+STATS = {'passing_yards': 212, 'passing_tds': 2, 'rushing_yards': 14}
+
+
+def test_round_trip_with_more_than_255_plans():
+    points = {f"{n:016x}": n * 0.5 for n in range(300)}
+    assert decode_snapshot(encode_snapshot(STATS, points)) == (STATS, points)
+
+
+def test_version_1_snapshots_still_decode():
+    # version 1, one plan, present bits for passing_tds (5) and passing_yards (6)
+    raw = (struct.pack('<BBI', 1, 1, 0b1100000) + struct.pack('<2i', 2, 212)
+           + struct.pack('<8sd', bytes.fromhex('00000000000000aa'), 16.5))
+    assert decode_snapshot(raw) == ({'passing_tds': 2, 'passing_yards': 212}, {'00000000000000aa': 16.5})
+
+
+def test_worker_stores_snapshots_for_300_scoring_plans():
+    game = SyntheticGame('401', polls=10, change_rate=1.0, seed=3)
+    worker = make_worker(b'')
+    for n in range(300):
+        worker.scoring_engine.register(f"league{n}", {'passing_yards': 0.04 + n / 10000})
+
+    async def run():
+        deltas = []
+        for _ in range(3):
+            stats = worker.extract_player_stats(json.loads(game.payload()))
+            deltas = await worker.update_player_deltas('401', stats)
+        return deltas
+
+    deltas = asyncio.run(run())
+    assert deltas
+    assert all(len(delta['points']) == len(worker.scoring_engine.plans) > 255 for delta in deltas)
+
+
+def snapshots(n: int, size: int = 100):
+    return [(f"p{i}", bytes(size)) for i in range(n)]
+
+
+def test_cache_counts_hits_and_misses():
+    cache = SnapshotCache(max_bytes=1 << 20)
+    assert cache.get('401', ['p0']) is None
+    cache.put('401', snapshots(2))
+    assert cache.get('401', ['p1', 'p0', 'p9']) == [bytes(100), bytes(100), None]
+    assert cache.lookups.get(result='miss') == 1
+    assert cache.lookups.get(result='hit') == 1
+
+
+def test_cache_evicts_least_recently_used_game_over_budget():
+    per_game = sum(SnapshotCache._cost(player_id, snapshot) for player_id, snapshot in snapshots(3))
+    cache = SnapshotCache(max_bytes=2 * per_game)
+    cache.put('401', snapshots(3))
+    cache.put('402', snapshots(3))
+    cache.get('401', ['p0'])
+    cache.put('403', snapshots(3))
+
+    assert list(cache.games) == ['401', '403']
+    assert cache.bytes == cache.size_bytes.get() == 2 * per_game
+    assert cache.evictions.get(reason='budget') == 1
+
+    # Rewriting a player replaces its cost rather than adding to it
+    cache.put('403', [('p0', bytes(100))])
+    assert cache.bytes == 2 * per_game
+
+    # The game just written is kept even if it alone is over budget
+    cache.put('404', snapshots(9))
+    assert list(cache.games) == ['404']
+    assert cache.evictions.get(reason='budget') == 3
+
+
+def test_cache_retain_and_evict_release_bytes():
+    cache = SnapshotCache(max_bytes=1 << 20)
+    for game_id in ('401', '402', '403'):
+        cache.put(game_id, snapshots(2))
+    cache.retain(['402', '403', '999'])
+    cache.evict('403')
+    cache.evict('403')
+
+    assert list(cache.games) == ['402']
+    assert cache.bytes == cache.size_bytes.get() == cache.game_bytes['402']
+    assert cache.evictions.get(reason='unscheduled') == 1
+    assert cache.evictions.get(reason='final') == 1
+    assert cache.get('401', ['p0']) is None
@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from upstream import CircuitBreaker, CircuitOpenError, GuardedTransport, HostPolicy, TokenBucket
+
+HOST = 'site.api.espn.com'
+
+
+def guarded(handler, **policy) -> httpx.AsyncClient:
+    transport = GuardedTransport(httpx.MockTransport(handler), {HOST: HostPolicy(**policy)})
+    return httpx.AsyncClient(transport=transport)
+
+
+def test_pause_is_capped():
+    bucket = TokenBucket(rate=10.0, burst=5, max_pause=60.0)
+    bucket.pause(86400)
+    assert 59.0 < bucket.paused_for() <= 60.0
+
+
+def test_breaker_retry_after_is_capped():
+    breaker = CircuitBreaker(HostPolicy(min_requests=1, max_open_seconds=120.0))
+    breaker.record(False, retry_after=86400, now=1000.0)
+    assert breaker.retry_at == 1120.0
+
+
+def test_retry_after_fails_fast_instead_of_sleeping():
+    responses = [httpx.Response(429, headers={'retry-after': '86400'})]
+
+    def handler(request):
+        return responses.pop(0) if responses else httpx.Response(200)
+
+    async def run():
+        client = guarded(handler, max_open_seconds=90.0)
+        url = f"https://{HOST}/summary"
+        assert (await client.get(url)).status_code == 429
+        started = time.monotonic()
+        with pytest.raises(CircuitOpenError) as raised:
+            await asyncio.wait_for(client.get(url), timeout=1.0)
+        assert time.monotonic() - started < 0.5
+        return raised.value
+
+    error = asyncio.run(run())
+    assert error.host == HOST
+    assert error.retry_at <= time.time() + 90.0
+
+
+def test_request_queued_behind_a_pause_fails_fast():
+    async def run():
+        transport = GuardedTransport(httpx.MockTransport(lambda request: httpx.Response(200)),
+                                     {HOST: HostPolicy(rate=5.0, burst=1)})
+        client = httpx.AsyncClient(transport=transport)
+        url = f"https://{HOST}/summary"
+        await client.get(url)
+        # Waiting ~0.2s for a token when the host gets paused
+        queued = asyncio.create_task(client.get(url))
+        await asyncio.sleep(0.05)
+        transport.buckets[HOST].pause(600)
+        with pytest.raises(CircuitOpenError):
+            await asyncio.wait_for(queued, timeout=1.0)
+
+    asyncio.run(run())
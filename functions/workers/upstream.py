@@ -0,0 +1,275 @@
+"""
+Shared rate limiting and circuit breaking for upstream APIs
+
+GuardedTransport wraps the worker's httpx transport so every request to a
+host (ESPN summaries and scoreboards, CFBD) goes through that host's token
+bucket and circuit breaker, whichever code path sent it. Throttling
+responses (403/429/5xx) and transport errors count against the breaker;
+a Retry-After header (capped at the host's max_open_seconds) pauses the
+whole host, not just the request that saw it. While a breaker is open or
+the host is paused, requests fail fast with CircuitOpenError rather than
+sleeping while the caller holds a poll slot; open breakers stay that way
+until a half-open probe gets through.
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from typing import Deque, Dict, Optional, Tuple
+
+import httpx
+
+from metrics import MetricsRegistry
+
+# Responses that mean "slow down" rather than "no such thing"
+THROTTLE_STATUSES = {403, 429}
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    rate: float = 10.0              # sustained requests per second
+    burst: int = 20                 # bucket size
+    window_seconds: float = 30.0    # error-rate window
+    min_requests: int = 20          # don't judge the error rate on less
+    error_threshold: float = 0.5    # open above this share of failures
+    open_seconds: float = 15.0      # first open period, doubled per failed probe
+    max_open_seconds: float = 300.0
+
+
+DEFAULT_POLICIES: Dict[str, HostPolicy] = {
+    'site.api.espn.com': HostPolicy(rate=10.0, burst=20),
+    'api.collegefootballdata.com': HostPolicy(rate=2.0, burst=5, min_requests=5),
+}
+
+# Circuit states as exported in the gauge
+CLOSED, HALF_OPEN, OPEN = 0, 1, 2
+
+
+def load_policies(overrides_json: Optional[str]) -> Dict[str, HostPolicy]:
+    """Defaults plus per-host overrides, e.g. '{"site.api.espn.com": {"rate": 5}}'"""
+    policies = dict(DEFAULT_POLICIES)
+    for host, fields in json.loads(overrides_json or '{}').items():
+        policies[host] = replace(policies.get(host, HostPolicy()), **fields)
+    return policies
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(when - (time.time() if now is None else now), 0.0)
+
+
+def backoff_delay(attempt: int, base: float, cap: float, retry_after: Optional[float] = None) -> float:
+    """Full-jitter exponential backoff, never shorter than the server asked for"""
+    delay = random.uniform(0, min(cap, base * 2 ** attempt))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, cap))
+    return delay
+
+
+def is_failure(status_code: int) -> bool:
+    return status_code in THROTTLE_STATUSES or status_code >= 500
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending while a host's breaker is open"""
+
+    def __init__(self, host: str, retry_at: float):
+        super().__init__(f"Circuit open for {host}")
+        self.host = host
+        self.retry_at = retry_at
+
+
+class TokenBucket:
+    """Async token bucket; a pause (Retry-After, at most max_pause) covers every caller"""
+
+    def __init__(self, rate: float, burst: int, max_pause: float = float('inf')):
+        self.rate = rate
+        self.burst = burst
+        self.max_pause = max_pause
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> float:
+        """Take a token, waiting for the refill; returns the time waited
+
+        Pauses are not waited out here: check paused_for before and after.
+        """
+        started = time.monotonic()
+        # The lock queues callers so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return time.monotonic() - started
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        self.paused_until = max(self.paused_until, time.monotonic() + min(seconds, self.max_pause))
+
+    def paused_for(self) -> float:
+        """Seconds left on the current pause (0 when not paused)"""
+        return max(self.paused_until - time.monotonic(), 0.0)
+
+
+class CircuitBreaker:
+    """Closed -> open on error rate, open -> half-open after a cool-off, one probe at a time"""
+
+    def __init__(self, policy: HostPolicy):
+        self.policy = policy
+        self.state = CLOSED
+        self.outcomes: Deque[Tuple[float, bool]] = deque()
+        self.failures = 0
+        self.open_seconds = policy.open_seconds
+        self.retry_at = 0.0
+        self.probing = False
+
+    def allow(self, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        if self.state == OPEN and now >= self.retry_at:
+            self.state = HALF_OPEN
+            self.probing = False
+        if self.state == HALF_OPEN:
+            if self.probing:
+                return False
+            self.probing = True
+            return True
+        return self.state == CLOSED
+
+    def record(self, ok: bool, retry_after: Optional[float] = None, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        if self.state == HALF_OPEN:
+            self.probing = False
+            if ok:
+                self.state = CLOSED
+                self.outcomes.clear()
+                self.failures = 0
+                self.open_seconds = self.policy.open_seconds
+            else:
+                self.open_seconds = min(self.open_seconds * 2, self.policy.max_open_seconds)
+                self._open(now, retry_after)
+            return
+
+        self.outcomes.append((now, ok))
+        self.failures += not ok
+        horizon = now - self.policy.window_seconds
+        while self.outcomes and self.outcomes[0][0] < horizon:
+            _, old_ok = self.outcomes.popleft()
+            self.failures -= not old_ok
+
+        total = len(self.outcomes)
+        if (self.state == CLOSED and total >= self.policy.min_requests
+                and self.failures / total >= self.policy.error_threshold):
+            self._open(now, retry_after)
+
+    def _open(self, now: float, retry_after: Optional[float]) -> None:
+        self.state = OPEN
+        retry_after = min(retry_after or 0.0, self.policy.max_open_seconds)
+        self.retry_at = now + max(self.open_seconds, retry_after)
+
+
+class GuardedTransport(httpx.AsyncBaseTransport):
+    """Per-host token bucket and circuit breaker in front of another transport"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport,
+                 policies: Optional[Dict[str, HostPolicy]] = None,
+                 metrics: Optional[MetricsRegistry] = None):
+        self.transport = transport
+        self.policies = DEFAULT_POLICIES if policies is None else policies
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        for host, policy in self.policies.items():
+            self.buckets[host] = TokenBucket(policy.rate, policy.burst, policy.max_open_seconds)
+            self.breakers[host] = CircuitBreaker(policy)
+
+        metrics = metrics or MetricsRegistry()
+        self.circuit_state = metrics.gauge(
+            'live_worker_circuit_state', 'Upstream circuit breaker state (0 closed, 1 half-open, 2 open)'
+        )
+        self.rejected = metrics.counter(
+            'live_worker_upstream_rejected_total', 'Requests failed fast by an open circuit'
+        )
+        self.limiter_wait_seconds = metrics.histogram(
+            'live_worker_rate_limit_wait_seconds', 'Time requests waited for a rate-limit token'
+        )
+        for host in self.policies:
+            self.circuit_state.set(CLOSED, host=host)
+
+    def breaker_for(self, host: str) -> Optional[CircuitBreaker]:
+        return self.breakers.get(host)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            return await self.transport.handle_async_request(request)
+
+        bucket = self.buckets[host]
+        # A Retry-After pause fails fast like an open circuit, so callers
+        # holding a poll slot never sleep it out
+        self._check_paused(host, bucket)
+        if not breaker.allow():
+            self.rejected.inc(host=host)
+            raise CircuitOpenError(host, breaker.retry_at)
+        self.circuit_state.set(breaker.state, host=host)
+        try:
+            self.limiter_wait_seconds.observe(await bucket.acquire(), host=host)
+            # Paused or tripped while we waited for a token
+            self._check_paused(host, bucket)
+        except BaseException:
+            breaker.probing = False
+            raise
+        if breaker.state == OPEN:
+            self.rejected.inc(host=host)
+            raise CircuitOpenError(host, breaker.retry_at)
+
+        try:
+            response = await self.transport.handle_async_request(request)
+        except httpx.TransportError:
+            breaker.record(False)
+            self.circuit_state.set(breaker.state, host=host)
+            raise
+        except BaseException:
+            # Cancelled mid-probe: let the next request probe instead
+            breaker.probing = False
+            raise
+
+        ok = not is_failure(response.status_code)
+        retry_after = None
+        if not ok:
+            retry_after = parse_retry_after(response.headers.get('retry-after'))
+            if retry_after:
+                self.buckets[host].pause(retry_after)
+        breaker.record(ok, retry_after)
+        self.circuit_state.set(breaker.state, host=host)
+        return response
+
+    def _check_paused(self, host: str, bucket: TokenBucket) -> None:
+        remaining = bucket.paused_for()
+        if remaining > 0:
+            self.rejected.inc(host=host)
+            raise CircuitOpenError(host, time.time() + remaining)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()